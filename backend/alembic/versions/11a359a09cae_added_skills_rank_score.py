@@ -0,0 +1,67 @@
+"""Added skills rank score
+
+Revision ID: 11a359a09cae
+Revises: 3d1f5e0c7b42
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '11a359a09cae'
+down_revision: Union[str, Sequence[str], None] = '3d1f5e0c7b42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("skills", sa.Column("rank_score", sa.Float(), nullable=True))
+    # backfill with the weights of app.services.skills.refresh_skill_ranks
+    op.execute(
+        """
+        UPDATE skills SET rank_score = scores.score
+        FROM (
+            SELECT skills.id,
+                   coalesce(skills.proficiency, 0) * 2.0
+                   + coalesce(skills.years, 0) * 1.0
+                   + count(names.name) * 1.5 AS score
+            FROM skills
+            LEFT OUTER JOIN (
+                SELECT profile_id, unnest(skills) AS name FROM projects
+                UNION ALL
+                SELECT profile_id, unnest(skills) AS name FROM experiences
+                UNION ALL
+                SELECT profile_id, unnest(skills) AS name FROM portfolio_items
+            ) AS names
+                ON names.profile_id = skills.profile_id
+                AND lower(names.name) = lower(skills.name)
+            GROUP BY skills.id
+        ) AS scores
+        WHERE skills.id = scores.id
+        """
+    )
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_skills_profile_id_rank",
+            "skills",
+            ["profile_id", sa.text("rank_score DESC NULLS LAST"), "id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_skills_profile_id_rank",
+            table_name="skills",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.drop_column("skills", "rank_score")
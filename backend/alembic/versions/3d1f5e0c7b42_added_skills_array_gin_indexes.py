@@ -0,0 +1,46 @@
+"""Added skills array GIN indexes
+
+Revision ID: 3d1f5e0c7b42
+Revises: a28a07300941
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3d1f5e0c7b42'
+down_revision: Union[str, Sequence[str], None] = 'a28a07300941'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# tables whose skills ARRAY column is filtered with @> / && by the list routes
+TABLES = ["projects", "experiences", "portfolio_items"]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        for table in TABLES:
+            op.create_index(
+                f"ix_{table}_skills_gin",
+                table,
+                ["skills"],
+                postgresql_using="gin",
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for table in reversed(TABLES):
+            op.drop_index(
+                f"ix_{table}_skills_gin",
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
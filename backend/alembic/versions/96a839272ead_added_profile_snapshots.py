@@ -0,0 +1,44 @@
+"""Added profile snapshots
+
+Revision ID: 96a839272ead
+Revises: ea4447efdfc3
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '96a839272ead'
+down_revision: Union[str, Sequence[str], None] = 'ea4447efdfc3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Materialized profile documents; populate existing profiles with
+    # `python -m app.services.snapshots rebuild`
+    op.create_table(
+        "profile_snapshots",
+        sa.Column("profile_id", sa.Integer(), nullable=False),
+        sa.Column("version", sa.Integer(), nullable=False),
+        sa.Column("document", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["profile_id"], ["profile.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("profile_id"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("profile_snapshots")
@@ -0,0 +1,45 @@
+"""Added skills name trigram index
+
+Revision ID: a28a07300941
+Revises: b8c38c9be322
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a28a07300941'
+down_revision: Union[str, Sequence[str], None] = 'b8c38c9be322'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # pg_trgm is a trusted extension, so the database owner can create it
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_skills_name_trgm",
+            "skills",
+            ["name"],
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # the extension is left installed; other objects may depend on it
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_skills_name_trgm",
+            table_name="skills",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,62 @@
+"""Added profile_id indexes
+
+Revision ID: b8c38c9be322
+Revises: 96a839272ead
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8c38c9be322'
+down_revision: Union[str, Sequence[str], None] = '96a839272ead'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Child tables of profile. Postgres does not index foreign keys, so profile
+# assembly and ?profile_id= list filters were sequential scans. A composite
+# (profile_id, id) index serves both the plain profile_id lookups (leading
+# column) and id-ordered pagination within a profile, so no separate
+# single-column index is created.
+CHILD_TABLES = [
+    "projects",
+    "experiences",
+    "educations",
+    "certifications",
+    "awards",
+    "publications",
+    "contacts",
+    "social_links",
+    "portfolio_items",
+    "references",
+    "skills",
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        for table in CHILD_TABLES:
+            op.create_index(
+                f"ix_{table}_profile_id_id",
+                table,
+                ["profile_id", "id"],
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for table in reversed(CHILD_TABLES):
+            op.drop_index(
+                f"ix_{table}_profile_id_id",
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,33 @@
+"""Added profile version
+
+Revision ID: ea4447efdfc3
+Revises: 5910e7854713
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'ea4447efdfc3'
+down_revision: Union[str, Sequence[str], None] = '5910e7854713'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Bumped by every write to the profile or one of its child rows; used for
+    # cache keys and ETags
+    op.add_column(
+        "profile",
+        sa.Column("version", sa.Integer(), server_default=sa.text("1"), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("profile", "version")
@@ -0,0 +1,162 @@
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, List, Sequence, Tuple, Type
+
+from fastapi import HTTPException
+from pydantic import BaseModel, ValidationError, create_model
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.services import profile as profile_service
+
+BULK_MAX_ITEMS = 1000
+
+
+def _item_errors(exc: ValidationError) -> List[dict]:
+    return exc.errors(include_url=False, include_context=False, include_input=False)
+
+
+def _error(field: str, msg: str, type: str = "not_found") -> List[dict]:
+    return [{"type": type, "loc": (field,), "msg": msg}]
+
+
+def _report(errors: Dict[int, List[dict]]) -> List[dict]:
+    return [{"index": index, "errors": errors[index]} for index in sorted(errors)]
+
+
+@lru_cache(maxsize=None)
+def patch_schema(schema: Type[BaseModel]) -> Type[BaseModel]:
+    """``schema`` with every field optional plus the required target ``id``."""
+    fields = {
+        name: (field.annotation, None) for name, field in schema.model_fields.items()
+    }
+    return create_model(f"{schema.__name__}Patch", id=(int, ...), **fields)
+
+
+def _validate(
+    schema: Type[BaseModel],
+    items: List[Dict[str, Any]],
+    errors: Dict[int, List[dict]],
+    exclude_unset: bool = False,
+) -> List[Tuple[int, dict]]:
+    rows = []
+    for index, item in enumerate(items):
+        try:
+            validated = schema.model_validate(item)
+        except ValidationError as exc:
+            errors[index] = _item_errors(exc)
+        else:
+            rows.append((index, validated.model_dump(exclude_unset=exclude_unset)))
+    return rows
+
+
+async def _check_profiles(
+    rows: List[Tuple[int, dict]],
+    errors: Dict[int, List[dict]],
+    session: AsyncSession,
+) -> List[Tuple[int, dict]]:
+    # report rows pointing at a missing profile instead of failing the batch
+    profile_ids = {row.get("profile_id") for _, row in rows} - {None}
+    if not profile_ids:
+        return rows
+    missing = profile_ids - await profile_service.existing_profile_ids(
+        profile_ids, session
+    )
+    for index, row in rows:
+        if row.get("profile_id") in missing:
+            errors[index] = _error("profile_id", "Profile not found")
+    return [(index, row) for index, row in rows if index not in errors]
+
+
+async def bulk_create(
+    schema: Type[BaseModel],
+    items: List[Dict[str, Any]],
+    create: Callable[[List[dict], AsyncSession], Awaitable[List[Any]]],
+    session: AsyncSession,
+    atomic: bool = False,
+) -> dict:
+    """
+    Validates each item against ``schema`` and creates the valid ones with a
+    single ``create`` call.
+
+    Invalid items, including ones pointing at a missing profile, are reported
+    by index in ``errors``; in ``atomic`` mode any error rejects the whole
+    batch with a 422 instead.
+    """
+    errors = {}
+    rows = _validate(schema, items, errors)
+    rows = await _check_profiles(rows, errors, session)
+    if errors and atomic:
+        raise HTTPException(status_code=422, detail=_report(errors))
+    created = await create([row for _, row in rows], session) if rows else []
+    return {"created": created, "errors": _report(errors)}
+
+
+async def bulk_update(
+    schema: Type[BaseModel],
+    model: Any,
+    items: List[Dict[str, Any]],
+    update: Callable[[List[dict], AsyncSession], Awaitable[List[Any]]],
+    session: AsyncSession,
+    atomic: bool = False,
+) -> dict:
+    """
+    Applies partial updates, each item naming the ``id`` it targets and any
+    subset of ``schema``'s fields, with a single ``update`` call.
+
+    Errors are reported like :func:`bulk_create`, plus ids that appear twice
+    or do not exist.
+    """
+    errors = {}
+    rows = _validate(patch_schema(schema), items, errors, exclude_unset=True)
+    seen = set()
+    for index, row in rows:
+        if row["id"] in seen:
+            errors[index] = _error("id", "Duplicate id in batch", "duplicate")
+        seen.add(row["id"])
+    rows = [(index, row) for index, row in rows if index not in errors]
+    rows = await _check_profiles(rows, errors, session)
+    if atomic and rows:
+        existing = await model.existing_ids([row["id"] for _, row in rows], session)
+        for index, row in rows:
+            if row["id"] not in existing:
+                errors[index] = _error("id", "Not found")
+    if errors and atomic:
+        raise HTTPException(status_code=422, detail=_report(errors))
+    updated = await update([row for _, row in rows], session) if rows else []
+    found = {instance.id: instance for instance in updated}
+    for index, row in rows:
+        if row["id"] not in found:
+            errors[index] = _error("id", "Not found")
+    return {
+        "updated": [found[row["id"]] for _, row in rows if row["id"] in found],
+        "errors": _report(errors),
+    }
+
+
+async def bulk_delete(
+    model: Any,
+    ids: Sequence[int],
+    delete: Callable[[List[int], AsyncSession], Awaitable[List[int]]],
+    session: AsyncSession,
+    atomic: bool = False,
+) -> dict:
+    """
+    Deletes the given ids with a single ``delete`` call and reports which of
+    them did not exist; in ``atomic`` mode a missing id deletes nothing.
+    """
+    requested, ids = ids, list(dict.fromkeys(ids))
+    if atomic:
+        missing = set(ids) - await model.existing_ids(ids, session)
+        if missing:
+            raise HTTPException(
+                status_code=422,
+                detail=[
+                    {"index": index, "errors": _error("id", "Not found")}
+                    for index, id in enumerate(requested)
+                    if id in missing
+                ],
+            )
+    deleted = set(await delete(ids, session)) if ids else set()
+    return {
+        "deleted": [id for id in ids if id in deleted],
+        "not_found": [id for id in ids if id not in deleted],
+    }
@@ -0,0 +1,142 @@
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+from dotenv import load_dotenv
+
+load_dotenv()
+PROFILE_CACHE_SIZE = int(os.getenv("PROFILE_CACHE_SIZE", "256"))
+PROFILE_CACHE_TTL = float(os.getenv("PROFILE_CACHE_TTL", "300"))
+PROFILE_VERSION_TTL = float(os.getenv("PROFILE_VERSION_TTL", "2"))
+
+
+class ProfileCache:
+    """
+    Bounded LRU/TTL cache of assembled profile documents keyed by profile id.
+
+    Entries are tagged with the profile's database version and only served for
+    that version, so a load racing a write can never be returned after it.
+    The current version of each profile is remembered separately for a short
+    TTL to let conditional reads skip the version lookup entirely.
+
+    Every ``invalidate`` bumps the key's generation. Loads take
+    ``generation(key)`` before they read the database and pass it to
+    ``remember_version`` and ``set``, which drop what they are given when the
+    key was invalidated in between: the read may predate the write.
+    """
+
+    def __init__(
+        self, max_size: int = 256, ttl: float = 300.0, version_ttl: float = 2.0
+    ):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.version_ttl = version_ttl
+        self._entries: "OrderedDict[Hashable, Tuple[float, int, Any]]" = OrderedDict()
+        self._versions: "OrderedDict[Hashable, Tuple[float, int]]" = OrderedDict()
+        self._generations: "OrderedDict[Hashable, int]" = OrderedDict()
+        # generations are drawn from one counter; keys whose generation was
+        # evicted report the highest evicted one, which is never lower
+        self._last_generation = 0
+        self._evicted_generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, key: Hashable, version: int) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        expires_at, entry_version, value = entry
+        if expires_at < time.monotonic() or entry_version < version:
+            del self._entries[key]
+            self.evictions += 1
+            self.misses += 1
+            return None
+        if entry_version != version:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def generation(self, key: Hashable) -> int:
+        return self._generations.get(key, self._evicted_generation)
+
+    def set(self, key: Hashable, version: int, value: Any, *, generation: int) -> bool:
+        if self.max_size <= 0:
+            return False
+        if generation != self.generation(key):
+            # invalidated while this value was loading
+            return False
+        current = self._entries.get(key)
+        if current is not None and current[1] > version:
+            # a newer version was stored while this one was loading
+            return False
+        self._entries[key] = (time.monotonic() + self.ttl, version, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return True
+
+    def version(self, key: Hashable) -> Optional[int]:
+        entry = self._versions.get(key)
+        if entry is None:
+            return None
+        expires_at, version = entry
+        if expires_at < time.monotonic():
+            del self._versions[key]
+            return None
+        return version
+
+    def remember_version(self, key: Hashable, version: int, *, generation: int) -> None:
+        if self.version_ttl <= 0 or generation != self.generation(key):
+            return
+        self._versions[key] = (time.monotonic() + self.version_ttl, version)
+        self._versions.move_to_end(key)
+        while len(self._versions) > max(self.max_size, 1):
+            self._versions.popitem(last=False)
+
+    def invalidate(self, *keys: Optional[Hashable]) -> None:
+        for key in keys:
+            if key is None:
+                continue
+            self._entries.pop(key, None)
+            self._versions.pop(key, None)
+            self._last_generation += 1
+            self._generations[key] = self._last_generation
+            self._generations.move_to_end(key)
+            self.invalidations += 1
+        while len(self._generations) > max(self.max_size, 1):
+            _, evicted = self._generations.popitem(last=False)
+            self._evicted_generation = max(self._evicted_generation, evicted)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._versions.clear()
+        self._generations.clear()
+        # loads already under way must not refill the cache
+        self._evicted_generation = self._last_generation = self._last_generation + 1
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl": self.ttl,
+            "versions_cached": len(self._versions),
+            "version_ttl": self.version_ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+
+profile_cache = ProfileCache(
+    max_size=PROFILE_CACHE_SIZE,
+    ttl=PROFILE_CACHE_TTL,
+    version_ttl=PROFILE_VERSION_TTL,
+)
@@ -0,0 +1,186 @@
+import gzip
+import os
+from typing import Dict, Optional, Tuple
+
+from dotenv import load_dotenv
+from starlette.datastructures import Headers, MutableHeaders
+
+try:
+    import brotli
+except ImportError:  # br is only offered when the brotli package is installed
+    brotli = None
+
+load_dotenv()
+# responses smaller than this are sent uncompressed
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+GZIP_LEVEL = int(os.getenv("GZIP_LEVEL", "6"))
+BROTLI_QUALITY = int(os.getenv("BROTLI_QUALITY", "5"))
+
+COMPRESSIBLE_TYPES = ("application/json", "application/msgpack", "text/")
+
+
+def available_encodings() -> Tuple[str, ...]:
+    # in order of preference when the client weighs them equally
+    return ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def header_weights(value: str) -> Dict[str, float]:
+    """Parses an Accept-style header into ``{token: q}``."""
+    weights: Dict[str, float] = {}
+    for part in value.split(","):
+        token, _, params = part.strip().partition(";")
+        weight = 1.0
+        name, _, q = params.strip().partition("=")
+        if name.strip() == "q":
+            try:
+                weight = float(q)
+            except ValueError:
+                weight = 0.0
+        weights[token.strip().lower()] = weight
+    return weights
+
+
+def negotiate(accept_encoding: Optional[str]) -> Optional[str]:
+    """The best content coding both sides support, or None for identity."""
+    if not accept_encoding:
+        return None
+    weights = header_weights(accept_encoding)
+    best, best_weight = None, 0.0
+    for coding in available_encodings():
+        weight = weights.get(coding, weights.get("*", 0.0))
+        if weight > best_weight:
+            best, best_weight = coding, weight
+    return best
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    # a fixed mtime keeps the output (and so any cached copy) deterministic
+    return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+def add_vary(headers: MutableHeaders, *names: str) -> None:
+    """Adds ``names`` to the Vary header, skipping those already listed."""
+    listed = [name.strip() for name in headers.get("vary", "").split(",")]
+    listed = [name for name in listed if name]
+    known = {name.lower() for name in listed}
+    for name in names:
+        if name.lower() not in known:
+            listed.append(name)
+            known.add(name.lower())
+    if listed:
+        headers["Vary"] = ", ".join(listed)
+
+
+def variant_etag(etag: str, suffix: str) -> str:
+    """The tag of another representation of the same body, e.g. ``"x-gzip"``."""
+    if etag.endswith('"'):
+        return etag[:-1] + suffix + '"'
+    return etag
+
+
+def variant_if_none_match(value: str, suffix: str) -> str:
+    """
+    ``If-None-Match`` as seen from inside a middleware adding ``suffix``.
+
+    Tags with the suffix are mapped back to what the app below produces;
+    tags without it belong to other representations and are dropped.
+    """
+    tags = []
+    for tag in value.split(","):
+        tag = tag.strip()
+        if tag == "*":
+            tags.append(tag)
+        elif tag.endswith(suffix + '"'):
+            tags.append(tag[: -len(suffix) - 1] + '"')
+    return ", ".join(tags)
+
+
+def encode_once(
+    body: bytes, variants: Dict[str, bytes], encoding: Optional[str]
+) -> Tuple[bytes, Optional[str]]:
+    """
+    ``body`` compressed with ``encoding`` when it is large enough.
+
+    Compressed copies are stored in ``variants`` (kept next to the cached
+    body), so each body is compressed at most once per encoding. Returns the
+    bytes to send and the content coding actually applied.
+    """
+    if encoding is None or len(body) < COMPRESSION_MIN_SIZE:
+        return body, None
+    compressed = variants.get(encoding)
+    if compressed is None:
+        compressed = variants[encoding] = compress(body, encoding)
+    return compressed, encoding
+
+
+class CompressionMiddleware:
+    """
+    Compresses JSON and text responses with br or gzip.
+
+    The body is collected before it is compressed (every response of this API
+    is built in memory). Responses that already carry a Content-Encoding,
+    such as precompressed profile documents, and bodies below
+    ``COMPRESSION_MIN_SIZE`` pass through untouched.
+
+    Each content coding is a representation of its own, so when a coding is
+    negotiated every ETag gets its name as a suffix (``"x"`` becomes
+    ``"x-gzip"``), whether or not this particular body ends up compressed.
+    ``If-None-Match`` is mapped back before the app compares it.
+    """
+
+    def __init__(self, app, minimum_size: int = COMPRESSION_MIN_SIZE):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate(Headers(scope=scope).get("accept-encoding"))
+        suffix = f"-{encoding}"
+        if encoding is not None and "if-none-match" in Headers(scope=scope):
+            scope = dict(scope, headers=list(scope["headers"]))
+            request_headers = MutableHeaders(scope=scope)
+            request_headers["if-none-match"] = variant_if_none_match(
+                request_headers["if-none-match"], suffix
+            )
+        start = None
+        chunks = []
+
+        async def send_compressed(message):
+            nonlocal start
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(raw=message["headers"])
+                content_type = headers.get("content-type", "")
+                compressible = content_type.startswith(COMPRESSIBLE_TYPES)
+                if compressible or "etag" in headers:
+                    add_vary(headers, "Accept-Encoding")
+                if encoding is not None and "etag" in headers:
+                    headers["ETag"] = variant_etag(headers["etag"], suffix)
+                if (
+                    encoding is None
+                    or "content-encoding" in headers
+                    or not compressible
+                ):
+                    await send(message)
+                else:
+                    start = message
+                return
+            if start is None:
+                await send(message)
+                return
+            chunks.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+            body = b"".join(chunks)
+            if len(body) >= self.minimum_size:
+                body = compress(body, encoding)
+                headers = MutableHeaders(raw=start["headers"])
+                headers["Content-Encoding"] = encoding
+                headers["Content-Length"] = str(len(body))
+            await send(start)
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, send_compressed)
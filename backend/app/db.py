@@ -1,16 +1,170 @@
+from typing import Optional
+
+from fastapi import Request, Response
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlalchemy.util.queue import AsyncAdaptedQueue, Empty
+import math
 import os
+import time
 from dotenv import load_dotenv
 
 load_dotenv()
 DATABASE_URL = os.getenv("DATABASE_URL")
+# optional streaming replica for GET requests
+DATABASE_READ_URL = os.getenv("DATABASE_READ_URL")
+# after a write, the same client reads from the primary for this long
+DB_READ_PIN_SECONDS = float(os.getenv("DB_READ_PIN_SECONDS", "5"))
+PRIMARY_PIN_COOKIE = "db_primary_until"
+# pool limits are per worker process: with N uvicorn workers the database
+# sees up to N * (DB_POOL_SIZE + DB_MAX_OVERFLOW) connections
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "-1"))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "false").lower() in (
+    "1",
+    "true",
+    "yes",
+)
+# compiled SQL kept per engine by SQLAlchemy, and server-side prepared
+# statements kept per connection by asyncpg (0 disables, e.g. behind
+# pgbouncer in transaction mode)
+DB_QUERY_CACHE_SIZE = int(os.getenv("DB_QUERY_CACHE_SIZE", "500"))
+DB_STATEMENT_CACHE_SIZE = int(os.getenv("DB_STATEMENT_CACHE_SIZE", "100"))
+
+
+class _TimedQueue(AsyncAdaptedQueue):
+    """Pool queue that records how long checkouts wait for a free connection."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def get(self, block=True, timeout=None):
+        started = time.perf_counter()
+        try:
+            entry = super().get(block, timeout)
+        except Empty:
+            # only a blocking get waits; a non-blocking one makes the pool
+            # open a new connection instead
+            if block:
+                self.timeouts += 1
+            raise
+        waited = time.perf_counter() - started
+        self.checkouts += 1
+        self.wait_total += waited
+        self.wait_max = max(self.wait_max, waited)
+        return entry
+
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    """
+    Queue pool that records how long checkouts wait and how often they time out.
+
+    The wait is timed around the queue, so ``checkouts`` and the wait times
+    cover checkouts served by a pooled connection; checkouts that open a new
+    connection are counted in ``connects`` and do not wait.
+    """
+
+    _queue_class = _TimedQueue
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.connects = 0
+
+    def _create_connection(self):
+        self.connects += 1
+        return super()._create_connection()
+
+    def stats(self) -> dict:
+        queue = self._pool
+        return {
+            "size": self.size(),
+            "checked_in": self.checkedin(),
+            "checked_out": self.checkedout(),
+            # negative while fewer than ``size`` connections are open
+            "overflow": max(self.overflow(), 0),
+            "max_overflow": self._max_overflow,
+            "timeout": self._timeout,
+            "connects": self.connects,
+            "checkouts": queue.checkouts,
+            "timeouts": queue.timeouts,
+            "wait_avg_ms": (
+                queue.wait_total / queue.checkouts * 1000 if queue.checkouts else 0.0
+            ),
+            "wait_max_ms": queue.wait_max * 1000,
+        }
+
+
+def _create_engine(url):
+    return create_async_engine(
+        url,
+        echo=False,
+        poolclass=InstrumentedPool,
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_timeout=DB_POOL_TIMEOUT,
+        pool_recycle=DB_POOL_RECYCLE,
+        pool_pre_ping=DB_POOL_PRE_PING,
+        query_cache_size=DB_QUERY_CACHE_SIZE,
+        connect_args={"prepared_statement_cache_size": DB_STATEMENT_CACHE_SIZE},
+    )
+
 
-engine = create_async_engine(DATABASE_URL, echo=False)
+engine = _create_engine(DATABASE_URL)
 AsyncSessionLocal = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 Base = declarative_base()
 
+# reads go to the replica when one is configured, otherwise to the primary
+read_engine = _create_engine(DATABASE_READ_URL) if DATABASE_READ_URL else engine
+ReadSessionLocal = sessionmaker(
+    read_engine, class_=AsyncSession, expire_on_commit=False
+)
+
+
+def pool_stats() -> dict:
+    return engine.pool.stats()
+
+
+def read_pool_stats() -> Optional[dict]:
+    return read_engine.pool.stats() if read_engine is not engine else None
+
+
+def reads_around_replica(session: AsyncSession) -> bool:
+    """True for primary sessions while a replica serves the other reads."""
+    return read_engine is not engine and session.bind is engine
+
+
+def pin_to_primary(response: Response) -> None:
+    """Routes the client's reads to the primary for DB_READ_PIN_SECONDS."""
+    response.set_cookie(
+        PRIMARY_PIN_COOKIE,
+        f"{time.time() + DB_READ_PIN_SECONDS:.3f}",
+        max_age=math.ceil(DB_READ_PIN_SECONDS),
+        httponly=True,
+        samesite="lax",
+    )
+
+
+def pinned_to_primary(request: Request) -> bool:
+    try:
+        return float(request.cookies.get(PRIMARY_PIN_COOKIE, 0)) > time.time()
+    except ValueError:
+        return False
+
 
 async def get_db():
     async with AsyncSessionLocal() as session:
         yield session
+
+
+async def get_read_db(request: Request):
+    # clients that just wrote read from the primary so they see their change
+    factory = AsyncSessionLocal if pinned_to_primary(request) else ReadSessionLocal
+    async with factory() as session:
+        yield session
@@ -0,0 +1,60 @@
+import hashlib
+from typing import Optional
+
+from fastapi import Depends, HTTPException, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db import get_read_db
+from app.services import profile as profile_service
+
+
+def make_etag(*parts) -> str:
+    digest = hashlib.sha1(":".join(str(p) for p in parts).encode()).hexdigest()
+    return f'"{digest[:20]}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    # If-None-Match uses weak comparison, so W/ prefixes are ignored
+    candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
+
+
+def body_etag(body: bytes) -> str:
+    return f'"{hashlib.sha1(body).hexdigest()[:20]}"'
+
+
+def profile_etag(profile_id: int, version: int, *variant) -> str:
+    return make_etag("profile", profile_id, version, *variant)
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers={"ETag": etag})
+
+
+async def profile_list_etag(
+    request: Request,
+    response: Response,
+    profile_id: Optional[int] = Query(None, gt=0),
+    session: AsyncSession = Depends(get_read_db),
+) -> None:
+    """
+    Conditional GET support for list endpoints filtered by ``profile_id``.
+
+    The ETag is derived from the owning profile's version and the normalized
+    query string; a matching ``If-None-Match`` short-circuits with a 304 before
+    the list query runs. Unfiltered lists have no version to derive a tag
+    from: ``struct_response`` tags them with a hash of the encoded body, which
+    saves the transfer but not the query.
+    """
+    if profile_id is None:
+        return
+    version = await profile_service.get_profile_version(profile_id, session)
+    if version is None:
+        return
+    query = sorted(request.query_params.multi_items())
+    etag = make_etag(request.url.path, query, version)
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        raise HTTPException(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
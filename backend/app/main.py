@@ -5,12 +5,38 @@ _project_root = Path(__file__).resolve().parent.parent
 if str(_project_root) not in sys.path:
     sys.path.insert(0, str(_project_root))
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
+from fastapi.responses import ORJSONResponse
 
+from app import singleflight
+from app.cache import profile_cache
+from app.compression import CompressionMiddleware
+from app.db import DATABASE_READ_URL, pin_to_primary, pool_stats, read_pool_stats
 from app.routes import routers
 from app.logger import logger
+from app.msgpack_content import MsgPackMiddleware
+
+# response models are still validated and serialized by pydantic; only the
+# final encoding moves from the stdlib json module to orjson
+app = FastAPI(title="Backend API", default_response_class=ORJSONResponse)
+
+
+@app.middleware("http")
+async def pin_writers_to_primary(request: Request, call_next):
+    response = await call_next(request)
+    if (
+        DATABASE_READ_URL
+        and request.method not in ("GET", "HEAD", "OPTIONS")
+        and response.status_code < 400
+    ):
+        pin_to_primary(response)
+    return response
+
+
+# added last, so compression runs outermost and also compresses MessagePack
+app.add_middleware(MsgPackMiddleware, path_prefix="/api")
+app.add_middleware(CompressionMiddleware)
 
-app = FastAPI(title="Backend API")
 
 # register all routers exported by the routes package
 for r in routers:
@@ -27,3 +53,15 @@ async def root():
 async def health():
     logger.debug("Health check requested")
     return {"status": "ok"}
+
+
+@app.get("/stats")
+async def stats():
+    return {
+        "db_pool": pool_stats(),
+        "db_read_pool": read_pool_stats(),
+        "profile_cache": profile_cache.stats(),
+        "singleflight": {
+            name: group.stats() for name, group in singleflight.groups.items()
+        },
+    }
@@ -1,31 +1,184 @@
-from typing import Any, List, Optional, Sequence
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from sqlalchemy import (
     Boolean,
     Column,
     Date,
+    DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
+    any_,
+    bindparam,
+    column,
+    delete,
+    event,
+    insert,
     select,
+    func,
+    text,
+    update,
+    values,
 )
-from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import ORMExecuteState, Session, relationship
 
 from .db import AsyncSessionLocal, Base
+from .singleflight import SingleFlight
+
+get_by_id_flights = SingleFlight("get_by_id")
+
+# bumped for a table each time a commit that wrote to it completes; part of
+# the get_by_id flight key, so a read starting after a commit never joins a
+# lookup that may have seen the row before it
+table_generations: Dict[str, int] = defaultdict(int)
+
+
+def _written_tables(session: Session) -> set:
+    return session.info.setdefault("written_tables", set())
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _record_written_table(state: ORMExecuteState) -> None:
+    if state.is_insert or state.is_update or state.is_delete:
+        _written_tables(state.session).add(state.statement.table.name)
+
+
+@event.listens_for(Session, "after_flush")
+def _record_flushed_tables(session: Session, flush_context) -> None:
+    for instance in (*session.new, *session.dirty, *session.deleted):
+        _written_tables(session).add(instance.__table__.name)
+
+
+@event.listens_for(Session, "after_commit")
+def _bump_table_generations(session: Session) -> None:
+    for table in session.info.pop("written_tables", ()):
+        table_generations[table] += 1
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_written_tables(session: Session) -> None:
+    session.info.pop("written_tables", None)
+
+
+def _id_array(cls, ids: Sequence[Any]):
+    # one array parameter, so the statement text is the same for any batch size
+    return bindparam("ids", list(ids), type_=ARRAY(cls.id.type))
+
+
+def _changes(cls, names: Sequence[str], rows: Sequence[dict]):
+    """
+    The ``data`` relation a bulk UPDATE joins against.
+
+    Each column is bound as one array parameter and unnested in parallel, so
+    the statement is cacheable and its text does not vary with batch size.
+    ARRAY columns cannot be unnested row by row; batches changing one fall
+    back to a ``VALUES`` list.
+    """
+    # rows are keyed by attribute, which may differ from the column name
+    # (Reference.relation is stored in "relationship"); ``data`` keeps the
+    # attribute keys
+    types = {name: cls.__mapper__.attrs[name].columns[0].type for name in names}
+    if any(isinstance(type_, ARRAY) for type_ in types.values()):
+        return values(
+            *(column(name, type_) for name, type_ in types.items()), name="data"
+        ).data([tuple(row[name] for name in names) for row in rows])
+    return select(
+        *(
+            func.unnest(
+                bindparam(
+                    f"data_{name}", [row[name] for row in rows], type_=ARRAY(type_)
+                )
+            ).label(name)
+            for name, type_ in types.items()
+        )
+    ).subquery("data")
+
+
+def _locked_previous(cls, where, previous: Sequence[str]):
+    """
+    The ``old`` relation an UPDATE ... RETURNING reads ``previous`` from.
+
+    A self-join would see the row as of the statement's snapshot: under READ
+    COMMITTED, Postgres re-checks an updated target row after a concurrent
+    update but does not re-fetch the joined copy, so two racing updates
+    would both report the value from before the first. ``SELECT ... FOR
+    UPDATE`` waits for the concurrent writer and returns the row as it
+    committed; rows are locked in id order.
+    """
+    return (
+        select(cls.id, *(getattr(cls, name).label(name) for name in previous))
+        .where(where)
+        .order_by(cls.id)
+        .with_for_update()
+        .cte("old")
+    )
 
 
 class CRUDMixin:
     @classmethod
-    async def get_by_id(cls, id: Any, session: Optional[AsyncSession] = None):
+    async def get_by_id(
+        cls,
+        id: Any,
+        session: Optional[AsyncSession] = None,
+        coalesce: bool = False,
+    ):
+        if coalesce:
+            # read-only callers share one in-flight lookup per row, engine
+            # (primary or replica) and table generation; the returned
+            # instance belongs to the leader's session
+            bind = session.bind if session else None
+            generation = table_generations[cls.__tablename__]
+            return await get_by_id_flights.do(
+                (cls.__tablename__, id, bind, generation),
+                lambda: cls.get_by_id(id, session=session),
+            )
         if session:
             return await session.get(cls, id)
         async with AsyncSessionLocal() as s:
             return await s.get(cls, id)
 
+    @classmethod
+    async def get_row_by_id(
+        cls,
+        id: Any,
+        *columns,
+        session: Optional[AsyncSession] = None,
+        coalesce: bool = False,
+    ):
+        """Selects ``columns`` of one row as a plain ``Row``, or None."""
+        if coalesce:
+            bind = session.bind if session else None
+            generation = table_generations[cls.__tablename__]
+            return await get_by_id_flights.do(
+                (cls.__tablename__, id, bind, generation, columns),
+                lambda: cls.get_row_by_id(id, *columns, session=session),
+            )
+        stmt = select(*columns).where(cls.id == id)
+        if session:
+            result = await session.execute(stmt)
+            return result.first()
+        async with AsyncSessionLocal() as s:
+            result = await s.execute(stmt)
+            return result.first()
+
+    @classmethod
+    async def existing_ids(
+        cls, ids: Sequence[Any], session: Optional[AsyncSession] = None
+    ) -> set:
+        stmt = select(cls.id).where(cls.id == any_(_id_array(cls, ids)))
+        if session:
+            result = await session.execute(stmt)
+            return set(result.scalars().all())
+        async with AsyncSessionLocal() as s:
+            result = await s.execute(stmt)
+            return set(result.scalars().all())
+
     @classmethod
     async def list(
         cls,
@@ -33,84 +186,216 @@ class CRUDMixin:
         offset: int = 0,
         limit: int = 100,
         session: Optional[AsyncSession] = None,
+        after: Optional[Any] = None,
+        columns: Optional[Sequence] = None,
     ) -> List[Any]:
-        stmt = select(cls)
+        # ordered by primary key so pages are stable; with ``after`` (keyset
+        # pagination) the scan starts right past the previous page's last id.
+        # With ``columns`` only those are selected and plain Rows come back,
+        # bypassing the identity map and attribute instrumentation
+        stmt = select(*columns) if columns else select(cls)
+        stmt = stmt.order_by(cls.id)
         if filters:
             for f in filters:
                 stmt = stmt.where(f)
+        if after is not None:
+            stmt = stmt.where(cls.id > after)
         stmt = stmt.offset(offset).limit(limit)
         if session:
             result = await session.execute(stmt)
-            return result.scalars().all()
+            return result.all() if columns else result.scalars().all()
         async with AsyncSessionLocal() as s:
             result = await s.execute(stmt)
-            return result.scalars().all()
+            return result.all() if columns else result.scalars().all()
 
     @classmethod
     async def create(cls, values: dict, session: Optional[AsyncSession] = None):
-        instance = cls(**values)
+        # one INSERT ... RETURNING brings back DB-generated fields, no refresh
+        stmt = insert(cls).values(**values).returning(cls)
         if session:
-            session.add(instance)
-            # ensure DB-generated fields are available without committing
-            await session.flush()
-            try:
-                await session.refresh(instance)
-            except Exception:
-                # refresh may fail in some edge cases; ignore and return instance
-                pass
-            return instance
+            result = await session.execute(stmt)
+            return result.scalar_one()
         async with AsyncSessionLocal() as s:
-            s.add(instance)
+            result = await s.execute(stmt)
+            instance = result.scalar_one()
             await s.commit()
-            await s.refresh(instance)
             return instance
 
+    @classmethod
+    async def create_many(
+        cls, rows: Sequence[dict], session: Optional[AsyncSession] = None
+    ) -> List[Any]:
+        """
+        Inserts rows with one multi-row ``INSERT ... RETURNING`` and returns
+        the created instances in the order of ``rows``.
+        """
+        if not rows:
+            return []
+        stmt = insert(cls).returning(cls, sort_by_parameter_order=True)
+        if session:
+            result = await session.execute(stmt, list(rows))
+            return result.scalars().all()
+        async with AsyncSessionLocal() as s:
+            result = await s.execute(stmt, list(rows))
+            instances = result.scalars().all()
+            await s.commit()
+            return instances
+
     @classmethod
     async def update_by_id(
         cls, id: Any, data: dict, session: Optional[AsyncSession] = None
     ):
-        if session:
-            instance = await session.get(cls, id)
+        row = await cls.update_by_id_returning(id, data, session=session)
+        return row[0] if row else None
+
+    @classmethod
+    async def update_by_id_returning(
+        cls,
+        id: Any,
+        data: dict,
+        *previous: str,
+        session: Optional[AsyncSession] = None,
+    ) -> Optional[Tuple[Any, ...]]:
+        """
+        Updates one row with a single ``UPDATE ... RETURNING`` statement.
+
+        Returns ``(instance, *values)`` where ``values`` are the ``previous``
+        columns as they were right before the update, or None when no row has
+        the given id.
+        """
+        if not data:
+            instance = await cls.get_by_id(id, session=session)
             if not instance:
                 return None
-            for k, v in data.items():
-                setattr(instance, k, v)
-            session.add(instance)
-            await session.flush()
-            try:
-                await session.refresh(instance)
-            except Exception:
-                pass
-            return instance
+            return (instance, *(getattr(instance, name) for name in previous))
+        stmt = update(cls).where(cls.id == id).values(**data)
+        if previous:
+            old = _locked_previous(cls, cls.id == id, previous)
+            stmt = stmt.where(old.c.id == cls.id)
+            stmt = stmt.returning(cls, *(old.c[name] for name in previous))
+        else:
+            stmt = stmt.returning(cls)
+        stmt = stmt.execution_options(populate_existing=True)
+        if session:
+            result = await session.execute(stmt)
+            return result.first()
         async with AsyncSessionLocal() as s:
-            instance = await s.get(cls, id)
-            if not instance:
-                return None
-            for k, v in data.items():
-                setattr(instance, k, v)
-            s.add(instance)
+            result = await s.execute(stmt)
+            row = result.first()
             await s.commit()
-            await s.refresh(instance)
-            return instance
+            return row
+
+    @classmethod
+    async def update_many_returning(
+        cls,
+        rows: Sequence[dict],
+        *previous: str,
+        session: Optional[AsyncSession] = None,
+    ) -> List[Tuple[Any, ...]]:
+        """
+        Applies per-row changes with one ``UPDATE ... FROM`` per column set.
+
+        Every row carries the ``id`` it targets. Rows changing the same set of
+        columns share one statement. Returns ``(instance, *values)`` for each
+        row that exists, where ``values`` are the ``previous`` columns as they
+        were before the update.
+        """
+        groups = {}
+        for row in rows:
+            names = tuple(sorted(name for name in row if name != "id"))
+            groups.setdefault(names, []).append(row)
+        statements = []
+        for names, group in groups.items():
+            ids = [row["id"] for row in group]
+            if not names:
+                stmt = select(cls, *(getattr(cls, name) for name in previous))
+                statements.append(stmt.where(cls.id == any_(_id_array(cls, ids))))
+                continue
+            data = _changes(cls, ("id",) + names, group)
+            stmt = (
+                update(cls)
+                .where(cls.id == data.c.id)
+                .values({name: data.c[name] for name in names})
+            )
+            if previous:
+                old = _locked_previous(
+                    cls, cls.id == any_(_id_array(cls, ids)), previous
+                )
+                stmt = stmt.where(old.c.id == cls.id)
+                stmt = stmt.returning(cls, *(old.c[name] for name in previous))
+            else:
+                stmt = stmt.returning(cls)
+            statements.append(stmt.execution_options(populate_existing=True))
+
+        async def run(s: AsyncSession) -> List[Tuple[Any, ...]]:
+            updated = []
+            for stmt in statements:
+                result = await s.execute(stmt)
+                updated.extend(result.all())
+            return updated
+
+        if session:
+            return await run(session)
+        async with AsyncSessionLocal() as s:
+            updated = await run(s)
+            await s.commit()
+            return updated
 
     @classmethod
     async def delete_by_id(
         cls, id: Any, session: Optional[AsyncSession] = None
     ) -> bool:
+        return await cls.delete_by_id_returning(id, session=session) is not None
+
+    @classmethod
+    async def delete_by_id_returning(
+        cls, id: Any, *columns: str, session: Optional[AsyncSession] = None
+    ) -> Optional[Tuple[Any, ...]]:
+        """
+        Deletes one row with a single ``DELETE ... RETURNING`` statement.
+
+        Returns the deleted row's ``id`` followed by the requested ``columns``,
+        or None when no row has the given id.
+        """
+        stmt = (
+            delete(cls)
+            .where(cls.id == id)
+            .returning(cls.id, *(getattr(cls, name) for name in columns))
+        )
         if session:
-            instance = await session.get(cls, id)
-            if not instance:
-                return False
-            await session.delete(instance)
-            await session.flush()
-            return True
+            result = await session.execute(stmt)
+            return result.first()
         async with AsyncSessionLocal() as s:
-            instance = await s.get(cls, id)
-            if not instance:
-                return False
-            await s.delete(instance)
+            result = await s.execute(stmt)
+            row = result.first()
             await s.commit()
-            return True
+            return row
+
+    @classmethod
+    async def delete_many_returning(
+        cls,
+        ids: Sequence[Any],
+        *columns: str,
+        session: Optional[AsyncSession] = None,
+    ) -> List[Tuple[Any, ...]]:
+        """
+        Deletes rows with one ``DELETE ... WHERE id = ANY(:ids) RETURNING``.
+
+        Returns the ``id`` and requested ``columns`` of every deleted row.
+        """
+        stmt = (
+            delete(cls)
+            .where(cls.id == any_(_id_array(cls, ids)))
+            .returning(cls.id, *(getattr(cls, name) for name in columns))
+        )
+        if session:
+            result = await session.execute(stmt)
+            return result.all()
+        async with AsyncSessionLocal() as s:
+            result = await s.execute(stmt)
+            deleted = result.all()
+            await s.commit()
+            return deleted
 
     async def delete(self, session: Optional[AsyncSession] = None) -> None:
         if session:
@@ -130,22 +415,42 @@ class Profile(CRUDMixin, Base):
     location = Column(String)
     summary = Column(String)
     skills = Column(ARRAY(String))
-
-    projects = relationship("Project", back_populates="profile")
-    experiences = relationship("Experience", back_populates="profile")
-    educations = relationship("Education", back_populates="profile")
-    certifications = relationship("Certification", back_populates="profile")
-    awards = relationship("Award", back_populates="profile")
-    publications = relationship("Publication", back_populates="profile")
-    contacts = relationship("Contact", back_populates="profile")
-    social_links = relationship("SocialLink", back_populates="profile")
-    portfolio_items = relationship("PortfolioItem", back_populates="profile")
-    references = relationship("Reference", back_populates="profile")
-    skill_items = relationship("Skill", back_populates="profile")
+    # bumped on every write to the profile or its child rows
+    version = Column(Integer, nullable=False, default=1, server_default=text("1"))
+
+    projects = relationship("Project", back_populates="profile", order_by="Project.id")
+    experiences = relationship(
+        "Experience", back_populates="profile", order_by="Experience.id"
+    )
+    educations = relationship(
+        "Education", back_populates="profile", order_by="Education.id"
+    )
+    certifications = relationship(
+        "Certification", back_populates="profile", order_by="Certification.id"
+    )
+    awards = relationship("Award", back_populates="profile", order_by="Award.id")
+    publications = relationship(
+        "Publication", back_populates="profile", order_by="Publication.id"
+    )
+    contacts = relationship("Contact", back_populates="profile", order_by="Contact.id")
+    social_links = relationship(
+        "SocialLink", back_populates="profile", order_by="SocialLink.id"
+    )
+    portfolio_items = relationship(
+        "PortfolioItem", back_populates="profile", order_by="PortfolioItem.id"
+    )
+    references = relationship(
+        "Reference", back_populates="profile", order_by="Reference.id"
+    )
+    skill_items = relationship("Skill", back_populates="profile", order_by="Skill.id")
 
 
 class Project(CRUDMixin, Base):
     __tablename__ = "projects"
+    __table_args__ = (
+        Index("ix_projects_profile_id_id", "profile_id", "id"),
+        Index("ix_projects_skills_gin", "skills", postgresql_using="gin"),
+    )
     id = Column(Integer, primary_key=True)
     title = Column(String, nullable=False)
     description = Column(String)
@@ -156,6 +461,10 @@ class Project(CRUDMixin, Base):
 
 class Experience(CRUDMixin, Base):
     __tablename__ = "experiences"
+    __table_args__ = (
+        Index("ix_experiences_profile_id_id", "profile_id", "id"),
+        Index("ix_experiences_skills_gin", "skills", postgresql_using="gin"),
+    )
     id = Column(Integer, primary_key=True)
     profile_id = Column(Integer, ForeignKey("profile.id"), nullable=False)
     company = Column(String, nullable=False)
@@ -171,6 +480,7 @@ class Experience(CRUDMixin, Base):
 
 class Education(CRUDMixin, Base):
     __tablename__ = "educations"
+    __table_args__ = (Index("ix_educations_profile_id_id", "profile_id", "id"),)
     id = Column(Integer, primary_key=True)
     profile_id = Column(Integer, ForeignKey("profile.id"), nullable=False)
     institution = Column(String, nullable=False)
@@ -185,6 +495,7 @@ class Education(CRUDMixin, Base):
 
 class Certification(CRUDMixin, Base):
     __tablename__ = "certifications"
+    __table_args__ = (Index("ix_certifications_profile_id_id", "profile_id", "id"),)
     id = Column(Integer, primary_key=True)
     profile_id = Column(Integer, ForeignKey("profile.id"), nullable=False)
     name = Column(String, nullable=False)
@@ -198,6 +509,7 @@ class Certification(CRUDMixin, Base):
 
 class Award(CRUDMixin, Base):
     __tablename__ = "awards"
+    __table_args__ = (Index("ix_awards_profile_id_id", "profile_id", "id"),)
     id = Column(Integer, primary_key=True)
     profile_id = Column(Integer, ForeignKey("profile.id"), nullable=False)
     title = Column(String, nullable=False)
@@ -209,6 +521,7 @@ class Award(CRUDMixin, Base):
 
 class Publication(CRUDMixin, Base):
     __tablename__ = "publications"
+    __table_args__ = (Index("ix_publications_profile_id_id", "profile_id", "id"),)
     id = Column(Integer, primary_key=True)
     profile_id = Column(Integer, ForeignKey("profile.id"), nullable=False)
     title = Column(String, nullable=False)
@@ -221,6 +534,7 @@ class Publication(CRUDMixin, Base):
 
 class Contact(CRUDMixin, Base):
     __tablename__ = "contacts"
+    __table_args__ = (Index("ix_contacts_profile_id_id", "profile_id", "id"),)
     id = Column(Integer, primary_key=True)
     profile_id = Column(Integer, ForeignKey("profile.id"), nullable=False)
     email = Column(String)
@@ -232,6 +546,7 @@ class Contact(CRUDMixin, Base):
 
 class SocialLink(CRUDMixin, Base):
     __tablename__ = "social_links"
+    __table_args__ = (Index("ix_social_links_profile_id_id", "profile_id", "id"),)
     id = Column(Integer, primary_key=True)
     profile_id = Column(Integer, ForeignKey("profile.id"), nullable=False)
     platform = Column(String)  # e.g., linkedin, github, twitter
@@ -242,6 +557,10 @@ class SocialLink(CRUDMixin, Base):
 
 class PortfolioItem(CRUDMixin, Base):
     __tablename__ = "portfolio_items"
+    __table_args__ = (
+        Index("ix_portfolio_items_profile_id_id", "profile_id", "id"),
+        Index("ix_portfolio_items_skills_gin", "skills", postgresql_using="gin"),
+    )
     id = Column(Integer, primary_key=True)
     profile_id = Column(Integer, ForeignKey("profile.id"), nullable=False)
     title = Column(String, nullable=False)
@@ -255,6 +574,7 @@ class PortfolioItem(CRUDMixin, Base):
 
 class Reference(CRUDMixin, Base):
     __tablename__ = "references"
+    __table_args__ = (Index("ix_references_profile_id_id", "profile_id", "id"),)
     id = Column(Integer, primary_key=True)
     profile_id = Column(Integer, ForeignKey("profile.id"), nullable=False)
     name = Column(String, nullable=False)
@@ -266,9 +586,43 @@ class Reference(CRUDMixin, Base):
 
 class Skill(CRUDMixin, Base):
     __tablename__ = "skills"
+    __table_args__ = (
+        Index("ix_skills_profile_id_id", "profile_id", "id"),
+        # pg_trgm index behind the ranked substring search
+        Index(
+            "ix_skills_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+    )
     id = Column(Integer, primary_key=True)
     profile_id = Column(Integer, ForeignKey("profile.id"), nullable=False)
     name = Column(String, nullable=False)
     proficiency = Column(Integer)  # optional 1-5 scale
     years = Column(Float)  # optional years of experience
+    # precomputed leaderboard score, see services.skills.refresh_skill_ranks
+    rank_score = Column(Float)
     profile = relationship("Profile", back_populates="skill_items")
+
+
+Index(
+    "ix_skills_profile_id_rank",
+    Skill.profile_id,
+    Skill.rank_score.desc().nulls_last(),
+    Skill.id,
+)
+
+
+class ProfileSnapshot(Base):
+    """Materialized ProfileRead document, rewritten whenever the profile changes."""
+
+    __tablename__ = "profile_snapshots"
+    profile_id = Column(
+        Integer, ForeignKey("profile.id", ondelete="CASCADE"), primary_key=True
+    )
+    version = Column(Integer, nullable=False)
+    document = Column(JSONB, nullable=False)
+    updated_at = Column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
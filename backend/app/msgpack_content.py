@@ -0,0 +1,169 @@
+"""
+MessagePack content negotiation.
+
+Clients that send ``Accept: application/msgpack`` get MessagePack bodies with
+exactly the shapes of the JSON responses, and request bodies sent as
+``Content-Type: application/msgpack`` are accepted wherever JSON is. Routes
+keep speaking JSON; the middleware translates at the edge.
+"""
+
+from typing import Optional
+
+import msgpack
+import orjson
+from starlette.datastructures import Headers, MutableHeaders
+
+from app.compression import (
+    add_vary,
+    header_weights,
+    variant_etag,
+    variant_if_none_match,
+)
+
+MSGPACK_TYPES = ("application/msgpack", "application/x-msgpack")
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+# MessagePack bodies are a separate representation of the same resource
+ETAG_SUFFIX = "-msgpack"
+
+
+def wants_msgpack(accept: Optional[str]) -> bool:
+    """True when ``accept`` prefers MessagePack over JSON."""
+    if not accept:
+        return False
+    weights = header_weights(accept)
+    msgpack_weight = max(weights.get(media_type, 0.0) for media_type in MSGPACK_TYPES)
+    json_weight = max(
+        weights.get("application/json", 0.0),
+        weights.get("application/*", 0.0),
+        weights.get("*/*", 0.0),
+    )
+    return msgpack_weight > 0 and msgpack_weight > json_weight
+
+
+def json_to_msgpack(body: bytes) -> bytes:
+    return msgpack.packb(orjson.loads(body), use_bin_type=True)
+
+
+def msgpack_to_json(body: bytes) -> bytes:
+    return orjson.dumps(
+        msgpack.unpackb(body, raw=False), option=orjson.OPT_NON_STR_KEYS
+    )
+
+
+class MsgPackMiddleware:
+    def __init__(self, app, path_prefix: str = ""):
+        self.app = app
+        # only API routes negotiate; docs and OpenAPI stay JSON
+        self.path_prefix = path_prefix
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not scope["path"].startswith(self.path_prefix):
+            await self.app(scope, receive, send)
+            return
+        send = _varying_on_accept(send)
+        headers = Headers(scope=scope)
+        content_type = headers.get("content-type", "").split(";")[0].strip().lower()
+        msgpack_request = content_type in MSGPACK_TYPES
+        msgpack_response = wants_msgpack(headers.get("accept"))
+        if not (msgpack_request or msgpack_response):
+            await self.app(scope, receive, send)
+            return
+
+        scope = dict(scope, headers=list(scope["headers"]))
+        request_headers = MutableHeaders(scope=scope)
+        if msgpack_request:
+            body = b""
+            more_body = True
+            while more_body:
+                message = await receive()
+                body += message.get("body", b"")
+                more_body = message.get("more_body", False)
+            try:
+                body = msgpack_to_json(body)
+            except (ValueError, TypeError, msgpack.UnpackException):
+                await _send_error(send, 400, "Invalid MessagePack body")
+                return
+            request_headers["content-type"] = "application/json"
+            request_headers["content-length"] = str(len(body))
+            sent = False
+
+            async def receive():
+                nonlocal sent
+                if sent:
+                    return {"type": "http.disconnect"}
+                sent = True
+                return {"type": "http.request", "body": body, "more_body": False}
+
+        if not msgpack_response:
+            await self.app(scope, receive, send)
+            return
+
+        # translated bodies must reach this middleware uncompressed; the
+        # compression middleware outside it still sees the original header
+        if "accept-encoding" in request_headers:
+            del request_headers["accept-encoding"]
+        if "if-none-match" in request_headers:
+            # only MessagePack tags can match a MessagePack request
+            request_headers["if-none-match"] = variant_if_none_match(
+                request_headers["if-none-match"], ETAG_SUFFIX
+            )
+        start = None
+        chunks = []
+
+        async def send_msgpack(message):
+            nonlocal start
+            if message["type"] == "http.response.start":
+                response_headers = MutableHeaders(raw=message["headers"])
+                if "etag" in response_headers:
+                    response_headers["ETag"] = variant_etag(
+                        response_headers["etag"], ETAG_SUFFIX
+                    )
+                if response_headers.get("content-type", "").startswith(
+                    "application/json"
+                ):
+                    start = message
+                else:
+                    await send(message)
+                return
+            if start is None:
+                await send(message)
+                return
+            chunks.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+            body = b"".join(chunks)
+            if body:
+                body = json_to_msgpack(body)
+            response_headers = MutableHeaders(raw=start["headers"])
+            response_headers["Content-Type"] = MSGPACK_MEDIA_TYPE
+            response_headers["Content-Length"] = str(len(body))
+            await send(start)
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, send_msgpack)
+
+
+def _varying_on_accept(send):
+    # every API response depends on Accept, JSON ones included, so caches
+    # must not hand a JSON body to a MessagePack client or the other way round
+    async def send_varied(message):
+        if message["type"] == "http.response.start":
+            add_vary(MutableHeaders(raw=message["headers"]), "Accept")
+        await send(message)
+
+    return send_varied
+
+
+async def _send_error(send, status_code: int, detail: str) -> None:
+    body = orjson.dumps({"detail": detail})
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status_code,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
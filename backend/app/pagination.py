@@ -0,0 +1,44 @@
+import base64
+import binascii
+from typing import Optional, Sequence
+
+from fastapi import HTTPException, Request, Response
+
+# ids are int4 columns; larger values would fail in the driver, not here
+MAX_ID = 2**31 - 1
+
+
+def encode_cursor(last_id: int) -> str:
+    return base64.urlsafe_b64encode(f"id:{last_id}".encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[int]:
+    """Returns the id a cursor points past, or None when no cursor is given."""
+    if not cursor:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        kind, _, value = base64.urlsafe_b64decode(padded).decode().partition(":")
+        # isdigit() also accepts digits int() rejects, such as "²"
+        if kind == "id" and value.isascii() and value.isdigit():
+            last_id = int(value)
+            if 1 <= last_id <= MAX_ID:
+                return last_id
+    except (binascii.Error, UnicodeDecodeError):
+        pass
+    raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def set_next_cursor(
+    request: Request, response: Response, items: Sequence, per_page: int
+) -> None:
+    """
+    Advertises the cursor of the page after ``items`` in the ``Link`` and
+    ``X-Next-Cursor`` headers. A short page is the last one and gets neither.
+    """
+    if len(items) < per_page:
+        return
+    cursor = encode_cursor(items[-1].id)
+    url = request.url.remove_query_params("page").include_query_params(cursor=cursor)
+    response.headers["Link"] = f'<{url}>; rel="next"'
+    response.headers["X-Next-Cursor"] = cursor
@@ -1,12 +1,25 @@
-from typing import List
+from typing import Any, Dict, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Path, Query
+from fastapi import (
+    APIRouter,
+    Body,
+    Depends,
+    HTTPException,
+    Path,
+    Query,
+    Request,
+    Response,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from .. import schemas
-from app.db import get_db
+from .. import models, schemas
+from app.bulk import BULK_MAX_ITEMS, bulk_create, bulk_delete, bulk_update
+from app.db import get_db, get_read_db
+from app.etag import profile_list_etag
 from app.logger import logger
+from app.pagination import decode_cursor, set_next_cursor
 from app.services import awards as awards_service
+from app.structs import struct_response
 
 router = APIRouter()
 
@@ -14,20 +27,30 @@ router = APIRouter()
 @router.get(
     "/awards",
     response_model=List[schemas.AwardRead],
+    dependencies=[Depends(profile_list_etag)],
     responses={
         404: {"model": schemas.ErrorResponse},
         500: {"model": schemas.ErrorResponse},
     },
 )
 async def list_awards(
-    session: AsyncSession = Depends(get_db),
+    request: Request,
+    response: Response,
+    session: AsyncSession = Depends(get_read_db),
     profile_id: int = Query(None, gt=0),
     page: int = Query(1, gt=0),
     per_page: int = Query(20, gt=1, le=100),
+    cursor: Optional[str] = Query(None),
 ):
-    return await awards_service.list_awards(
-        profile_id, page=page, per_page=per_page, session=session
+    items = await awards_service.list_awards(
+        profile_id,
+        page=page,
+        per_page=per_page,
+        after=decode_cursor(cursor),
+        session=session,
     )
+    set_next_cursor(request, response, items, per_page)
+    return struct_response(items, response, request)
 
 
 @router.post(
@@ -45,6 +68,69 @@ async def create_award(
     return await awards_service.create_award(data, session)
 
 
+@router.post(
+    "/awards/bulk",
+    response_model=schemas.BulkResult[schemas.AwardRead],
+    responses={
+        422: {"model": schemas.BulkErrorResponse},
+        500: {"model": schemas.ErrorResponse},
+    },
+)
+async def create_awards_bulk(
+    items: List[Dict[str, Any]] = Body(..., max_length=BULK_MAX_ITEMS),
+    atomic: bool = Query(False),
+    session: AsyncSession = Depends(get_db),
+):
+    return await bulk_create(
+        schemas.AwardCreate,
+        items,
+        awards_service.create_awards,
+        session,
+        atomic=atomic,
+    )
+
+
+@router.patch(
+    "/awards/bulk",
+    response_model=schemas.BulkUpdateResult[schemas.AwardRead],
+    responses={
+        422: {"model": schemas.BulkErrorResponse},
+        500: {"model": schemas.ErrorResponse},
+    },
+)
+async def update_awards_bulk(
+    items: List[Dict[str, Any]] = Body(..., max_length=BULK_MAX_ITEMS),
+    atomic: bool = Query(False),
+    session: AsyncSession = Depends(get_db),
+):
+    return await bulk_update(
+        schemas.AwardCreate,
+        models.Award,
+        items,
+        awards_service.update_awards,
+        session,
+        atomic=atomic,
+    )
+
+
+@router.delete(
+    "/awards/bulk",
+    response_model=schemas.BulkDeleteResult,
+    responses={
+        422: {"model": schemas.BulkErrorResponse},
+        500: {"model": schemas.ErrorResponse},
+    },
+)
+async def delete_awards_bulk(
+    ids: List[int] = Query(..., max_length=BULK_MAX_ITEMS),
+    atomic: bool = Query(False),
+    session: AsyncSession = Depends(get_db),
+):
+    return await bulk_delete(
+        models.Award, ids, awards_service.delete_awards, session, atomic=atomic
+    )
+
+
 @router.get(
     "/awards/{award_id}",
     response_model=schemas.AwardRead,
@@ -54,13 +140,13 @@ async def create_award(
     },
 )
 async def get_award(
-    award_id: int = Path(..., gt=0), session: AsyncSession = Depends(get_db)
+    award_id: int = Path(..., gt=0), session: AsyncSession = Depends(get_read_db)
 ):
     instance = await awards_service.get_award(award_id, session)
     if not instance:
         logger.warning("Award %s not found", award_id)
         raise HTTPException(status_code=404, detail="Award not found")
-    return instance
+    return struct_response(instance)
 
 
 @router.put(
@@ -1,12 +1,25 @@
-from typing import List
+from typing import Any, Dict, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Path, Query
+from fastapi import (
+    APIRouter,
+    Body,
+    Depends,
+    HTTPException,
+    Path,
+    Query,
+    Request,
+    Response,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from .. import schemas
-from app.db import get_db
+from .. import models, schemas
+from app.bulk import BULK_MAX_ITEMS, bulk_create, bulk_delete, bulk_update
+from app.db import get_db, get_read_db
+from app.etag import profile_list_etag
 from app.logger import logger
+from app.pagination import decode_cursor, set_next_cursor
 from app.services import certifications as certifications_service
+from app.structs import struct_response
 
 router = APIRouter()
 
@@ -14,20 +27,30 @@ router = APIRouter()
 @router.get(
     "/certifications",
     response_model=List[schemas.CertificationRead],
+    dependencies=[Depends(profile_list_etag)],
     responses={
         404: {"model": schemas.ErrorResponse},
         500: {"model": schemas.ErrorResponse},
     },
 )
 async def list_certifications(
+    request: Request,
+    response: Response,
     profile_id: int = Query(None, gt=0),
     page: int = Query(1, gt=0),
     per_page: int = Query(20, gt=1, le=100),
-    session: AsyncSession = Depends(get_db),
+    cursor: Optional[str] = Query(None),
+    session: AsyncSession = Depends(get_read_db),
 ):
-    return await certifications_service.list_certifications(
-        profile_id, page=page, per_page=per_page, session=session
+    items = await certifications_service.list_certifications(
+        profile_id,
+        page=page,
+        per_page=per_page,
+        after=decode_cursor(cursor),
+        session=session,
     )
+    set_next_cursor(request, response, items, per_page)
+    return struct_response(items, response, request)
 
 
 @router.post(
@@ -45,6 +68,73 @@ async def create_certification(
     return await certifications_service.create_certification(data, session)
 
 
+@router.post(
+    "/certifications/bulk",
+    response_model=schemas.BulkResult[schemas.CertificationRead],
+    responses={
+        422: {"model": schemas.BulkErrorResponse},
+        500: {"model": schemas.ErrorResponse},
+    },
+)
+async def create_certifications_bulk(
+    items: List[Dict[str, Any]] = Body(..., max_length=BULK_MAX_ITEMS),
+    atomic: bool = Query(False),
+    session: AsyncSession = Depends(get_db),
+):
+    return await bulk_create(
+        schemas.CertificationCreate,
+        items,
+        certifications_service.create_certifications,
+        session,
+        atomic=atomic,
+    )
+
+
+@router.patch(
+    "/certifications/bulk",
+    response_model=schemas.BulkUpdateResult[schemas.CertificationRead],
+    responses={
+        422: {"model": schemas.BulkErrorResponse},
+        500: {"model": schemas.ErrorResponse},
+    },
+)
+async def update_certifications_bulk(
+    items: List[Dict[str, Any]] = Body(..., max_length=BULK_MAX_ITEMS),
+    atomic: bool = Query(False),
+    session: AsyncSession = Depends(get_db),
+):
+    return await bulk_update(
+        schemas.CertificationCreate,
+        models.Certification,
+        items,
+        certifications_service.update_certifications,
+        session,
+        atomic=atomic,
+    )
+
+
+@router.delete(
+    "/certifications/bulk",
+    response_model=schemas.BulkDeleteResult,
+    responses={
+        422: {"model": schemas.BulkErrorResponse},
+        500: {"model": schemas.ErrorResponse},
+    },
+)
+async def delete_certifications_bulk(
+    ids: List[int] = Query(..., max_length=BULK_MAX_ITEMS),
+    atomic: bool = Query(False),
+    session: AsyncSession = Depends(get_db),
+):
+    return await bulk_delete(
+        models.Certification,
+        ids,
+        certifications_service.delete_certifications,
+        session,
+        atomic=atomic,
+    )
+
+
 @router.get(
     "/certifications/{cert_id}",
     response_model=schemas.CertificationRead,
@@ -54,13 +144,13 @@ async def create_certification(
     },
 )
 async def get_certification(
-    cert_id: int = Path(..., gt=0), session: AsyncSession = Depends(get_db)
+    cert_id: int = Path(..., gt=0), session: AsyncSession = Depends(get_read_db)
 ):
     instance = await certifications_service.get_certification(cert_id, session)
     if not instance:
         logger.warning("Certification %s not found", cert_id)
         raise HTTPException(status_code=404, detail="Certification not found")
-    return instance
+    return struct_response(instance)
 
 
 @router.put(
@@ -1,12 +1,25 @@
-from typing import List
+from typing import Any, Dict, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Path, Query
+from fastapi import (
+    APIRouter,
+    Body,
+    Depends,
+    HTTPException,
+    Path,
+    Query,
+    Request,
+    Response,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from .. import schemas
-from app.db import get_db
+from .. import models, schemas
+from app.bulk import BULK_MAX_ITEMS, bulk_create, bulk_delete, bulk_update
+from app.db import get_db, get_read_db
+from app.etag import profile_list_etag
 from app.logger import logger
+from app.pagination import decode_cursor, set_next_cursor
 from app.services import contacts as contacts_service
+from app.structs import struct_response
 
 router = APIRouter()
 
@@ -14,20 +27,30 @@ router = APIRouter()
 @router.get(
     "/contacts",
     response_model=List[schemas.ContactRead],
+    dependencies=[Depends(profile_list_etag)],
     responses={
         404: {"model": schemas.ErrorResponse},
         500: {"model": schemas.ErrorResponse},
     },
 )
 async def list_contacts(
+    request: Request,
+    response: Response,
     profile_id: int = Query(None, gt=0),
     page: int = Query(1, gt=0),
     per_page: int = Query(20, gt=1, le=100),
-    session: AsyncSession = Depends(get_db),
+    cursor: Optional[str] = Query(None),
+    session: AsyncSession = Depends(get_read_db),
 ):
-    return await contacts_service.list_contacts(
-        profile_id, page=page, per_page=per_page, session=session
+    items = await contacts_service.list_contacts(
+        profile_id,
+        page=page,
+        per_page=per_page,
+        after=decode_cursor(cursor),
+        session=session,
     )
+    set_next_cursor(request, response, items, per_page)
+    return struct_response(items, response, request)
 
 
 @router.post(
@@ -45,6 +68,69 @@ async def create_contact(
     return await contacts_service.create_contact(data, session)
 
 
+@router.post(
+    "/contacts/bulk",
+    response_model=schemas.BulkResult[schemas.ContactRead],
+    responses={
+        422: {"model": schemas.BulkErrorResponse},
+        500: {"model": schemas.ErrorResponse},
+    },
+)
+async def create_contacts_bulk(
+    items: List[Dict[str, Any]] = Body(..., max_length=BULK_MAX_ITEMS),
+    atomic: bool = Query(False),
+    session: AsyncSession = Depends(get_db),
+):
+    return await bulk_create(
+        schemas.ContactCreate,
+        items,
+        contacts_service.create_contacts,
+        session,
+        atomic=atomic,
+    )
+
+
+@router.patch(
+    "/contacts/bulk",
+    response_model=schemas.BulkUpdateResult[schemas.ContactRead],
+    responses={
+        422: {"model": schemas.BulkErrorResponse},
+        500: {"model": schemas.ErrorResponse},
+    },
+)
+async def update_contacts_bulk(
+    items: List[Dict[str, Any]] = Body(..., max_length=BULK_MAX_ITEMS),
+    atomic: bool = Query(False),
+    session: AsyncSession = Depends(get_db),
+):
+    return await bulk_update(
+        schemas.ContactCreate,
+        models.Contact,
+        items,
+        contacts_service.update_contacts,
+        session,
+        atomic=atomic,
+    )
+
+
+@router.delete(
+    "/contacts/bulk",
+    response_model=schemas.BulkDeleteResult,
+    responses={
+        422: {"model": schemas.BulkErrorResponse},
+        500: {"model": schemas.ErrorResponse},
+    },
+)
+async def delete_contacts_bulk(
+    ids: List[int] = Query(..., max_length=BULK_MAX_ITEMS),
+    atomic: bool = Query(False),
+    session: AsyncSession = Depends(get_db),
+):
+    return await bulk_delete(
+        models.Contact, ids, contacts_service.delete_contacts, session, atomic=atomic
+    )
+
+
 @router.get(
     "/contacts/{contact_id}",
     response_model=schemas.ContactRead,
@@ -54,13 +140,13 @@ async def create_contact(
     },
 )
 async def get_contact(
-    contact_id: int = Path(..., gt=0), session: AsyncSession = Depends(get_db)
+    contact_id: int = Path(..., gt=0), session: AsyncSession = Depends(get_read_db)
 ):
     instance = await contacts_service.get_contact(contact_id, session)
     if not instance:
         logger.warning("Contact %s not found", contact_id)
         raise HTTPException(status_code=404, detail="Contact not found")
-    return instance
+    return struct_response(instance)
 
 
 @router.put(
@@ -1,12 +1,25 @@
-from typing import List
+from typing import Any, Dict, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Path, Query
+from fastapi import (
+    APIRouter,
+    Body,
+    Depends,
+    HTTPException,
+    Path,
+    Query,
+    Request,
+    Response,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from .. import schemas
-from app.db import get_db
+from .. import models, schemas
+from app.bulk import BULK_MAX_ITEMS, bulk_create, bulk_delete, bulk_update
+from app.db import get_db, get_read_db
+from app.etag import profile_list_etag
 from app.logger import logger
+from app.pagination import decode_cursor, set_next_cursor
 from app.services import educations as educations_service
+from app.structs import struct_response
 
 router = APIRouter()
 
@@ -14,20 +27,30 @@ router = APIRouter()
 @router.get(
     "/educations",
     response_model=List[schemas.EducationRead],
+    dependencies=[Depends(profile_list_etag)],
     responses={
         404: {"model": schemas.ErrorResponse},
         500: {"model": schemas.ErrorResponse},
     },
 )
 async def list_educations(
+    request: Request,
+    response: Response,
     profile_id: int = Query(None, gt=0),
     page: int = Query(1, gt=0),
     per_page: int = Query(20, gt=1, le=100),
-    session: AsyncSession = Depends(get_db),
+    cursor: Optional[str] = Query(None),
+    session: AsyncSession = Depends(get_read_db),
 ):
-    return await educations_service.list_educations(
-        profile_id, page=page, per_page=per_page, session=session
+    items = await educations_service.list_educations(
+        profile_id,
+        page=page,
+        per_page=per_page,
+        after=decode_cursor(cursor),
+        session=session,
     )
+    set_next_cursor(request, response, items, per_page)
+    return struct_response(items, response, request)
 
 
 @router.post(
@@ -45,6 +68,73 @@ async def create_education(
     return await educations_service.create_education(data, session)
 
 
+@router.post(
+    "/educations/bulk",
+    response_model=schemas.BulkResult[schemas.EducationRead],
+    responses={
+        422: {"model": schemas.BulkErrorResponse},
+        500: {"model": schemas.ErrorResponse},
+    },
+)
+async def create_educations_bulk(
+    items: List[Dict[str, Any]] = Body(..., max_length=BULK_MAX_ITEMS),
+    atomic: bool = Query(False),
+    session: AsyncSession = Depends(get_db),
+):
+    return await bulk_create(
+        schemas.EducationCreate,
+        items,
+        educations_service.create_educations,
+        session,
+        atomic=atomic,
+    )
+
+
+@router.patch(
+    "/educations/bulk",
+    response_model=schemas.BulkUpdateResult[schemas.EducationRead],
+    responses={
+        422: {"model": schemas.BulkErrorResponse},
+        500: {"model": schemas.ErrorResponse},
+    },
+)
+async def update_educations_bulk(
+    items: List[Dict[str, Any]] = Body(..., max_length=BULK_MAX_ITEMS),
+    atomic: bool = Query(False),
+    session: AsyncSession = Depends(get_db),
+):
+    return await bulk_update(
+        schemas.EducationCreate,
+        models.Education,
+        items,
+        educations_service.update_educations,
+        session,
+        atomic=atomic,
+    )
+
+
+@router.delete(
+    "/educations/bulk",
+    response_model=schemas.BulkDeleteResult,
+    responses={
+        422: {"model": schemas.BulkErrorResponse},
+        500: {"model": schemas.ErrorResponse},
+    },
+)
+async def delete_educations_bulk(
+    ids: List[int] = Query(..., max_length=BULK_MAX_ITEMS),
+    atomic: bool = Query(False),
+    session: AsyncSession = Depends(get_db),
+):
+    return await bulk_delete(
+        models.Education,
+        ids,
+        educations_service.delete_educations,
+        session,
+        atomic=atomic,
+    )
+
+
 @router.get(
     "/educations/{education_id}",
     response_model=schemas.EducationRead,
@@ -54,13 +144,13 @@ async def create_education(
     },
 )
 async def get_education(
-    education_id: int = Path(..., gt=0), session: AsyncSession = Depends(get_db)
+    education_id: int = Path(..., gt=0), session: AsyncSession = Depends(get_read_db)
 ):
     instance = await educations_service.get_education(education_id, session)
     if not instance:
         logger.warning("Education %s not found", education_id)
         raise HTTPException(status_code=404, detail="Education not found")
-    return instance
+    return struct_response(instance)
 
 
 @router.put(
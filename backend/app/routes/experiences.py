@@ -1,12 +1,25 @@
-from typing import List
+from typing import Any, Dict, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Path, Query
+from fastapi import (
+    APIRouter,
+    Body,
+    Depends,
+    HTTPException,
+    Path,
+    Query,
+    Request,
+    Response,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from .. import schemas
-from app.db import get_db
+from .. import models, schemas
+from app.bulk import BULK_MAX_ITEMS, bulk_create, bulk_delete, bulk_update
+from app.db import get_db, get_read_db
+from app.etag import profile_list_etag
 from app.logger import logger
+from app.pagination import decode_cursor, set_next_cursor
 from app.services import experiences as experiences_service
+from app.structs import struct_response
 
 router = APIRouter()
 
@@ -14,20 +27,34 @@ router = APIRouter()
 @router.get(
     "/experiences",
     response_model=List[schemas.ExperienceRead],
+    dependencies=[Depends(profile_list_etag)],
     responses={
         404: {"model": schemas.ErrorResponse},
         500: {"model": schemas.ErrorResponse},
     },
 )
 async def list_experiences(
+    request: Request,
+    response: Response,
     profile_id: int = Query(None, gt=0),
     page: int = Query(1, gt=0),
     per_page: int = Query(20, gt=1, le=100),
-    session: AsyncSession = Depends(get_db),
+    cursor: Optional[str] = Query(None),
+    skills_all: List[str] = Query(None),
+    skills_any: List[str] = Query(None),
+    session: AsyncSession = Depends(get_read_db),
 ):
-    return await experiences_service.list_experiences(
-        profile_id, page=page, per_page=per_page, session=session
+    items = await experiences_service.list_experiences(
+        profile_id,
+        page=page,
+        per_page=per_page,
+        after=decode_cursor(cursor),
+        skills_all=skills_all,
+        skills_any=skills_any,
+        session=session,
     )
+    set_next_cursor(request, response, items, per_page)
+    return struct_response(items, response, request)
 
 
 @router.post(
@@ -45,6 +72,73 @@ async def create_experience(
     return await experiences_service.create_experience(data, session)
 
 
+@router.post(
+    "/experiences/bulk",
+    response_model=schemas.BulkResult[schemas.ExperienceRead],
+    responses={
+        422: {"model": schemas.BulkErrorResponse},
+        500: {"model": schemas.ErrorResponse},
+    },
+)
+async def create_experiences_bulk(
+    items: List[Dict[str, Any]] = Body(..., max_length=BULK_MAX_ITEMS),
+    atomic: bool = Query(False),
+    session: AsyncSession = Depends(get_db),
+):
+    return await bulk_create(
+        schemas.ExperienceCreate,
+        items,
+        experiences_service.create_experiences,
+        session,
+        atomic=atomic,
+    )
+
+
+@router.patch(
+    "/experiences/bulk",
+    response_model=schemas.BulkUpdateResult[schemas.ExperienceRead],
+    responses={
+        422: {"model": schemas.BulkErrorResponse},
+        500: {"model": schemas.ErrorResponse},
+    },
+)
+async def update_experiences_bulk(
+    items: List[Dict[str, Any]] = Body(..., max_length=BULK_MAX_ITEMS),
+    atomic: bool = Query(False),
+    session: AsyncSession = Depends(get_db),
+):
+    return await bulk_update(
+        schemas.ExperienceCreate,
+        models.Experience,
+        items,
+        experiences_service.update_experiences,
+        session,
+        atomic=atomic,
+    )
+
+
+@router.delete(
+    "/experiences/bulk",
+    response_model=schemas.BulkDeleteResult,
+    responses={
+        422: {"model": schemas.BulkErrorResponse},
+        500: {"model": schemas.ErrorResponse},
+    },
+)
+async def delete_experiences_bulk(
+    ids: List[int] = Query(..., max_length=BULK_MAX_ITEMS),
+    atomic: bool = Query(False),
+    session: AsyncSession = Depends(get_db),
+):
+    return await bulk_delete(
+        models.Experience,
+        ids,
+        experiences_service.delete_experiences,
+        session,
+        atomic=atomic,
+    )
+
+
 @router.get(
     "/experiences/{experience_id}",
     response_model=schemas.ExperienceRead,
@@ -54,13 +148,13 @@ async def create_experience(
     },
 )
 async def get_experience(
-    experience_id: int = Path(..., gt=0), session: AsyncSession = Depends(get_db)
+    experience_id: int = Path(..., gt=0), session: AsyncSession = Depends(get_read_db)
 ):
     instance = await experiences_service.get_experience(experience_id, session)
     if not instance:
         logger.warning("Experience %s not found", experience_id)
         raise HTTPException(status_code=404, detail="Experience not found")
-    return instance
+    return struct_response(instance)
 
 
 @router.put(
@@ -1,12 +1,25 @@
-from typing import List
+from typing import Any, Dict, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Path, Query
+from fastapi import (
+    APIRouter,
+    Body,
+    Depends,
+    HTTPException,
+    Path,
+    Query,
+    Request,
+    Response,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from .. import schemas
-from app.db import get_db
+from .. import models, schemas
+from app.bulk import BULK_MAX_ITEMS, bulk_create, bulk_delete, bulk_update
+from app.db import get_db, get_read_db
+from app.etag import profile_list_etag
 from app.logger import logger
+from app.pagination import decode_cursor, set_next_cursor
 from app.services import portfolio_items as portfolio_items_service
+from app.structs import struct_response
 
 router = APIRouter()
 
@@ -14,20 +27,34 @@ router = APIRouter()
 @router.get(
     "/portfolio-items",
     response_model=List[schemas.PortfolioItemRead],
+    dependencies=[Depends(profile_list_etag)],
     responses={
         404: {"model": schemas.ErrorResponse},
         500: {"model": schemas.ErrorResponse},
     },
 )
 async def list_portfolio_items(
+    request: Request,
+    response: Response,
     profile_id: int = Query(None, gt=0),
     page: int = Query(1, gt=0),
     per_page: int = Query(20, gt=1, le=100),
-    session: AsyncSession = Depends(get_db),
+    cursor: Optional[str] = Query(None),
+    skills_all: List[str] = Query(None),
+    skills_any: List[str] = Query(None),
+    session: AsyncSession = Depends(get_read_db),
 ):
-    return await portfolio_items_service.list_portfolio_items(
-        profile_id, page=page, per_page=per_page, session=session
+    items = await portfolio_items_service.list_portfolio_items(
+        profile_id,
+        page=page,
+        per_page=per_page,
+        after=decode_cursor(cursor),
+        skills_all=skills_all,
+        skills_any=skills_any,
+        session=session,
     )
+    set_next_cursor(request, response, items, per_page)
+    return struct_response(items, response, request)
 
 
 @router.post(
@@ -45,6 +72,73 @@ async def create_portfolio_item(
     return await portfolio_items_service.create_portfolio_item(data, session)
 
 
+@router.post(
+    "/portfolio-items/bulk",
+    response_model=schemas.BulkResult[schemas.PortfolioItemRead],
+    responses={
+        422: {"model": schemas.BulkErrorResponse},
+        500: {"model": schemas.ErrorResponse},
+    },
+)
+async def create_portfolio_items_bulk(
+    items: List[Dict[str, Any]] = Body(..., max_length=BULK_MAX_ITEMS),
+    atomic: bool = Query(False),
+    session: AsyncSession = Depends(get_db),
+):
+    return await bulk_create(
+        schemas.PortfolioItemCreate,
+        items,
+        portfolio_items_service.create_portfolio_items,
+        session,
+        atomic=atomic,
+    )
+
+
+@router.patch(
+    "/portfolio-items/bulk",
+    response_model=schemas.BulkUpdateResult[schemas.PortfolioItemRead],
+    responses={
+        422: {"model": schemas.BulkErrorResponse},
+        500: {"model": schemas.ErrorResponse},
+    },
+)
+async def update_portfolio_items_bulk(
+    items: List[Dict[str, Any]] = Body(..., max_length=BULK_MAX_ITEMS),
+    atomic: bool = Query(False),
+    session: AsyncSession = Depends(get_db),
+):
+    return await bulk_update(
+        schemas.PortfolioItemCreate,
+        models.PortfolioItem,
+        items,
+        portfolio_items_service.update_portfolio_items,
+        session,
+        atomic=atomic,
+    )
+
+
+@router.delete(
+    "/portfolio-items/bulk",
+    response_model=schemas.BulkDeleteResult,
+    responses={
+        422: {"model": schemas.BulkErrorResponse},
+        500: {"model": schemas.ErrorResponse},
+    },
+)
+async def delete_portfolio_items_bulk(
+    ids: List[int] = Query(..., max_length=BULK_MAX_ITEMS),
+    atomic: bool = Query(False),
+    session: AsyncSession = Depends(get_db),
+):
+    return await bulk_delete(
+        models.PortfolioItem,
+        ids,
+        portfolio_items_service.delete_portfolio_items,
+        session,
+        atomic=atomic,
+    )
+
+
 @router.get(
     "/portfolio-items/{item_id}",
     response_model=schemas.PortfolioItemRead,
@@ -54,13 +148,13 @@ async def create_portfolio_item(
     },
 )
 async def get_portfolio_item(
-    item_id: int = Path(..., gt=0), session: AsyncSession = Depends(get_db)
+    item_id: int = Path(..., gt=0), session: AsyncSession = Depends(get_read_db)
 ):
     instance = await portfolio_items_service.get_portfolio_item(item_id, session)
     if not instance:
         logger.warning("Portfolio item %s not found", item_id)
         raise HTTPException(status_code=404, detail="Portfolio item not found")
-    return instance
+    return struct_response(instance)
 
 
 @router.put(
@@ -1,31 +1,171 @@
-from fastapi import APIRouter, Depends, HTTPException, Path
+from typing import Any, Dict, FrozenSet, List, Optional
+
+from fastapi import (
+    APIRouter,
+    Body,
+    Depends,
+    Header,
+    HTTPException,
+    Path,
+    Query,
+    Request,
+    Response,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from .. import schemas
-from app.db import get_db
+from app.bulk import BULK_MAX_ITEMS, bulk_create
+from app.compression import negotiate
+from app.db import get_db, get_read_db
+from app.etag import body_etag, etag_matches, not_modified, profile_etag
 from app.logger import logger
+from app.pagination import decode_cursor, set_next_cursor
 from app.services import profile as profile_service
 
 router = APIRouter()
 
+PROFILES_MAX_IDS = 100
+
+
+def _profile_ids(values: List[str]) -> List[int]:
+    """Accepts ``ids=1,2,3`` as well as repeated ``ids=1&ids=2``."""
+    try:
+        ids = [int(part) for value in values for part in value.split(",") if part]
+    except ValueError:
+        raise HTTPException(status_code=400, detail="ids must be integers")
+    if len(ids) > PROFILES_MAX_IDS:
+        raise HTTPException(
+            status_code=400, detail=f"At most {PROFILES_MAX_IDS} ids per request"
+        )
+    return ids
+
+
+@router.get(
+    "/profiles",
+    response_model=List[schemas.ProfileRead],
+    responses={
+        400: {"model": schemas.ErrorResponse},
+        500: {"model": schemas.ErrorResponse},
+    },
+)
+async def list_profiles(
+    request: Request,
+    ids: Optional[List[str]] = Query(
+        None, description="Profile ids, comma-separated or repeated"
+    ),
+    page: int = Query(1, gt=0),
+    per_page: int = Query(20, gt=1, le=100),
+    cursor: Optional[str] = Query(None),
+    session: AsyncSession = Depends(get_read_db),
+):
+    """The given profiles in request order, or a page of all profiles."""
+    rows = None
+    if ids is not None:
+        profile_ids = _profile_ids(ids)
+    else:
+        rows = await profile_service.list_profile_ids(
+            page=page, per_page=per_page, after=decode_cursor(cursor), session=session
+        )
+        profile_ids = [row.id for row in rows]
+    logger.info("Fetching profiles ids=%s", profile_ids)
+    body = await profile_service.get_profiles_json(profile_ids, session)
+    etag = body_etag(body)
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return not_modified(etag)
+    # already validated and encoded by the service layer
+    response = Response(
+        content=body, media_type="application/json", headers={"ETag": etag}
+    )
+    if rows is not None:
+        set_next_cursor(request, response, rows, per_page)
+    return response
+
+
+def _sections(
+    include: Optional[str], fields: Optional[str]
+) -> Optional[FrozenSet[str]]:
+    """Parses ``include`` and ``fields`` into the document sections to return."""
+    if include is None and fields is None:
+        return None
+    sections = {"id"}
+    for value, allowed in (
+        (include, profile_service.PROFILE_RELATIONS),
+        (fields, profile_service.PROFILE_COLUMNS),
+    ):
+        names = (
+            set(allowed)
+            if value is None
+            else {name.strip() for name in value.split(",") if name.strip()}
+        )
+        unknown = names - set(allowed)
+        if unknown:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unknown section(s): {', '.join(sorted(unknown))}",
+            )
+        sections |= names
+    return frozenset(sections)
+
 
 @router.get(
     "/profiles/{profile_id}",
     response_model=schemas.ProfileRead,
     responses={
+        400: {"model": schemas.ErrorResponse},
         404: {"model": schemas.ErrorResponse},
         500: {"model": schemas.ErrorResponse},
     },
 )
 async def get_profile(
-    profile_id: int = Path(..., gt=0), session: AsyncSession = Depends(get_db)
+    profile_id: int = Path(..., gt=0),
+    include: Optional[str] = Query(
+        None, description="Comma-separated relations to return; empty for none"
+    ),
+    fields: Optional[str] = Query(
+        None, description="Comma-separated profile columns to return"
+    ),
+    if_none_match: Optional[str] = Header(None),
+    accept_encoding: Optional[str] = Header(None),
+    session: AsyncSession = Depends(get_read_db),
 ):
     logger.info("Fetching profile id=%s", profile_id)
-    profile = await profile_service.get_profile(profile_id, session)
-    if not profile:
+    sections = _sections(include, fields)
+    variant = sorted(sections or ())
+    body = None
+    version = await profile_service.get_profile_version(profile_id, session)
+    if version is not None:
+        # CompressionMiddleware gives each content coding its own ETag
+        etag = profile_etag(profile_id, version, *variant)
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+        if sections is None:
+            # full documents are served from precompressed cache entries
+            result = await profile_service.get_profile_body(
+                profile_id, session, version, negotiate(accept_encoding)
+            )
+            if result is not None:
+                body, content_encoding, loaded_version = result
+        else:
+            result = await profile_service.get_profile_sections_json(
+                profile_id, sections, session, version
+            )
+            if result is not None:
+                body, loaded_version = result
+            content_encoding = None
+    if body is None:
         logger.warning("Profile id=%s not found", profile_id)
         raise HTTPException(status_code=404, detail="Profile not found")
-    return profile
+    if loaded_version != version:
+        # a snapshot newer than the version read above is served as is, so
+        # the ETag names the version the document was built at
+        etag = profile_etag(profile_id, loaded_version, *variant)
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+    headers = {"ETag": etag}
+    if content_encoding:
+        headers["Content-Encoding"] = content_encoding
+    # already validated and encoded by the service layer
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 @router.put(
@@ -43,8 +183,30 @@ async def update_profile(
 ):
     data = profile.model_dump(exclude_unset=True)
     logger.info("Updating profile id=%s with data=%s", profile_id, data)
-    profile_obj = await profile_service.update_profile(profile_id, data, session)
-    if not profile_obj:
+    body = await profile_service.update_profile(profile_id, data, session)
+    if body is None:
         logger.warning("Profile id=%s not found for update", profile_id)
         raise HTTPException(status_code=404, detail="Profile not found")
-    return profile_obj
+    return Response(content=body, media_type="application/json")
+
+
+@router.post(
+    "/profiles/bulk",
+    response_model=schemas.BulkResult[schemas.ProfileRead],
+    responses={
+        422: {"model": schemas.BulkErrorResponse},
+        500: {"model": schemas.ErrorResponse},
+    },
+)
+async def create_profiles_bulk(
+    items: List[Dict[str, Any]] = Body(..., max_length=BULK_MAX_ITEMS),
+    atomic: bool = Query(False),
+    session: AsyncSession = Depends(get_db),
+):
+    return await bulk_create(
+        schemas.ProfileCreate,
+        items,
+        profile_service.create_profiles,
+        session,
+        atomic=atomic,
+    )
@@ -1,12 +1,25 @@
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Path, Query
+from fastapi import (
+    APIRouter,
+    Body,
+    Depends,
+    HTTPException,
+    Path,
+    Query,
+    Request,
+    Response,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from .. import schemas
-from app.db import get_db
+from .. import models, schemas
+from app.bulk import BULK_MAX_ITEMS, bulk_create, bulk_delete, bulk_update
+from app.db import get_db, get_read_db
+from app.etag import profile_list_etag
 from app.logger import logger
+from app.pagination import decode_cursor, set_next_cursor
 from app.services import projects as projects_service
+from app.structs import struct_response
 
 router = APIRouter()
 
@@ -14,21 +27,36 @@ router = APIRouter()
 @router.get(
     "/projects",
     response_model=List[schemas.ProjectRead],
+    dependencies=[Depends(profile_list_etag)],
     responses={
         404: {"model": schemas.ErrorResponse},
         500: {"model": schemas.ErrorResponse},
     },
 )
 async def list_projects(
+    request: Request,
+    response: Response,
     profile_id: int = Query(None, gt=0),
     skill: Optional[str] = Query(None),
     page: int = Query(1, gt=0),
     per_page: int = Query(20, gt=1, le=100),
-    session: AsyncSession = Depends(get_db),
+    cursor: Optional[str] = Query(None),
+    skills_all: List[str] = Query(None),
+    skills_any: List[str] = Query(None),
+    session: AsyncSession = Depends(get_read_db),
 ):
-    return await projects_service.list_projects(
-        profile_id, skill, page=page, per_page=per_page, session=session
+    items = await projects_service.list_projects(
+        profile_id,
+        skill,
+        page=page,
+        per_page=per_page,
+        after=decode_cursor(cursor),
+        skills_all=skills_all,
+        skills_any=skills_any,
+        session=session,
     )
+    set_next_cursor(request, response, items, per_page)
+    return struct_response(items, response, request)
 
 
 @router.post(
@@ -46,6 +74,69 @@ async def create_project(
     return await projects_service.create_project(data, session)
 
 
+@router.post(
+    "/projects/bulk",
+    response_model=schemas.BulkResult[schemas.ProjectRead],
+    responses={
+        422: {"model": schemas.BulkErrorResponse},
+        500: {"model": schemas.ErrorResponse},
+    },
+)
+async def create_projects_bulk(
+    items: List[Dict[str, Any]] = Body(..., max_length=BULK_MAX_ITEMS),
+    atomic: bool = Query(False),
+    session: AsyncSession = Depends(get_db),
+):
+    return await bulk_create(
+        schemas.ProjectCreate,
+        items,
+        projects_service.create_projects,
+        session,
+        atomic=atomic,
+    )
+
+
+@router.patch(
+    "/projects/bulk",
+    response_model=schemas.BulkUpdateResult[schemas.ProjectRead],
+    responses={
+        422: {"model": schemas.BulkErrorResponse},
+        500: {"model": schemas.ErrorResponse},
+    },
+)
+async def update_projects_bulk(
+    items: List[Dict[str, Any]] = Body(..., max_length=BULK_MAX_ITEMS),
+    atomic: bool = Query(False),
+    session: AsyncSession = Depends(get_db),
+):
+    return await bulk_update(
+        schemas.ProjectCreate,
+        models.Project,
+        items,
+        projects_service.update_projects,
+        session,
+        atomic=atomic,
+    )
+
+
+@router.delete(
+    "/projects/bulk",
+    response_model=schemas.BulkDeleteResult,
+    responses={
+        422: {"model": schemas.BulkErrorResponse},
+        500: {"model": schemas.ErrorResponse},
+    },
+)
+async def delete_projects_bulk(
+    ids: List[int] = Query(..., max_length=BULK_MAX_ITEMS),
+    atomic: bool = Query(False),
+    session: AsyncSession = Depends(get_db),
+):
+    return await bulk_delete(
+        models.Project, ids, projects_service.delete_projects, session, atomic=atomic
+    )
+
+
 @router.get(
     "/projects/{project_id}",
     response_model=schemas.ProjectRead,
@@ -55,13 +146,13 @@ async def create_project(
     },
 )
 async def get_project(
-    project_id: int = Path(..., gt=0), session: AsyncSession = Depends(get_db)
+    project_id: int = Path(..., gt=0), session: AsyncSession = Depends(get_read_db)
 ):
     instance = await projects_service.get_project(project_id, session)
     if not instance:
         logger.warning("Project %s not found", project_id)
         raise HTTPException(status_code=404, detail="Project not found")
-    return instance
+    return struct_response(instance)
 
 
 @router.put(
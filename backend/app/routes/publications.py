@@ -1,12 +1,25 @@
-from typing import List
+from typing import Any, Dict, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Path, Query
+from fastapi import (
+    APIRouter,
+    Body,
+    Depends,
+    HTTPException,
+    Path,
+    Query,
+    Request,
+    Response,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from .. import schemas
-from app.db import get_db
+from .. import models, schemas
+from app.bulk import BULK_MAX_ITEMS, bulk_create, bulk_delete, bulk_update
+from app.db import get_db, get_read_db
+from app.etag import profile_list_etag
 from app.logger import logger
+from app.pagination import decode_cursor, set_next_cursor
 from app.services import publications as publications_service
+from app.structs import struct_response
 
 router = APIRouter()
 
@@ -14,20 +27,30 @@ router = APIRouter()
 @router.get(
     "/publications",
     response_model=List[schemas.PublicationRead],
+    dependencies=[Depends(profile_list_etag)],
     responses={
         404: {"model": schemas.ErrorResponse},
         500: {"model": schemas.ErrorResponse},
     },
 )
 async def list_publications(
+    request: Request,
+    response: Response,
     profile_id: int = Query(None, gt=0),
     page: int = Query(1, gt=0),
     per_page: int = Query(20, gt=1, le=100),
-    session: AsyncSession = Depends(get_db),
+    cursor: Optional[str] = Query(None),
+    session: AsyncSession = Depends(get_read_db),
 ):
-    return await publications_service.list_publications(
-        profile_id, page=page, per_page=per_page, session=session
+    items = await publications_service.list_publications(
+        profile_id,
+        page=page,
+        per_page=per_page,
+        after=decode_cursor(cursor),
+        session=session,
     )
+    set_next_cursor(request, response, items, per_page)
+    return struct_response(items, response, request)
 
 
 @router.post(
@@ -45,6 +68,73 @@ async def create_publication(
     return await publications_service.create_publication(data, session)
 
 
+@router.post(
+    "/publications/bulk",
+    response_model=schemas.BulkResult[schemas.PublicationRead],
+    responses={
+        422: {"model": schemas.BulkErrorResponse},
+        500: {"model": schemas.ErrorResponse},
+    },
+)
+async def create_publications_bulk(
+    items: List[Dict[str, Any]] = Body(..., max_length=BULK_MAX_ITEMS),
+    atomic: bool = Query(False),
+    session: AsyncSession = Depends(get_db),
+):
+    return await bulk_create(
+        schemas.PublicationCreate,
+        items,
+        publications_service.create_publications,
+        session,
+        atomic=atomic,
+    )
+
+
+@router.patch(
+    "/publications/bulk",
+    response_model=schemas.BulkUpdateResult[schemas.PublicationRead],
+    responses={
+        422: {"model": schemas.BulkErrorResponse},
+        500: {"model": schemas.ErrorResponse},
+    },
+)
+async def update_publications_bulk(
+    items: List[Dict[str, Any]] = Body(..., max_length=BULK_MAX_ITEMS),
+    atomic: bool = Query(False),
+    session: AsyncSession = Depends(get_db),
+):
+    return await bulk_update(
+        schemas.PublicationCreate,
+        models.Publication,
+        items,
+        publications_service.update_publications,
+        session,
+        atomic=atomic,
+    )
+
+
+@router.delete(
+    "/publications/bulk",
+    response_model=schemas.BulkDeleteResult,
+    responses={
+        422: {"model": schemas.BulkErrorResponse},
+        500: {"model": schemas.ErrorResponse},
+    },
+)
+async def delete_publications_bulk(
+    ids: List[int] = Query(..., max_length=BULK_MAX_ITEMS),
+    atomic: bool = Query(False),
+    session: AsyncSession = Depends(get_db),
+):
+    return await bulk_delete(
+        models.Publication,
+        ids,
+        publications_service.delete_publications,
+        session,
+        atomic=atomic,
+    )
+
+
 @router.get(
     "/publications/{pub_id}",
     response_model=schemas.PublicationRead,
@@ -54,13 +144,13 @@ async def create_publication(
     },
 )
 async def get_publication(
-    pub_id: int = Path(..., gt=0), session: AsyncSession = Depends(get_db)
+    pub_id: int = Path(..., gt=0), session: AsyncSession = Depends(get_read_db)
 ):
     instance = await publications_service.get_publication(pub_id, session)
     if not instance:
         logger.warning("Publication %s not found", pub_id)
         raise HTTPException(status_code=404, detail="Publication not found")
-    return instance
+    return struct_response(instance)
 
 
 @router.put(
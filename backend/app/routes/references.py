@@ -1,12 +1,25 @@
-from typing import List
+from typing import Any, Dict, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Path, Query
+from fastapi import (
+    APIRouter,
+    Body,
+    Depends,
+    HTTPException,
+    Path,
+    Query,
+    Request,
+    Response,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from .. import schemas
-from app.db import get_db
+from .. import models, schemas
+from app.bulk import BULK_MAX_ITEMS, bulk_create, bulk_delete, bulk_update
+from app.db import get_db, get_read_db
+from app.etag import profile_list_etag
 from app.logger import logger
+from app.pagination import decode_cursor, set_next_cursor
 from app.services import references as references_service
+from app.structs import struct_response
 
 router = APIRouter()
 
@@ -14,16 +27,20 @@ router = APIRouter()
 @router.get(
     "/references",
     response_model=List[schemas.ReferenceRead],
+    dependencies=[Depends(profile_list_etag)],
     responses={
         404: {"model": schemas.ErrorResponse},
         500: {"model": schemas.ErrorResponse},
     },
 )
 async def list_references(
+    request: Request,
+    response: Response,
     profile_id: int = Query(None, gt=0),
     page: int = Query(1, gt=0),
     per_page: int = Query(20, gt=1, le=100),
-    session: AsyncSession = Depends(get_db),
+    cursor: Optional[str] = Query(None),
+    session: AsyncSession = Depends(get_read_db),
 ):
     logger.info(
         "Listing references (profile_id=%s page=%s per_page=%s)",
@@ -31,9 +48,15 @@ async def list_references(
         page,
         per_page,
     )
-    return await references_service.list_references(
-        profile_id, page=page, per_page=per_page, session=session
+    items = await references_service.list_references(
+        profile_id,
+        page=page,
+        per_page=per_page,
+        after=decode_cursor(cursor),
+        session=session,
     )
+    set_next_cursor(request, response, items, per_page)
+    return struct_response(items, response, request)
 
 
 @router.post(
@@ -52,6 +75,73 @@ async def create_reference(
     return await references_service.create_reference(data, session)
 
 
+@router.post(
+    "/references/bulk",
+    response_model=schemas.BulkResult[schemas.ReferenceRead],
+    responses={
+        422: {"model": schemas.BulkErrorResponse},
+        500: {"model": schemas.ErrorResponse},
+    },
+)
+async def create_references_bulk(
+    items: List[Dict[str, Any]] = Body(..., max_length=BULK_MAX_ITEMS),
+    atomic: bool = Query(False),
+    session: AsyncSession = Depends(get_db),
+):
+    return await bulk_create(
+        schemas.ReferenceCreate,
+        items,
+        references_service.create_references,
+        session,
+        atomic=atomic,
+    )
+
+
+@router.patch(
+    "/references/bulk",
+    response_model=schemas.BulkUpdateResult[schemas.ReferenceRead],
+    responses={
+        422: {"model": schemas.BulkErrorResponse},
+        500: {"model": schemas.ErrorResponse},
+    },
+)
+async def update_references_bulk(
+    items: List[Dict[str, Any]] = Body(..., max_length=BULK_MAX_ITEMS),
+    atomic: bool = Query(False),
+    session: AsyncSession = Depends(get_db),
+):
+    return await bulk_update(
+        schemas.ReferenceCreate,
+        models.Reference,
+        items,
+        references_service.update_references,
+        session,
+        atomic=atomic,
+    )
+
+
+@router.delete(
+    "/references/bulk",
+    response_model=schemas.BulkDeleteResult,
+    responses={
+        422: {"model": schemas.BulkErrorResponse},
+        500: {"model": schemas.ErrorResponse},
+    },
+)
+async def delete_references_bulk(
+    ids: List[int] = Query(..., max_length=BULK_MAX_ITEMS),
+    atomic: bool = Query(False),
+    session: AsyncSession = Depends(get_db),
+):
+    return await bulk_delete(
+        models.Reference,
+        ids,
+        references_service.delete_references,
+        session,
+        atomic=atomic,
+    )
+
+
 @router.get(
     "/references/{ref_id}",
     response_model=schemas.ReferenceRead,
@@ -61,14 +151,14 @@ async def create_reference(
     },
 )
 async def get_reference(
-    ref_id: int = Path(..., gt=0), session: AsyncSession = Depends(get_db)
+    ref_id: int = Path(..., gt=0), session: AsyncSession = Depends(get_read_db)
 ):
     logger.info("Fetching reference id=%s", ref_id)
     instance = await references_service.get_reference(ref_id, session)
     if not instance:
         logger.warning("Reference %s not found", ref_id)
         raise HTTPException(status_code=404, detail="Reference not found")
-    return instance
+    return struct_response(instance)
 
 
 @router.put(
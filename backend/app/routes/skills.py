@@ -1,11 +1,24 @@
-from typing import List
-
-from fastapi import APIRouter, Depends, HTTPException, Path, Query
+from typing import Any, Dict, List, Optional
+
+from fastapi import (
+    APIRouter,
+    Body,
+    Depends,
+    HTTPException,
+    Path,
+    Query,
+    Request,
+    Response,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from .. import schemas
-from app.db import get_db
+from .. import models, schemas
+from app.bulk import BULK_MAX_ITEMS, bulk_create, bulk_delete, bulk_update
+from app.db import get_db, get_read_db
+from app.etag import profile_list_etag
+from app.pagination import decode_cursor, set_next_cursor
 from app.services import skills as skills_service
+from app.structs import struct_response
 
 router = APIRouter()
 
@@ -13,44 +26,75 @@ router = APIRouter()
 @router.get(
     "/skills/top",
     response_model=List[schemas.SkillRead],
+    dependencies=[Depends(profile_list_etag)],
     responses={
         404: {"model": schemas.ErrorResponse},
         500: {"model": schemas.ErrorResponse},
     },
 )
-async def top_skills(limit: int = 10, session: AsyncSession = Depends(get_db)):
-    return await skills_service.top_skills(limit=limit, session=session)
+async def top_skills(
+    request: Request,
+    response: Response,
+    profile_id: int = Query(None, gt=0),
+    limit: int = Query(10, gt=0, le=100),
+    session: AsyncSession = Depends(get_read_db),
+):
+    items = await skills_service.top_skills(
+        limit=limit, profile_id=profile_id, session=session
+    )
+    return struct_response(items, response, request)
 
 
 @router.get(
     "/skills/search",
     response_model=List[schemas.SkillRead],
+    dependencies=[Depends(profile_list_etag)],
     responses={
         404: {"model": schemas.ErrorResponse},
         500: {"model": schemas.ErrorResponse},
     },
 )
-async def search_skills(q: str = Query(...), session: AsyncSession = Depends(get_db)):
-    return await skills_service.search_skills(q=q, session=session)
+async def search_skills(
+    request: Request,
+    response: Response,
+    q: str = Query(..., min_length=1),
+    profile_id: int = Query(None, gt=0),
+    limit: int = Query(20, gt=0, le=100),
+    session: AsyncSession = Depends(get_read_db),
+):
+    items = await skills_service.search_skills(
+        q=q, profile_id=profile_id, limit=limit, session=session
+    )
+    return struct_response(items, response, request)
 
 
 @router.get(
     "/skills",
     response_model=List[schemas.SkillRead],
+    dependencies=[Depends(profile_list_etag)],
     responses={
         404: {"model": schemas.ErrorResponse},
         500: {"model": schemas.ErrorResponse},
     },
 )
 async def list_skills(
+    request: Request,
+    response: Response,
     profile_id: int = Query(None, gt=0),
     page: int = Query(1, gt=0),
     per_page: int = Query(20, gt=1, le=100),
-    session: AsyncSession = Depends(get_db),
+    cursor: Optional[str] = Query(None),
+    session: AsyncSession = Depends(get_read_db),
 ):
-    return await skills_service.list_skills(
-        profile_id, page=page, per_page=per_page, session=session
+    items = await skills_service.list_skills(
+        profile_id,
+        page=page,
+        per_page=per_page,
+        after=decode_cursor(cursor),
+        session=session,
     )
+    set_next_cursor(request, response, items, per_page)
+    return struct_response(items, response, request)
 
 
 @router.post(
@@ -68,6 +112,69 @@ async def create_skill(
     return await skills_service.create_skill(data, session)
 
 
+@router.post(
+    "/skills/bulk",
+    response_model=schemas.BulkResult[schemas.SkillRead],
+    responses={
+        422: {"model": schemas.BulkErrorResponse},
+        500: {"model": schemas.ErrorResponse},
+    },
+)
+async def create_skills_bulk(
+    items: List[Dict[str, Any]] = Body(..., max_length=BULK_MAX_ITEMS),
+    atomic: bool = Query(False),
+    session: AsyncSession = Depends(get_db),
+):
+    return await bulk_create(
+        schemas.SkillCreate,
+        items,
+        skills_service.create_skills,
+        session,
+        atomic=atomic,
+    )
+
+
+@router.patch(
+    "/skills/bulk",
+    response_model=schemas.BulkUpdateResult[schemas.SkillRead],
+    responses={
+        422: {"model": schemas.BulkErrorResponse},
+        500: {"model": schemas.ErrorResponse},
+    },
+)
+async def update_skills_bulk(
+    items: List[Dict[str, Any]] = Body(..., max_length=BULK_MAX_ITEMS),
+    atomic: bool = Query(False),
+    session: AsyncSession = Depends(get_db),
+):
+    return await bulk_update(
+        schemas.SkillCreate,
+        models.Skill,
+        items,
+        skills_service.update_skills,
+        session,
+        atomic=atomic,
+    )
+
+
+@router.delete(
+    "/skills/bulk",
+    response_model=schemas.BulkDeleteResult,
+    responses={
+        422: {"model": schemas.BulkErrorResponse},
+        500: {"model": schemas.ErrorResponse},
+    },
+)
+async def delete_skills_bulk(
+    ids: List[int] = Query(..., max_length=BULK_MAX_ITEMS),
+    atomic: bool = Query(False),
+    session: AsyncSession = Depends(get_db),
+):
+    return await bulk_delete(
+        models.Skill, ids, skills_service.delete_skills, session, atomic=atomic
+    )
+
+
 @router.get(
     "/skills/{skill_id}",
     response_model=schemas.SkillRead,
@@ -77,12 +184,12 @@ async def create_skill(
     },
 )
 async def get_skill(
-    skill_id: int = Path(..., gt=0), session: AsyncSession = Depends(get_db)
+    skill_id: int = Path(..., gt=0), session: AsyncSession = Depends(get_read_db)
 ):
     instance = await skills_service.get_skill(skill_id, session)
     if not instance:
         raise HTTPException(status_code=404, detail="Skill not found")
-    return instance
+    return struct_response(instance)
 
 
 @router.put(
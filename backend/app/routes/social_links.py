@@ -1,12 +1,25 @@
-from typing import List
+from typing import Any, Dict, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Path, Query
+from fastapi import (
+    APIRouter,
+    Body,
+    Depends,
+    HTTPException,
+    Path,
+    Query,
+    Request,
+    Response,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from .. import schemas
-from app.db import get_db
+from .. import models, schemas
+from app.bulk import BULK_MAX_ITEMS, bulk_create, bulk_delete, bulk_update
+from app.db import get_db, get_read_db
+from app.etag import profile_list_etag
 from app.logger import logger
+from app.pagination import decode_cursor, set_next_cursor
 from app.services import social_links as social_links_service
+from app.structs import struct_response
 
 router = APIRouter()
 
@@ -14,16 +27,20 @@ router = APIRouter()
 @router.get(
     "/social-links",
     response_model=List[schemas.SocialLinkRead],
+    dependencies=[Depends(profile_list_etag)],
     responses={
         404: {"model": schemas.ErrorResponse},
         500: {"model": schemas.ErrorResponse},
     },
 )
 async def list_social_links(
+    request: Request,
+    response: Response,
     profile_id: int = Query(None, gt=0),
     page: int = Query(1, gt=0),
     per_page: int = Query(20, gt=1, le=100),
-    session: AsyncSession = Depends(get_db),
+    cursor: Optional[str] = Query(None),
+    session: AsyncSession = Depends(get_read_db),
 ):
     logger.info(
         "Listing social links (profile_id=%s page=%s per_page=%s)",
@@ -31,9 +48,15 @@ async def list_social_links(
         page,
         per_page,
     )
-    return await social_links_service.list_social_links(
-        profile_id, page=page, per_page=per_page, session=session
+    items = await social_links_service.list_social_links(
+        profile_id,
+        page=page,
+        per_page=per_page,
+        after=decode_cursor(cursor),
+        session=session,
     )
+    set_next_cursor(request, response, items, per_page)
+    return struct_response(items, response, request)
 
 
 @router.post(
@@ -52,6 +75,73 @@ async def create_social_link(
     return await social_links_service.create_social_link(data, session)
 
 
+@router.post(
+    "/social-links/bulk",
+    response_model=schemas.BulkResult[schemas.SocialLinkRead],
+    responses={
+        422: {"model": schemas.BulkErrorResponse},
+        500: {"model": schemas.ErrorResponse},
+    },
+)
+async def create_social_links_bulk(
+    items: List[Dict[str, Any]] = Body(..., max_length=BULK_MAX_ITEMS),
+    atomic: bool = Query(False),
+    session: AsyncSession = Depends(get_db),
+):
+    return await bulk_create(
+        schemas.SocialLinkCreate,
+        items,
+        social_links_service.create_social_links,
+        session,
+        atomic=atomic,
+    )
+
+
+@router.patch(
+    "/social-links/bulk",
+    response_model=schemas.BulkUpdateResult[schemas.SocialLinkRead],
+    responses={
+        422: {"model": schemas.BulkErrorResponse},
+        500: {"model": schemas.ErrorResponse},
+    },
+)
+async def update_social_links_bulk(
+    items: List[Dict[str, Any]] = Body(..., max_length=BULK_MAX_ITEMS),
+    atomic: bool = Query(False),
+    session: AsyncSession = Depends(get_db),
+):
+    return await bulk_update(
+        schemas.SocialLinkCreate,
+        models.SocialLink,
+        items,
+        social_links_service.update_social_links,
+        session,
+        atomic=atomic,
+    )
+
+
+@router.delete(
+    "/social-links/bulk",
+    response_model=schemas.BulkDeleteResult,
+    responses={
+        422: {"model": schemas.BulkErrorResponse},
+        500: {"model": schemas.ErrorResponse},
+    },
+)
+async def delete_social_links_bulk(
+    ids: List[int] = Query(..., max_length=BULK_MAX_ITEMS),
+    atomic: bool = Query(False),
+    session: AsyncSession = Depends(get_db),
+):
+    return await bulk_delete(
+        models.SocialLink,
+        ids,
+        social_links_service.delete_social_links,
+        session,
+        atomic=atomic,
+    )
+
+
 @router.get(
     "/social-links/{link_id}",
     response_model=schemas.SocialLinkRead,
@@ -61,14 +151,14 @@ async def create_social_link(
     },
 )
 async def get_social_link(
-    link_id: int = Path(..., gt=0), session: AsyncSession = Depends(get_db)
+    link_id: int = Path(..., gt=0), session: AsyncSession = Depends(get_read_db)
 ):
     logger.info("Fetching social link id=%s", link_id)
     instance = await social_links_service.get_social_link(link_id, session)
     if not instance:
         logger.warning("Social link %s not found", link_id)
         raise HTTPException(status_code=404, detail="Social link not found")
-    return instance
+    return struct_response(instance)
 
 
 @router.put(
@@ -1,7 +1,15 @@
+import datetime
 from datetime import date
-from typing import List, Optional
+from typing import Any, Dict, Generic, List, Optional, TypeVar
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
+
+T = TypeVar("T")
+
+
+def _empty_if_null(value):
+    # ARRAY columns may hold NULL; the read models promise lists
+    return [] if value is None else value
 
 
 class ProjectBase(BaseModel):
@@ -18,6 +26,8 @@ class ProjectRead(ProjectBase):
     id: int
     profile_id: Optional[int] = None
 
+    _null_skills = field_validator("skills", mode="before")(_empty_if_null)
+
     class Config:
         orm_mode = True
 
@@ -41,6 +51,8 @@ class ExperienceRead(ExperienceBase):
     id: int
     profile_id: int
 
+    _null_skills = field_validator("skills", mode="before")(_empty_if_null)
+
     class Config:
         orm_mode = True
 
@@ -91,7 +103,8 @@ class CertificationRead(CertificationBase):
 class AwardBase(BaseModel):
     title: str
     issuer: Optional[str] = None
-    date: Optional[date] = None
+    # the field shadows the date type inside the class body
+    date: Optional[datetime.date] = None
     description: Optional[str] = None
 
 
@@ -181,6 +194,8 @@ class PortfolioItemRead(PortfolioItemBase):
     id: int
     profile_id: int
 
+    _null_skills = field_validator("skills", mode="before")(_empty_if_null)
+
     class Config:
         orm_mode = True
 
@@ -254,3 +269,27 @@ class ProfileRead(ProfileBase):
 
 class ErrorResponse(BaseModel):
     detail: str
+
+
+class BulkItemError(BaseModel):
+    index: int
+    errors: List[Dict[str, Any]]
+
+
+class BulkResult(BaseModel, Generic[T]):
+    created: List[T]
+    errors: List[BulkItemError] = Field(default_factory=list)
+
+
+class BulkUpdateResult(BaseModel, Generic[T]):
+    updated: List[T]
+    errors: List[BulkItemError] = Field(default_factory=list)
+
+
+class BulkDeleteResult(BaseModel):
+    deleted: List[int]
+    not_found: List[int] = Field(default_factory=list)
+
+
+class BulkErrorResponse(BaseModel):
+    detail: List[BulkItemError]
@@ -2,55 +2,116 @@ from typing import List, Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from .. import models
+from .. import models, schemas
 from app.logger import logger
+from app.services.profile import touch_profile
+from app.structs import read_columns, to_struct, to_structs
 
 
 async def list_certifications(
     profile_id: Optional[int],
     page: int = 1,
     per_page: int = 20,
+    after: Optional[int] = None,
     session: AsyncSession = None,
-) -> List[models.Certification]:
+):
     logger.info(
-        "Service: list_certifications profile_id=%s page=%s per_page=%s",
+        "Service: list_certifications profile_id=%s page=%s per_page=%s after=%s",
         profile_id,
         page,
         per_page,
+        after,
     )
     filters = [models.Certification.profile_id == profile_id] if profile_id else None
     limit = min(per_page, 100)
-    offset = (page - 1) * limit
-    return await models.Certification.list(
-        filters=filters, limit=limit, offset=offset, session=session
+    # a cursor replaces the page offset
+    offset = 0 if after is not None else (page - 1) * limit
+    rows = await models.Certification.list(
+        filters=filters,
+        limit=limit,
+        offset=offset,
+        after=after,
+        session=session,
+        columns=read_columns(models.Certification, schemas.CertificationRead),
     )
+    return to_structs(schemas.CertificationRead, rows)
 
 
 async def create_certification(data: dict, session: AsyncSession):
     logger.info("Service: create_certification data=%s", data)
     instance = await models.Certification.create(data, session=session)
+    await touch_profile(session, instance.profile_id)
     await session.commit()
-    await session.refresh(instance)
     return instance
 
 
+async def create_certifications(
+    rows: List[dict], session: AsyncSession
+) -> List[models.Certification]:
+    logger.info("Service: create_certifications count=%s", len(rows))
+    instances = await models.Certification.create_many(rows, session=session)
+    await touch_profile(session, *(instance.profile_id for instance in instances))
+    await session.commit()
+    return instances
+
+
 async def get_certification(cert_id: int, session: AsyncSession):
     logger.info("Service: get_certification id=%s", cert_id)
-    return await models.Certification.get_by_id(cert_id, session=session)
+    row = await models.Certification.get_row_by_id(
+        cert_id,
+        *read_columns(models.Certification, schemas.CertificationRead),
+        session=session,
+        coalesce=True,
+    )
+    return to_struct(schemas.CertificationRead, row)
 
 
 async def update_certification(cert_id: int, data: dict, session: AsyncSession):
     logger.info("Service: update_certification id=%s data=%s", cert_id, data)
-    instance = await models.Certification.update_by_id(cert_id, data, session=session)
-    if instance:
-        await session.commit()
-        await session.refresh(instance)
+    row = await models.Certification.update_by_id_returning(
+        cert_id, data, "profile_id", session=session
+    )
+    if not row:
+        return None
+    instance, previous_profile_id = row
+    await touch_profile(session, previous_profile_id, instance.profile_id)
+    await session.commit()
     return instance
 
 
+async def update_certifications(
+    rows: List[dict], session: AsyncSession
+) -> List[models.Certification]:
+    logger.info("Service: update_certifications count=%s", len(rows))
+    result = await models.Certification.update_many_returning(
+        rows, "profile_id", session=session
+    )
+    await touch_profile(
+        session,
+        *(instance.profile_id for instance, _ in result),
+        *(previous_profile_id for _, previous_profile_id in result),
+    )
+    await session.commit()
+    return [instance for instance, _ in result]
+
+
 async def delete_certification(cert_id: int, session: AsyncSession) -> bool:
     logger.info("Service: delete_certification id=%s", cert_id)
-    ok = await models.Certification.delete_by_id(cert_id, session=session)
-    if ok:
-        await session.commit()
-    return ok
+    row = await models.Certification.delete_by_id_returning(
+        cert_id, "profile_id", session=session
+    )
+    if not row:
+        return False
+    await touch_profile(session, row.profile_id)
+    await session.commit()
+    return True
+
+
+async def delete_certifications(ids: List[int], session: AsyncSession) -> List[int]:
+    logger.info("Service: delete_certifications ids=%s", ids)
+    result = await models.Certification.delete_many_returning(
+        ids, "profile_id", session=session
+    )
+    await touch_profile(session, *(row.profile_id for row in result))
+    await session.commit()
+    return [row.id for row in result]
@@ -2,55 +2,116 @@ from typing import List, Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from .. import models
+from .. import models, schemas
 from app.logger import logger
+from app.services.profile import touch_profile
+from app.structs import read_columns, to_struct, to_structs
 
 
 async def list_contacts(
     profile_id: Optional[int],
     page: int = 1,
     per_page: int = 20,
+    after: Optional[int] = None,
     session: AsyncSession = None,
-) -> List[models.Contact]:
+):
     logger.info(
-        "Service: list_contacts profile_id=%s page=%s per_page=%s",
+        "Service: list_contacts profile_id=%s page=%s per_page=%s after=%s",
         profile_id,
         page,
         per_page,
+        after,
     )
     filters = [models.Contact.profile_id == profile_id] if profile_id else None
     limit = min(per_page, 100)
-    offset = (page - 1) * limit
-    return await models.Contact.list(
-        filters=filters, limit=limit, offset=offset, session=session
+    # a cursor replaces the page offset
+    offset = 0 if after is not None else (page - 1) * limit
+    rows = await models.Contact.list(
+        filters=filters,
+        limit=limit,
+        offset=offset,
+        after=after,
+        session=session,
+        columns=read_columns(models.Contact, schemas.ContactRead),
     )
+    return to_structs(schemas.ContactRead, rows)
 
 
 async def create_contact(data: dict, session: AsyncSession):
     logger.info("Service: create_contact data=%s", data)
     instance = await models.Contact.create(data, session=session)
+    await touch_profile(session, instance.profile_id)
     await session.commit()
-    await session.refresh(instance)
     return instance
 
 
+async def create_contacts(
+    rows: List[dict], session: AsyncSession
+) -> List[models.Contact]:
+    logger.info("Service: create_contacts count=%s", len(rows))
+    instances = await models.Contact.create_many(rows, session=session)
+    await touch_profile(session, *(instance.profile_id for instance in instances))
+    await session.commit()
+    return instances
+
+
 async def get_contact(contact_id: int, session: AsyncSession):
     logger.info("Service: get_contact id=%s", contact_id)
-    return await models.Contact.get_by_id(contact_id, session=session)
+    row = await models.Contact.get_row_by_id(
+        contact_id,
+        *read_columns(models.Contact, schemas.ContactRead),
+        session=session,
+        coalesce=True,
+    )
+    return to_struct(schemas.ContactRead, row)
 
 
 async def update_contact(contact_id: int, data: dict, session: AsyncSession):
     logger.info("Service: update_contact id=%s data=%s", contact_id, data)
-    instance = await models.Contact.update_by_id(contact_id, data, session=session)
-    if instance:
-        await session.commit()
-        await session.refresh(instance)
+    row = await models.Contact.update_by_id_returning(
+        contact_id, data, "profile_id", session=session
+    )
+    if not row:
+        return None
+    instance, previous_profile_id = row
+    await touch_profile(session, previous_profile_id, instance.profile_id)
+    await session.commit()
     return instance
 
 
+async def update_contacts(
+    rows: List[dict], session: AsyncSession
+) -> List[models.Contact]:
+    logger.info("Service: update_contacts count=%s", len(rows))
+    result = await models.Contact.update_many_returning(
+        rows, "profile_id", session=session
+    )
+    await touch_profile(
+        session,
+        *(instance.profile_id for instance, _ in result),
+        *(previous_profile_id for _, previous_profile_id in result),
+    )
+    await session.commit()
+    return [instance for instance, _ in result]
+
+
 async def delete_contact(contact_id: int, session: AsyncSession) -> bool:
     logger.info("Service: delete_contact id=%s", contact_id)
-    ok = await models.Contact.delete_by_id(contact_id, session=session)
-    if ok:
-        await session.commit()
-    return ok
+    row = await models.Contact.delete_by_id_returning(
+        contact_id, "profile_id", session=session
+    )
+    if not row:
+        return False
+    await touch_profile(session, row.profile_id)
+    await session.commit()
+    return True
+
+
+async def delete_contacts(ids: List[int], session: AsyncSession) -> List[int]:
+    logger.info("Service: delete_contacts ids=%s", ids)
+    result = await models.Contact.delete_many_returning(
+        ids, "profile_id", session=session
+    )
+    await touch_profile(session, *(row.profile_id for row in result))
+    await session.commit()
+    return [row.id for row in result]
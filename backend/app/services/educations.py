@@ -2,55 +2,116 @@ from typing import List, Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from .. import models
+from .. import models, schemas
 from app.logger import logger
+from app.services.profile import touch_profile
+from app.structs import read_columns, to_struct, to_structs
 
 
 async def list_educations(
     profile_id: Optional[int],
     page: int = 1,
     per_page: int = 20,
+    after: Optional[int] = None,
     session: AsyncSession = None,
-) -> List[models.Education]:
+):
     logger.info(
-        "Service: list_educations profile_id=%s page=%s per_page=%s",
+        "Service: list_educations profile_id=%s page=%s per_page=%s after=%s",
         profile_id,
         page,
         per_page,
+        after,
     )
     filters = [models.Education.profile_id == profile_id] if profile_id else None
     limit = min(per_page, 100)
-    offset = (page - 1) * limit
-    return await models.Education.list(
-        filters=filters, limit=limit, offset=offset, session=session
+    # a cursor replaces the page offset
+    offset = 0 if after is not None else (page - 1) * limit
+    rows = await models.Education.list(
+        filters=filters,
+        limit=limit,
+        offset=offset,
+        after=after,
+        session=session,
+        columns=read_columns(models.Education, schemas.EducationRead),
     )
+    return to_structs(schemas.EducationRead, rows)
 
 
 async def create_education(data: dict, session: AsyncSession):
     logger.info("Service: create_education data=%s", data)
     instance = await models.Education.create(data, session=session)
+    await touch_profile(session, instance.profile_id)
     await session.commit()
-    await session.refresh(instance)
     return instance
 
 
+async def create_educations(
+    rows: List[dict], session: AsyncSession
+) -> List[models.Education]:
+    logger.info("Service: create_educations count=%s", len(rows))
+    instances = await models.Education.create_many(rows, session=session)
+    await touch_profile(session, *(instance.profile_id for instance in instances))
+    await session.commit()
+    return instances
+
+
 async def get_education(education_id: int, session: AsyncSession):
     logger.info("Service: get_education id=%s", education_id)
-    return await models.Education.get_by_id(education_id, session=session)
+    row = await models.Education.get_row_by_id(
+        education_id,
+        *read_columns(models.Education, schemas.EducationRead),
+        session=session,
+        coalesce=True,
+    )
+    return to_struct(schemas.EducationRead, row)
 
 
 async def update_education(education_id: int, data: dict, session: AsyncSession):
     logger.info("Service: update_education id=%s data=%s", education_id, data)
-    instance = await models.Education.update_by_id(education_id, data, session=session)
-    if instance:
-        await session.commit()
-        await session.refresh(instance)
+    row = await models.Education.update_by_id_returning(
+        education_id, data, "profile_id", session=session
+    )
+    if not row:
+        return None
+    instance, previous_profile_id = row
+    await touch_profile(session, previous_profile_id, instance.profile_id)
+    await session.commit()
     return instance
 
 
+async def update_educations(
+    rows: List[dict], session: AsyncSession
+) -> List[models.Education]:
+    logger.info("Service: update_educations count=%s", len(rows))
+    result = await models.Education.update_many_returning(
+        rows, "profile_id", session=session
+    )
+    await touch_profile(
+        session,
+        *(instance.profile_id for instance, _ in result),
+        *(previous_profile_id for _, previous_profile_id in result),
+    )
+    await session.commit()
+    return [instance for instance, _ in result]
+
+
 async def delete_education(education_id: int, session: AsyncSession) -> bool:
     logger.info("Service: delete_education id=%s", education_id)
-    ok = await models.Education.delete_by_id(education_id, session=session)
-    if ok:
-        await session.commit()
-    return ok
+    row = await models.Education.delete_by_id_returning(
+        education_id, "profile_id", session=session
+    )
+    if not row:
+        return False
+    await touch_profile(session, row.profile_id)
+    await session.commit()
+    return True
+
+
+async def delete_educations(ids: List[int], session: AsyncSession) -> List[int]:
+    logger.info("Service: delete_educations ids=%s", ids)
+    result = await models.Education.delete_many_returning(
+        ids, "profile_id", session=session
+    )
+    await touch_profile(session, *(row.profile_id for row in result))
+    await session.commit()
+    return [row.id for row in result]
@@ -2,57 +2,149 @@ from typing import List, Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from .. import models
+from .. import models, schemas
 from app.logger import logger
+from app.services.profile import touch_profile
+from app.services.skills import listed_skills, refresh_skill_ranks
+from app.structs import read_columns, to_struct, to_structs
 
 
 async def list_experiences(
     profile_id: Optional[int],
     page: int = 1,
     per_page: int = 20,
+    after: Optional[int] = None,
+    skills_all: Optional[List[str]] = None,
+    skills_any: Optional[List[str]] = None,
     session: AsyncSession = None,
-) -> List[models.Experience]:
+):
     logger.info(
-        "Service: list_experiences profile_id=%s page=%s per_page=%s",
+        "Service: list_experiences profile_id=%s page=%s per_page=%s after=%s skills_all=%s skills_any=%s",
         profile_id,
         page,
         per_page,
+        after,
+        skills_all,
+        skills_any,
     )
-    filters = [models.Experience.profile_id == profile_id] if profile_id else None
+    filters = []
+    if profile_id:
+        filters.append(models.Experience.profile_id == profile_id)
+    if skills_all:
+        filters.append(models.Experience.skills.contains(skills_all))
+    if skills_any:
+        filters.append(models.Experience.skills.overlap(skills_any))
     limit = min(per_page, 100)
-    offset = (page - 1) * limit
-    return await models.Experience.list(
-        filters=filters, limit=limit, offset=offset, session=session
+    # a cursor replaces the page offset
+    offset = 0 if after is not None else (page - 1) * limit
+    rows = await models.Experience.list(
+        filters=filters or None,
+        limit=limit,
+        offset=offset,
+        after=after,
+        session=session,
+        columns=read_columns(models.Experience, schemas.ExperienceRead),
     )
+    return to_structs(schemas.ExperienceRead, rows)
 
 
 async def create_experience(data: dict, session: AsyncSession):
     logger.info("Service: create_experience data=%s", data)
     instance = await models.Experience.create(data, session=session)
+    await refresh_skill_ranks(
+        session, instance.profile_id, names=listed_skills(instance.skills)
+    )
+    await touch_profile(session, instance.profile_id)
     await session.commit()
-    await session.refresh(instance)
     return instance
 
 
+async def create_experiences(
+    rows: List[dict], session: AsyncSession
+) -> List[models.Experience]:
+    logger.info("Service: create_experiences count=%s", len(rows))
+    instances = await models.Experience.create_many(rows, session=session)
+    profile_ids = {instance.profile_id for instance in instances}
+    names = listed_skills(*(instance.skills for instance in instances))
+    await refresh_skill_ranks(session, *profile_ids, names=names)
+    await touch_profile(session, *profile_ids)
+    await session.commit()
+    return instances
+
+
 async def get_experience(experience_id: int, session: AsyncSession):
     logger.info("Service: get_experience id=%s", experience_id)
-    return await models.Experience.get_by_id(experience_id, session=session)
+    row = await models.Experience.get_row_by_id(
+        experience_id,
+        *read_columns(models.Experience, schemas.ExperienceRead),
+        session=session,
+        coalesce=True,
+    )
+    return to_struct(schemas.ExperienceRead, row)
 
 
 async def update_experience(experience_id: int, data: dict, session: AsyncSession):
     logger.info("Service: update_experience id=%s data=%s", experience_id, data)
-    instance = await models.Experience.update_by_id(
-        experience_id, data, session=session
+    row = await models.Experience.update_by_id_returning(
+        experience_id, data, "profile_id", "skills", session=session
+    )
+    if not row:
+        return None
+    instance, previous_profile_id, previous_skills = row
+    await refresh_skill_ranks(
+        session,
+        previous_profile_id,
+        instance.profile_id,
+        names=listed_skills(previous_skills, instance.skills),
     )
-    if instance:
-        await session.commit()
-        await session.refresh(instance)
+    await touch_profile(session, previous_profile_id, instance.profile_id)
+    await session.commit()
     return instance
 
 
+async def update_experiences(
+    rows: List[dict], session: AsyncSession
+) -> List[models.Experience]:
+    logger.info("Service: update_experiences count=%s", len(rows))
+    result = await models.Experience.update_many_returning(
+        rows, "profile_id", "skills", session=session
+    )
+    profile_ids = {instance.profile_id for instance, _, _ in result}
+    profile_ids.update(previous_profile_id for _, previous_profile_id, _ in result)
+    names = listed_skills(
+        *(
+            skills
+            for instance, _, previous in result
+            for skills in (instance.skills, previous)
+        )
+    )
+    await refresh_skill_ranks(session, *profile_ids, names=names)
+    await touch_profile(session, *profile_ids)
+    await session.commit()
+    return [instance for instance, _, _ in result]
+
+
 async def delete_experience(experience_id: int, session: AsyncSession) -> bool:
     logger.info("Service: delete_experience id=%s", experience_id)
-    ok = await models.Experience.delete_by_id(experience_id, session=session)
-    if ok:
-        await session.commit()
-    return ok
+    row = await models.Experience.delete_by_id_returning(
+        experience_id, "profile_id", "skills", session=session
+    )
+    if not row:
+        return False
+    await refresh_skill_ranks(session, row.profile_id, names=listed_skills(row.skills))
+    await touch_profile(session, row.profile_id)
+    await session.commit()
+    return True
+
+
+async def delete_experiences(ids: List[int], session: AsyncSession) -> List[int]:
+    logger.info("Service: delete_experiences ids=%s", ids)
+    result = await models.Experience.delete_many_returning(
+        ids, "profile_id", "skills", session=session
+    )
+    profile_ids = {row.profile_id for row in result}
+    names = listed_skills(*(row.skills for row in result))
+    await refresh_skill_ranks(session, *profile_ids, names=names)
+    await touch_profile(session, *profile_ids)
+    await session.commit()
+    return [row.id for row in result]
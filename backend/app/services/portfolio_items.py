@@ -2,55 +2,149 @@ from typing import List, Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from .. import models
+from .. import models, schemas
 from app.logger import logger
+from app.services.profile import touch_profile
+from app.services.skills import listed_skills, refresh_skill_ranks
+from app.structs import read_columns, to_struct, to_structs
 
 
 async def list_portfolio_items(
     profile_id: Optional[int],
     page: int = 1,
     per_page: int = 20,
+    after: Optional[int] = None,
+    skills_all: Optional[List[str]] = None,
+    skills_any: Optional[List[str]] = None,
     session: AsyncSession = None,
-) -> List[models.PortfolioItem]:
+):
     logger.info(
-        "Service: list_portfolio_items profile_id=%s page=%s per_page=%s",
+        "Service: list_portfolio_items profile_id=%s page=%s per_page=%s after=%s skills_all=%s skills_any=%s",
         profile_id,
         page,
         per_page,
+        after,
+        skills_all,
+        skills_any,
     )
-    filters = [models.PortfolioItem.profile_id == profile_id] if profile_id else None
+    filters = []
+    if profile_id:
+        filters.append(models.PortfolioItem.profile_id == profile_id)
+    if skills_all:
+        filters.append(models.PortfolioItem.skills.contains(skills_all))
+    if skills_any:
+        filters.append(models.PortfolioItem.skills.overlap(skills_any))
     limit = min(per_page, 100)
-    offset = (page - 1) * limit
-    return await models.PortfolioItem.list(
-        filters=filters, limit=limit, offset=offset, session=session
+    # a cursor replaces the page offset
+    offset = 0 if after is not None else (page - 1) * limit
+    rows = await models.PortfolioItem.list(
+        filters=filters or None,
+        limit=limit,
+        offset=offset,
+        after=after,
+        session=session,
+        columns=read_columns(models.PortfolioItem, schemas.PortfolioItemRead),
     )
+    return to_structs(schemas.PortfolioItemRead, rows)
 
 
 async def create_portfolio_item(data: dict, session: AsyncSession):
     logger.info("Service: create_portfolio_item data=%s", data)
     instance = await models.PortfolioItem.create(data, session=session)
+    await refresh_skill_ranks(
+        session, instance.profile_id, names=listed_skills(instance.skills)
+    )
+    await touch_profile(session, instance.profile_id)
     await session.commit()
-    await session.refresh(instance)
     return instance
 
 
+async def create_portfolio_items(
+    rows: List[dict], session: AsyncSession
+) -> List[models.PortfolioItem]:
+    logger.info("Service: create_portfolio_items count=%s", len(rows))
+    instances = await models.PortfolioItem.create_many(rows, session=session)
+    profile_ids = {instance.profile_id for instance in instances}
+    names = listed_skills(*(instance.skills for instance in instances))
+    await refresh_skill_ranks(session, *profile_ids, names=names)
+    await touch_profile(session, *profile_ids)
+    await session.commit()
+    return instances
+
+
 async def get_portfolio_item(item_id: int, session: AsyncSession):
     logger.info("Service: get_portfolio_item id=%s", item_id)
-    return await models.PortfolioItem.get_by_id(item_id, session=session)
+    row = await models.PortfolioItem.get_row_by_id(
+        item_id,
+        *read_columns(models.PortfolioItem, schemas.PortfolioItemRead),
+        session=session,
+        coalesce=True,
+    )
+    return to_struct(schemas.PortfolioItemRead, row)
 
 
 async def update_portfolio_item(item_id: int, data: dict, session: AsyncSession):
     logger.info("Service: update_portfolio_item id=%s data=%s", item_id, data)
-    instance = await models.PortfolioItem.update_by_id(item_id, data, session=session)
-    if instance:
-        await session.commit()
-        await session.refresh(instance)
+    row = await models.PortfolioItem.update_by_id_returning(
+        item_id, data, "profile_id", "skills", session=session
+    )
+    if not row:
+        return None
+    instance, previous_profile_id, previous_skills = row
+    await refresh_skill_ranks(
+        session,
+        previous_profile_id,
+        instance.profile_id,
+        names=listed_skills(previous_skills, instance.skills),
+    )
+    await touch_profile(session, previous_profile_id, instance.profile_id)
+    await session.commit()
     return instance
 
 
+async def update_portfolio_items(
+    rows: List[dict], session: AsyncSession
+) -> List[models.PortfolioItem]:
+    logger.info("Service: update_portfolio_items count=%s", len(rows))
+    result = await models.PortfolioItem.update_many_returning(
+        rows, "profile_id", "skills", session=session
+    )
+    profile_ids = {instance.profile_id for instance, _, _ in result}
+    profile_ids.update(previous_profile_id for _, previous_profile_id, _ in result)
+    names = listed_skills(
+        *(
+            skills
+            for instance, _, previous in result
+            for skills in (instance.skills, previous)
+        )
+    )
+    await refresh_skill_ranks(session, *profile_ids, names=names)
+    await touch_profile(session, *profile_ids)
+    await session.commit()
+    return [instance for instance, _, _ in result]
+
+
 async def delete_portfolio_item(item_id: int, session: AsyncSession) -> bool:
     logger.info("Service: delete_portfolio_item id=%s", item_id)
-    ok = await models.PortfolioItem.delete_by_id(item_id, session=session)
-    if ok:
-        await session.commit()
-    return ok
+    row = await models.PortfolioItem.delete_by_id_returning(
+        item_id, "profile_id", "skills", session=session
+    )
+    if not row:
+        return False
+    await refresh_skill_ranks(session, row.profile_id, names=listed_skills(row.skills))
+    await touch_profile(session, row.profile_id)
+    await session.commit()
+    return True
+
+
+async def delete_portfolio_items(ids: List[int], session: AsyncSession) -> List[int]:
+    logger.info("Service: delete_portfolio_items ids=%s", ids)
+    result = await models.PortfolioItem.delete_many_returning(
+        ids, "profile_id", "skills", session=session
+    )
+    profile_ids = {row.profile_id for row in result}
+    names = listed_skills(*(row.skills for row in result))
+    await refresh_skill_ranks(session, *profile_ids, names=names)
+    await touch_profile(session, *profile_ids)
+    await session.commit()
+    return [row.id for row in result]
@@ -1,73 +1,657 @@
-from typing import Optional
+import os
+from functools import lru_cache
+from typing import (
+    AbstractSet,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    get_args,
+)
 
-from sqlalchemy import select
+import orjson
+from dotenv import load_dotenv
+from pydantic import BaseModel, create_model
+from sqlalchemy import (
+    Text,
+    bindparam,
+    cast,
+    event,
+    func,
+    insert,
+    literal_column,
+    select,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, aggregate_order_by
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import Session, load_only, selectinload
 
-from .. import models
+from .. import models, schemas
+from app.cache import profile_cache
+from app.compression import encode_once
+from app.db import reads_around_replica
 from app.logger import logger
+from app.singleflight import SingleFlight
+
+load_dotenv()
+# how a profile document is built on a cache miss:
+#   snapshot - one read of profile_snapshots, maintained on write (default)
+#   sql      - one json_agg statement over the live tables
+#   orm      - profile select plus one selectinload query per relation
+PROFILE_ENGINE = os.getenv("PROFILE_ENGINE", "snapshot")
+
+profile_flights = SingleFlight("profile")
+
+# top-level sections of a profile document, in response order
+PROFILE_SECTIONS = tuple(schemas.ProfileRead.model_fields)
+PROFILE_RELATIONS = tuple(
+    name for name in PROFILE_SECTIONS if name in models.Profile.__mapper__.relationships
+)
+PROFILE_COLUMNS = tuple(
+    name for name in PROFILE_SECTIONS if name not in PROFILE_RELATIONS
+)
+
+
+class CachedProfile(NamedTuple):
+    version: int
+    document: dict
+    # final JSON response body, encoded once per cached version
+    body: bytes
+    # compressed copies of ``body`` by content coding, filled on first use
+    encoded: Dict[str, bytes]
+
+
+async def touch_profile(session: AsyncSession, *profile_ids: Optional[int]) -> None:
+    """
+    Records a change to the given profiles in the session's transaction.
+
+    Bumps each profile's version so ETags and cache entries for it go stale
+    and, with the snapshot engine, rewrites its snapshot; the in-process cache
+    drops them once the transaction commits.
+    """
+    ids = {profile_id for profile_id in profile_ids if profile_id is not None}
+    if not ids:
+        return
+    await session.execute(
+        update(models.Profile)
+        .where(models.Profile.id.in_(ids))
+        .values(version=models.Profile.version + 1)
+        .execution_options(synchronize_session=False)
+    )
+    if PROFILE_ENGINE == "snapshot":
+        for profile_id in sorted(ids):
+            await write_profile_snapshot(profile_id, session)
+    session.info.setdefault("touched_profiles", set()).update(ids)
+
+
+@event.listens_for(Session, "after_commit")
+def _evict_touched_profiles(session: Session) -> None:
+    profile_cache.invalidate(*session.info.pop("touched_profiles", ()))
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_touched_profiles(session: Session) -> None:
+    session.info.pop("touched_profiles", None)
+
+
+async def get_profile_version(profile_id: int, session: AsyncSession) -> Optional[int]:
+    # remembered versions may come from a lagging replica, so writers and
+    # clients pinned to the primary always read the current one
+    if not reads_around_replica(session):
+        version = profile_cache.version(profile_id)
+        if version is not None:
+            return version
+    generation = profile_cache.generation(profile_id)
+    result = await session.execute(
+        select(models.Profile.version).where(models.Profile.id == profile_id)
+    )
+    version = result.scalar_one_or_none()
+    if version is not None:
+        profile_cache.remember_version(profile_id, version, generation=generation)
+    return version
+
+
+async def get_profile_versions(
+    profile_ids: Iterable[int], session: AsyncSession
+) -> Dict[int, int]:
+    """Versions of the given profiles that exist, with one query for all misses."""
+    versions = {}
+    if not reads_around_replica(session):
+        for profile_id in profile_ids:
+            version = profile_cache.version(profile_id)
+            if version is not None:
+                versions[profile_id] = version
+    missing = set(profile_ids) - versions.keys()
+    if missing:
+        generations = {
+            profile_id: profile_cache.generation(profile_id) for profile_id in missing
+        }
+        result = await session.execute(
+            select(models.Profile.id, models.Profile.version).where(
+                models.Profile.id.in_(missing)
+            )
+        )
+        for profile_id, version in result:
+            profile_cache.remember_version(
+                profile_id, version, generation=generations[profile_id]
+            )
+            versions[profile_id] = version
+    return versions
+
+
+async def list_profile_ids(
+    page: int = 1,
+    per_page: int = 20,
+    after: Optional[int] = None,
+    session: AsyncSession = None,
+):
+    logger.info(
+        "Service: list_profile_ids page=%s per_page=%s after=%s", page, per_page, after
+    )
+    stmt = select(models.Profile.id).order_by(models.Profile.id)
+    if after is not None:
+        stmt = stmt.where(models.Profile.id > after)
+    else:
+        stmt = stmt.offset((page - 1) * per_page)
+    result = await session.execute(stmt.limit(per_page))
+    return result.all()
+
+
+async def existing_profile_ids(
+    profile_ids: Iterable[int], session: AsyncSession
+) -> Set[int]:
+    result = await session.execute(
+        select(models.Profile.id).where(models.Profile.id.in_(set(profile_ids)))
+    )
+    return set(result.scalars().all())
 
 
 async def get_profile(profile_id: int, session: AsyncSession) -> Optional[dict]:
     logger.info("Service: get_profile id=%s", profile_id)
+    entry = await _get_cached_profile(profile_id, session)
+    return entry.document if entry else None
+
+
+async def get_profile_json(
+    profile_id: int, session: AsyncSession, version: Optional[int] = None
+) -> Optional[bytes]:
+    logger.info("Service: get_profile_json id=%s", profile_id)
+    entry = await _get_cached_profile(profile_id, session, version)
+    return entry.body if entry else None
+
+
+async def get_profile_body(
+    profile_id: int,
+    session: AsyncSession,
+    version: Optional[int] = None,
+    encoding: Optional[str] = None,
+) -> Optional[Tuple[bytes, Optional[str], int]]:
+    """
+    The profile document, compressed with ``encoding`` when large enough.
+
+    Returns ``(body, content_encoding, version)``, where ``version`` is the
+    one the document was built at: a snapshot newer than the requested
+    version is served as is. Compressed copies live on the cache entry, so
+    each version is compressed at most once per encoding.
+    """
+    logger.info("Service: get_profile_body id=%s encoding=%s", profile_id, encoding)
+    entry = await _get_cached_profile(profile_id, session, version)
+    if entry is None:
+        return None
+    return (*encode_once(entry.body, entry.encoded, encoding), entry.version)
+
+
+@lru_cache(maxsize=None)
+def sparse_profile_schema(sections: FrozenSet[str]) -> Type[BaseModel]:
+    """``ProfileRead`` reduced to the given sections."""
+    fields = {
+        name: (field.annotation, field)
+        for name, field in schemas.ProfileRead.model_fields.items()
+        if name in sections
+    }
+    return create_model("ProfileSparseRead", **fields)
+
+
+async def get_profile_sections_json(
+    profile_id: int, sections: FrozenSet[str], session: AsyncSession, version: int
+) -> Optional[Tuple[bytes, int]]:
+    """
+    Encodes only the given sections of a profile document.
+
+    A cached full document is sliced without touching the database. On a miss
+    the ORM engine loads just the requested relations and columns; the other
+    engines read the whole document in one statement anyway, so they load and
+    cache it as usual and slice that. Returns ``(body, version)`` with the
+    version the document was built at, which may be newer than ``version``.
+    """
+    logger.info(
+        "Service: get_profile_sections_json id=%s sections=%s",
+        profile_id,
+        sorted(sections),
+    )
+    entry = profile_cache.get(profile_id, version)
+    if entry is None and PROFILE_ENGINE == "orm":
+        profile = await assemble_profile(profile_id, session, sections)
+        if not profile:
+            logger.warning("Service: profile id=%s not found", profile_id)
+            return None
+        body = profile_document(profile, sections).model_dump_json().encode()
+        return body, profile.version
+    if entry is None:
+        entry = await _get_cached_profile(profile_id, session, version)
+        if entry is None:
+            return None
+    document = {
+        name: entry.document[name] for name in PROFILE_SECTIONS if name in sections
+    }
+    return orjson.dumps(document), entry.version
+
+
+async def get_profiles_json(profile_ids: Sequence[int], session: AsyncSession) -> bytes:
+    """
+    Encodes several profiles as one JSON array in the requested order.
+
+    Cached documents are reused and all misses are loaded together, so the
+    number of queries does not grow with the number of profiles. Unknown ids
+    are skipped.
+    """
+    logger.info("Service: get_profiles_json ids=%s", list(profile_ids))
+    versions = await get_profile_versions(profile_ids, session)
+    entries = {}
+    for profile_id, version in versions.items():
+        cached = profile_cache.get(profile_id, version)
+        if cached is not None:
+            entries[profile_id] = cached
+    missing = {
+        profile_id: version
+        for profile_id, version in versions.items()
+        if profile_id not in entries
+    }
+    if missing:
+        entries.update(await _load_profiles(missing, session))
+    bodies = [
+        entries[profile_id].body
+        for profile_id in dict.fromkeys(profile_ids)
+        if profile_id in entries
+    ]
+    return b"[" + b",".join(bodies) + b"]"
+
+
+async def _get_cached_profile(
+    profile_id: int, session: AsyncSession, version: Optional[int] = None
+) -> Optional[CachedProfile]:
+    if version is None:
+        version = await get_profile_version(profile_id, session)
+        if version is None:
+            logger.warning("Service: profile id=%s not found", profile_id)
+            return None
+    cached = profile_cache.get(profile_id, version)
+    if cached is not None:
+        logger.debug("Service: profile id=%s served from cache", profile_id)
+        return cached
+    # concurrent misses for the same profile version share one load
+    return await profile_flights.do(
+        (profile_id, version), lambda: _load_profile(profile_id, version, session)
+    )
+
+
+async def _load_profile(
+    profile_id: int, version: int, session: AsyncSession
+) -> Optional[CachedProfile]:
+    generation = profile_cache.generation(profile_id)
+    if PROFILE_ENGINE == "sql":
+        entry = await _load_profile_sql(profile_id, session)
+    else:
+        entry = await _load_profile_document(profile_id, version, session)
+    if entry is None:
+        logger.warning("Service: profile id=%s not found", profile_id)
+        return None
+    profile_cache.set(profile_id, entry.version, entry, generation=generation)
+    return entry
+
+
+async def _load_profile_document(
+    profile_id: int, version: int, session: AsyncSession
+) -> Optional[CachedProfile]:
+    snapshot = None
+    if PROFILE_ENGINE == "snapshot":
+        result = await session.execute(
+            select(
+                models.ProfileSnapshot.version, models.ProfileSnapshot.document
+            ).where(models.ProfileSnapshot.profile_id == profile_id)
+        )
+        snapshot = result.first()
+    if snapshot is not None and snapshot.version >= version:
+        version = snapshot.version
+        validated = schemas.ProfileRead.model_validate(snapshot.document)
+    else:
+        if PROFILE_ENGINE == "snapshot":
+            # missing or stale snapshot (e.g. before a backfill): assemble live
+            logger.warning(
+                "Service: no current snapshot for profile id=%s, assembling live",
+                profile_id,
+            )
+        profile = await assemble_profile(profile_id, session)
+        if not profile:
+            return None
+        version = profile.version
+        validated = profile_document(profile)
+
+    return _cached_document(version, validated)
+
+
+def _cached_document(version: int, validated: BaseModel) -> CachedProfile:
+    # cache session-independent copies so cached entries never touch the ORM
+    # and reads skip validation and encoding entirely
+    return CachedProfile(
+        version=version,
+        document=validated.model_dump(mode="json"),
+        body=validated.model_dump_json().encode(),
+        encoded={},
+    )
+
+
+def _cached_json(row) -> CachedProfile:
+    # the document text is passed through to the response untouched
+    return CachedProfile(
+        version=row.version,
+        document=orjson.loads(row.document),
+        body=row.document.encode(),
+        encoded={},
+    )
+
+
+async def _load_profiles(
+    versions: Dict[int, int], session: AsyncSession
+) -> Dict[int, CachedProfile]:
+    """Batch counterpart of ``_load_profile`` for ``{profile_id: version}``."""
+    generations = {
+        profile_id: profile_cache.generation(profile_id) for profile_id in versions
+    }
+    entries = {}
+    if PROFILE_ENGINE == "sql":
+        result = await session.execute(
+            profiles_json_statement, {"profile_ids": list(versions)}
+        )
+        entries = {row.id: _cached_json(row) for row in result}
+    else:
+        stale = set(versions)
+        if PROFILE_ENGINE == "snapshot":
+            result = await session.execute(
+                select(
+                    models.ProfileSnapshot.profile_id,
+                    models.ProfileSnapshot.version,
+                    models.ProfileSnapshot.document,
+                ).where(models.ProfileSnapshot.profile_id.in_(stale))
+            )
+            for row in result:
+                if row.version >= versions[row.profile_id]:
+                    entries[row.profile_id] = _cached_document(
+                        row.version, schemas.ProfileRead.model_validate(row.document)
+                    )
+            stale -= entries.keys()
+            if stale:
+                logger.warning(
+                    "Service: no current snapshot for profile ids=%s, assembling live",
+                    sorted(stale),
+                )
+        if stale:
+            for profile in await assemble_profiles(stale, session):
+                entries[profile.id] = _cached_document(
+                    profile.version, profile_document(profile)
+                )
+    for profile_id, entry in entries.items():
+        profile_cache.set(
+            profile_id, entry.version, entry, generation=generations[profile_id]
+        )
+    return entries
+
+
+def _json_value(column):
+    # match the pydantic models, which turn NULL arrays into empty lists
+    if isinstance(column.type, ARRAY):
+        return func.coalesce(column, literal_column("'{}'"))
+    return column
+
+
+def _json_object(model, schema):
+    pairs = []
+    for name in schema.model_fields:
+        pairs += [literal_column(f"'{name}'"), _json_value(getattr(model, name))]
+    return func.json_build_object(*pairs)
+
+
+def _profile_document():
+    """
+    The whole ProfileRead document as one json_build_object expression.
+
+    Keys follow the field order of the read schemas and every collection is a
+    correlated json_agg subquery ordered by id, like the ORM relationships.
+    """
+    profile = models.Profile
+    pairs = []
+    for name, field in schemas.ProfileRead.model_fields.items():
+        relationship = profile.__mapper__.relationships.get(name)
+        if relationship is None:
+            value = _json_value(getattr(profile, name))
+        else:
+            child = relationship.mapper.class_
+            (child_schema,) = get_args(field.annotation)
+            value = (
+                select(
+                    func.coalesce(
+                        func.json_agg(
+                            aggregate_order_by(
+                                _json_object(child, child_schema), child.id
+                            )
+                        ),
+                        literal_column("'[]'::json"),
+                    )
+                )
+                .where(child.profile_id == profile.id)
+                .scalar_subquery()
+            )
+        pairs += [literal_column(f"'{name}'"), value]
+    return func.json_build_object(*pairs)
+
+
+def _profile_json_statement():
+    """Builds the whole ProfileRead document in a single statement."""
+    profile = models.Profile
+    return select(
+        profile.id,
+        profile.version,
+        cast(_profile_document(), Text).label("document"),
+    )
+
+
+profile_json_statement = _profile_json_statement().where(
+    models.Profile.id == bindparam("profile_id")
+)
+profiles_json_statement = _profile_json_statement().where(
+    models.Profile.id.in_(bindparam("profile_ids", expanding=True))
+)
+
+
+async def fetch_profile_json(profile_id: int, session: AsyncSession):
+    """Returns ``(id, version, document_text)`` built by Postgres, or None."""
+    result = await session.execute(profile_json_statement, {"profile_id": profile_id})
+    return result.first()
+
+
+async def _load_profile_sql(
+    profile_id: int, session: AsyncSession
+) -> Optional[CachedProfile]:
+    row = await fetch_profile_json(profile_id, session)
+    if row is None:
+        return None
+    return _cached_json(row)
+
+
+def _profile_options(sections: Optional[AbstractSet[str]] = None) -> list:
+    if sections is None:
+        return [
+            selectinload(getattr(models.Profile, name)) for name in PROFILE_RELATIONS
+        ]
+    columns = [name for name in PROFILE_COLUMNS if name in sections]
+    return [
+        load_only(
+            *(getattr(models.Profile, name) for name in columns), models.Profile.version
+        ),
+        *(
+            selectinload(getattr(models.Profile, name))
+            for name in PROFILE_RELATIONS
+            if name in sections
+        ),
+    ]
+
+
+async def assemble_profile(
+    profile_id: int,
+    session: AsyncSession,
+    sections: Optional[AbstractSet[str]] = None,
+) -> Optional[models.Profile]:
+    """
+    Loads a profile and its child rows from the live tables.
+
+    With ``sections``, only those relations are loaded and only those columns
+    of the profile row are selected.
+    """
     stmt = (
         select(models.Profile)
         .where(models.Profile.id == profile_id)
-        .options(
-            selectinload(models.Profile.projects),
-            selectinload(models.Profile.experiences),
-            selectinload(models.Profile.educations),
-            selectinload(models.Profile.certifications),
-            selectinload(models.Profile.awards),
-            selectinload(models.Profile.publications),
-            selectinload(models.Profile.contacts),
-            selectinload(models.Profile.social_links),
-            selectinload(models.Profile.portfolio_items),
-            selectinload(models.Profile.references),
-            selectinload(models.Profile.skill_items),
-        )
+        .execution_options(populate_existing=True)
+        .options(*_profile_options(sections))
     )
     result = await session.execute(stmt)
     profile = result.scalars().first()
+    if profile:
+        logger.debug(
+            "Service: Assembled profile id=%s with relations %s",
+            profile.id,
+            ",".join(
+                name
+                for name in PROFILE_RELATIONS
+                if sections is None or name in sections
+            ),
+        )
+    return profile
 
-    if not profile:
-        logger.warning("Service: profile id=%s not found", profile_id)
-        return None
 
-    logger.debug(
-        "Service: Assembled profile id=%s with related counts projects=%d experiences=%d",
-        profile.id,
-        len(profile.projects),
-        len(profile.experiences),
+async def assemble_profiles(
+    profile_ids: Iterable[int], session: AsyncSession
+) -> List[models.Profile]:
+    """Loads several profiles with one query per relation for all of them."""
+    stmt = (
+        select(models.Profile)
+        .where(models.Profile.id.in_(set(profile_ids)))
+        .order_by(models.Profile.id)
+        .execution_options(populate_existing=True)
+        .options(*_profile_options())
     )
-    return {
-        "id": profile.id,
-        "name": profile.name,
-        "title": profile.title,
-        "location": profile.location,
-        "summary": profile.summary,
-        "skills": profile.skills or [],
-        "projects": profile.projects,
-        "experiences": profile.experiences,
-        "educations": profile.educations,
-        "certifications": profile.certifications,
-        "awards": profile.awards,
-        "publications": profile.publications,
-        "contacts": profile.contacts,
-        "social_links": profile.social_links,
-        "portfolio_items": profile.portfolio_items,
-        "references": profile.references,
-        "skill_items": profile.skill_items,
-    }
+    result = await session.execute(stmt)
+    return list(result.scalars().all())
+
+
+def profile_document(
+    profile: models.Profile, sections: Optional[FrozenSet[str]] = None
+) -> BaseModel:
+    if sections is None:
+        schema, sections = schemas.ProfileRead, PROFILE_SECTIONS
+    else:
+        schema = sparse_profile_schema(sections)
+    # read only what was loaded; the pydantic models want lists, not NULL
+    document = {name: getattr(profile, name) for name in sections}
+    if "skills" in document:
+        document["skills"] = document["skills"] or []
+    return schema.model_validate(document, from_attributes=True)
+
 
+def _upsert_snapshot_statement():
+    """
+    Rewrites one profile's snapshot with a single ``INSERT ... SELECT``.
 
-async def update_profile(profile_id: int, data: dict, session: AsyncSession):
+    The document is built by Postgres from the live tables with the same
+    json_build_object expression as the ``sql`` engine, so a write costs one
+    statement instead of a load of every relation plus the upsert.
+    """
+    profile = models.Profile
+    snapshot = models.ProfileSnapshot.__table__
+    # the dialect-specific on_conflict_do_update() construct is not cacheable
+    # and this statement is large, so ON CONFLICT is appended to the SELECT as
+    # a suffix and the whole statement compiles once
+    document = select(
+        profile.id, profile.version, cast(_profile_document(), JSONB)
+    ).where(profile.id == bindparam("profile_id"))
+    return (
+        insert(snapshot)
+        .from_select(
+            ["profile_id", "version", "document"],
+            document.suffix_with("""
+            ON CONFLICT (profile_id) DO UPDATE
+            SET version = excluded.version,
+                document = excluded.document,
+                updated_at = now()
+            """),
+        )
+        .returning(snapshot.c.profile_id)
+    )
+
+
+upsert_snapshot_statement = _upsert_snapshot_statement()
+
+
+async def write_profile_snapshot(profile_id: int, session: AsyncSession) -> bool:
+    """
+    Rebuilds the stored snapshot of a profile from the live tables.
+
+    Runs in the caller's transaction, so the snapshot commits (or rolls back)
+    together with the change that made it necessary. False if the profile
+    does not exist.
+    """
+    result = await session.execute(
+        upsert_snapshot_statement, {"profile_id": profile_id}
+    )
+    return result.first() is not None
+
+
+async def update_profile(
+    profile_id: int, data: dict, session: AsyncSession
+) -> Optional[bytes]:
     logger.info("Service: update_profile id=%s data=%s", profile_id, data)
     instance = await models.Profile.update_by_id(profile_id, data, session=session)
     if not instance:
         logger.warning("Service: profile id=%s not found for update", profile_id)
         return None
+    await touch_profile(session, profile_id)
     await session.commit()
-    await session.refresh(instance)
-    # return assembled profile
-    return await get_profile(profile_id, session)
+    # return the freshly encoded profile document
+    return await get_profile_json(profile_id, session)
+
+
+async def create_profiles(
+    rows: List[dict], session: AsyncSession
+) -> List[schemas.ProfileRead]:
+    logger.info("Service: create_profiles count=%s", len(rows))
+    instances = await models.Profile.create_many(rows, session=session)
+    await touch_profile(session, *(instance.id for instance in instances))
+    await session.commit()
+    # new profiles have no child rows yet
+    return [
+        schemas.ProfileRead(
+            id=instance.id,
+            name=instance.name,
+            title=instance.title,
+            location=instance.location,
+            summary=instance.summary,
+            skills=instance.skills or [],
+        )
+        for instance in instances
+    ]
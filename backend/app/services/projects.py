@@ -2,8 +2,11 @@ from typing import List, Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from .. import models
+from .. import models, schemas
 from app.logger import logger
+from app.services.profile import touch_profile
+from app.services.skills import listed_skills, refresh_skill_ranks
+from app.structs import read_columns, to_struct, to_structs
 
 
 async def list_projects(
@@ -11,53 +14,142 @@ async def list_projects(
     skill: Optional[str],
     page: int = 1,
     per_page: int = 20,
+    after: Optional[int] = None,
+    skills_all: Optional[List[str]] = None,
+    skills_any: Optional[List[str]] = None,
     session: AsyncSession = None,
-) -> List[models.Project]:
+):
     logger.info(
-        "Service: list_projects (skill=%s profile_id=%s page=%s per_page=%s)",
+        "Service: list_projects (skill=%s profile_id=%s page=%s per_page=%s after=%s skills_all=%s skills_any=%s)",
         skill,
         profile_id,
         page,
         per_page,
+        after,
+        skills_all,
+        skills_any,
     )
     filters = []
     if profile_id:
         filters.append(models.Project.profile_id == profile_id)
     if skill:
-        # keep the original .any(skill) behavior
-        filters.append(models.Project.skills.any(skill))
+        # same semantics as .any(skill), but as @> so the GIN index applies
+        filters.append(models.Project.skills.contains([skill]))
+    if skills_all:
+        filters.append(models.Project.skills.contains(skills_all))
+    if skills_any:
+        filters.append(models.Project.skills.overlap(skills_any))
     limit = min(per_page, 100)
-    offset = (page - 1) * limit
-    return await models.Project.list(
-        filters=filters or None, limit=limit, offset=offset, session=session
+    # a cursor replaces the page offset
+    offset = 0 if after is not None else (page - 1) * limit
+    rows = await models.Project.list(
+        filters=filters or None,
+        limit=limit,
+        offset=offset,
+        after=after,
+        session=session,
+        columns=read_columns(models.Project, schemas.ProjectRead),
     )
+    return to_structs(schemas.ProjectRead, rows)
 
 
 async def create_project(data: dict, session: AsyncSession) -> models.Project:
     logger.info("Service: create_project data=%s", data)
     instance = await models.Project.create(data, session=session)
+    await refresh_skill_ranks(
+        session, instance.profile_id, names=listed_skills(instance.skills)
+    )
+    await touch_profile(session, instance.profile_id)
     await session.commit()
-    await session.refresh(instance)
     return instance
 
 
+async def create_projects(
+    rows: List[dict], session: AsyncSession
+) -> List[models.Project]:
+    logger.info("Service: create_projects count=%s", len(rows))
+    instances = await models.Project.create_many(rows, session=session)
+    profile_ids = {instance.profile_id for instance in instances}
+    names = listed_skills(*(instance.skills for instance in instances))
+    await refresh_skill_ranks(session, *profile_ids, names=names)
+    await touch_profile(session, *profile_ids)
+    await session.commit()
+    return instances
+
+
 async def get_project(project_id: int, session: AsyncSession):
     logger.info("Service: get_project id=%s", project_id)
-    return await models.Project.get_by_id(project_id, session=session)
+    row = await models.Project.get_row_by_id(
+        project_id,
+        *read_columns(models.Project, schemas.ProjectRead),
+        session=session,
+        coalesce=True,
+    )
+    return to_struct(schemas.ProjectRead, row)
 
 
 async def update_project(project_id: int, data: dict, session: AsyncSession):
     logger.info("Service: update_project id=%s data=%s", project_id, data)
-    instance = await models.Project.update_by_id(project_id, data, session=session)
-    if instance:
-        await session.commit()
-        await session.refresh(instance)
+    row = await models.Project.update_by_id_returning(
+        project_id, data, "profile_id", "skills", session=session
+    )
+    if not row:
+        return None
+    instance, previous_profile_id, previous_skills = row
+    await refresh_skill_ranks(
+        session,
+        previous_profile_id,
+        instance.profile_id,
+        names=listed_skills(previous_skills, instance.skills),
+    )
+    await touch_profile(session, previous_profile_id, instance.profile_id)
+    await session.commit()
     return instance
 
 
+async def update_projects(
+    rows: List[dict], session: AsyncSession
+) -> List[models.Project]:
+    logger.info("Service: update_projects count=%s", len(rows))
+    result = await models.Project.update_many_returning(
+        rows, "profile_id", "skills", session=session
+    )
+    profile_ids = {instance.profile_id for instance, _, _ in result}
+    profile_ids.update(previous_profile_id for _, previous_profile_id, _ in result)
+    names = listed_skills(
+        *(
+            skills
+            for instance, _, previous in result
+            for skills in (instance.skills, previous)
+        )
+    )
+    await refresh_skill_ranks(session, *profile_ids, names=names)
+    await touch_profile(session, *profile_ids)
+    await session.commit()
+    return [instance for instance, _, _ in result]
+
+
 async def delete_project(project_id: int, session: AsyncSession) -> bool:
     logger.info("Service: delete_project id=%s", project_id)
-    ok = await models.Project.delete_by_id(project_id, session=session)
-    if ok:
-        await session.commit()
-    return ok
+    row = await models.Project.delete_by_id_returning(
+        project_id, "profile_id", "skills", session=session
+    )
+    if not row:
+        return False
+    await refresh_skill_ranks(session, row.profile_id, names=listed_skills(row.skills))
+    await touch_profile(session, row.profile_id)
+    await session.commit()
+    return True
+
+
+async def delete_projects(ids: List[int], session: AsyncSession) -> List[int]:
+    logger.info("Service: delete_projects ids=%s", ids)
+    result = await models.Project.delete_many_returning(
+        ids, "profile_id", "skills", session=session
+    )
+    profile_ids = {row.profile_id for row in result}
+    names = listed_skills(*(row.skills for row in result))
+    await refresh_skill_ranks(session, *profile_ids, names=names)
+    await touch_profile(session, *profile_ids)
+    await session.commit()
+    return [row.id for row in result]
@@ -1,68 +1,279 @@
-from typing import List, Optional
+import re
+from typing import Iterable, List, Optional, Set
 
+from sqlalchemy import String, and_, bindparam, func, or_, select, union_all, update
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from .. import models
+from .. import models, schemas
 from app.logger import logger
+from app.services.profile import touch_profile
+from app.structs import read_columns, to_struct, to_structs
 
+# leaderboard weights: proficiency is 1-5, years is open-ended, usage counts
+# the projects, experiences and portfolio items that list the skill
+PROFICIENCY_WEIGHT = 2.0
+YEARS_WEIGHT = 1.0
+USAGE_WEIGHT = 1.5
 
-async def top_skills(limit: int, session: AsyncSession) -> List[models.Skill]:
-    logger.info("Service: top_skills limit=%s", limit)
-    return await models.Skill.list(limit=limit, session=session)
 
+async def top_skills(
+    limit: int, profile_id: Optional[int] = None, session: AsyncSession = None
+):
+    logger.info("Service: top_skills profile_id=%s limit=%s", profile_id, limit)
+    # reads the precomputed scores; per profile this walks
+    # ix_skills_profile_id_rank and stops after ``limit`` rows
+    stmt = (
+        select(*read_columns(models.Skill, schemas.SkillRead))
+        .order_by(models.Skill.rank_score.desc().nulls_last(), models.Skill.id)
+        .limit(limit)
+    )
+    if profile_id:
+        stmt = stmt.where(models.Skill.profile_id == profile_id)
+    result = await session.execute(stmt)
+    return to_structs(schemas.SkillRead, result)
+
+
+def listed_skills(*skill_lists: Optional[Iterable[str]]) -> Set[str]:
+    """The names in any of ``skill_lists``; skills ARRAY columns may be NULL."""
+    return {name for skills in skill_lists if skills for name in skills}
+
+
+async def refresh_skill_ranks(
+    session: AsyncSession,
+    *profile_ids: Optional[int],
+    names: Optional[Iterable[str]] = None,
+    skill_ids: Optional[Iterable[int]] = None,
+) -> None:
+    """
+    Recomputes ``Skill.rank_score`` for skills of the given profiles.
 
-async def search_skills(q: str, session: AsyncSession) -> List[models.Skill]:
-    logger.info("Service: search_skills q=%s", q)
-    return await models.Skill.list(
-        filters=[models.Skill.name.ilike(f"%{q}%")], session=session
+    The score combines proficiency and years with how many of the profile's
+    projects, experiences and portfolio items list the skill (matched
+    case-insensitively). With ``names``, only the skills with those names are
+    rescored and only those names are counted: a write passes the skill names
+    it added or removed. The profile's projects, experiences and portfolio
+    items are still read to count them, but nothing else about the profile's
+    skills is. With ``skill_ids``, only those skills are rescored. One
+    aggregate UPDATE covers all profiles and only rewrites rows whose score
+    changed. Callers run it in the transaction of any write to those tables.
+    """
+    ids = {profile_id for profile_id in profile_ids if profile_id is not None}
+    if names is not None:
+        names = sorted(set(names))
+    if skill_ids is not None:
+        skill_ids = sorted(set(skill_ids))
+    if not ids or names == [] or skill_ids == []:
+        return
+    skill = models.Skill
+    targets = skill.profile_id.in_(ids)
+    if skill_ids is not None:
+        targets &= skill.id.in_(skill_ids)
+    if names is not None:
+        lowered = select(
+            func.lower(func.unnest(bindparam("names", names, type_=ARRAY(String))))
+        )
+        targets &= func.lower(skill.name).in_(lowered)
+    # the skill rows are locked in id order before any is updated, so
+    # concurrent writers touching the same skills queue up instead of
+    # deadlocking; a skill write passes its own rows as ``skill_ids``, which
+    # it already holds, as no other skill's score depends on them
+    locked = (
+        select(skill.id)
+        .where(targets)
+        .order_by(skill.id)
+        .with_for_update()
+        .cte("locked")
+    )
+    usage = union_all(
+        *(
+            select(model.profile_id, func.unnest(model.skills).label("name")).where(
+                model.profile_id.in_(ids)
+            )
+            for model in (models.Project, models.Experience, models.PortfolioItem)
+        )
+    ).subquery("listed")
+    if names is not None:
+        usage = (
+            select(usage).where(func.lower(usage.c.name).in_(lowered)).subquery("usage")
+        )
+    score = (
+        func.coalesce(skill.proficiency, 0) * PROFICIENCY_WEIGHT
+        + func.coalesce(skill.years, 0) * YEARS_WEIGHT
+        + func.count(usage.c.name) * USAGE_WEIGHT
+    )
+    scores = (
+        select(skill.id, score.label("score"))
+        .select_from(skill)
+        .join(locked, locked.c.id == skill.id)
+        .outerjoin(
+            usage,
+            and_(
+                usage.c.profile_id == skill.profile_id,
+                func.lower(usage.c.name) == func.lower(skill.name),
+            ),
+        )
+        .group_by(skill.id)
+        .subquery()
+    )
+    await session.execute(
+        update(skill)
+        .where(
+            skill.id == scores.c.id, skill.rank_score.is_distinct_from(scores.c.score)
+        )
+        .values(rank_score=scores.c.score)
+        .execution_options(synchronize_session=False)
     )
 
 
+async def search_skills(
+    q: str,
+    profile_id: Optional[int] = None,
+    limit: int = 20,
+    session: AsyncSession = None,
+):
+    logger.info(
+        "Service: search_skills q=%s profile_id=%s limit=%s", q, profile_id, limit
+    )
+    # substring matches and trigram-similar names (typos) both use the
+    # ix_skills_name_trgm GIN index; closest names come first
+    pattern = "%" + re.sub(r"([\\%_])", r"\\\1", q) + "%"
+    stmt = (
+        select(*read_columns(models.Skill, schemas.SkillRead))
+        .where(
+            or_(
+                models.Skill.name.ilike(pattern, escape="\\"),
+                models.Skill.name.op("%")(q),
+            )
+        )
+        .order_by(func.similarity(models.Skill.name, q).desc(), models.Skill.id)
+        .limit(limit)
+    )
+    if profile_id:
+        stmt = stmt.where(models.Skill.profile_id == profile_id)
+    result = await session.execute(stmt)
+    return to_structs(schemas.SkillRead, result)
+
+
 async def list_skills(
     profile_id: Optional[int],
     page: int = 1,
     per_page: int = 20,
+    after: Optional[int] = None,
     session: AsyncSession = None,
-) -> List[models.Skill]:
+):
     logger.info(
-        "Service: list_skills profile_id=%s page=%s per_page=%s",
+        "Service: list_skills profile_id=%s page=%s per_page=%s after=%s",
         profile_id,
         page,
         per_page,
+        after,
     )
     filters = [models.Skill.profile_id == profile_id] if profile_id else None
     limit = min(per_page, 100)
-    offset = (page - 1) * limit
-    return await models.Skill.list(
-        filters=filters, limit=limit, offset=offset, session=session
+    # a cursor replaces the page offset
+    offset = 0 if after is not None else (page - 1) * limit
+    rows = await models.Skill.list(
+        filters=filters,
+        limit=limit,
+        offset=offset,
+        after=after,
+        session=session,
+        columns=read_columns(models.Skill, schemas.SkillRead),
     )
+    return to_structs(schemas.SkillRead, rows)
 
 
 async def create_skill(data: dict, session: AsyncSession) -> models.Skill:
     logger.info("Service: create_skill data=%s", data)
     instance = await models.Skill.create(data, session=session)
+    await refresh_skill_ranks(
+        session, instance.profile_id, names=[instance.name], skill_ids=[instance.id]
+    )
+    await touch_profile(session, instance.profile_id)
     await session.commit()
-    await session.refresh(instance)
     return instance
 
 
+async def create_skills(rows: List[dict], session: AsyncSession) -> List[models.Skill]:
+    logger.info("Service: create_skills count=%s", len(rows))
+    instances = await models.Skill.create_many(rows, session=session)
+    profile_ids = {instance.profile_id for instance in instances}
+    await refresh_skill_ranks(
+        session,
+        *profile_ids,
+        names={instance.name for instance in instances},
+        skill_ids=[instance.id for instance in instances],
+    )
+    await touch_profile(session, *profile_ids)
+    await session.commit()
+    return instances
+
+
 async def get_skill(skill_id: int, session: AsyncSession):
     logger.info("Service: get_skill id=%s", skill_id)
-    return await models.Skill.get_by_id(skill_id, session=session)
+    row = await models.Skill.get_row_by_id(
+        skill_id,
+        *read_columns(models.Skill, schemas.SkillRead),
+        session=session,
+        coalesce=True,
+    )
+    return to_struct(schemas.SkillRead, row)
 
 
 async def update_skill(skill_id: int, data: dict, session: AsyncSession):
     logger.info("Service: update_skill id=%s data=%s", skill_id, data)
-    instance = await models.Skill.update_by_id(skill_id, data, session=session)
-    if instance:
-        await session.commit()
-        await session.refresh(instance)
+    row = await models.Skill.update_by_id_returning(
+        skill_id, data, "profile_id", session=session
+    )
+    if not row:
+        return None
+    instance, previous_profile_id = row
+    await refresh_skill_ranks(
+        session, instance.profile_id, names=[instance.name], skill_ids=[instance.id]
+    )
+    await touch_profile(session, previous_profile_id, instance.profile_id)
+    await session.commit()
     return instance
 
 
+async def update_skills(rows: List[dict], session: AsyncSession) -> List[models.Skill]:
+    logger.info("Service: update_skills count=%s", len(rows))
+    result = await models.Skill.update_many_returning(
+        rows, "profile_id", session=session
+    )
+    profile_ids = {instance.profile_id for instance, _ in result}
+    profile_ids.update(previous_profile_id for _, previous_profile_id in result)
+    await refresh_skill_ranks(
+        session,
+        *{instance.profile_id for instance, _ in result},
+        names={instance.name for instance, _ in result},
+        skill_ids=[instance.id for instance, _ in result],
+    )
+    await touch_profile(session, *profile_ids)
+    await session.commit()
+    return [instance for instance, _ in result]
+
+
 async def delete_skill(skill_id: int, session: AsyncSession) -> bool:
     logger.info("Service: delete_skill id=%s", skill_id)
-    ok = await models.Skill.delete_by_id(skill_id, session=session)
-    if ok:
-        await session.commit()
-    return ok
+    row = await models.Skill.delete_by_id_returning(
+        skill_id, "profile_id", session=session
+    )
+    if not row:
+        return False
+    # no other skill's score depends on a deleted skill
+    await touch_profile(session, row.profile_id)
+    await session.commit()
+    return True
+
+
+async def delete_skills(ids: List[int], session: AsyncSession) -> List[int]:
+    logger.info("Service: delete_skills ids=%s", ids)
+    result = await models.Skill.delete_many_returning(
+        ids, "profile_id", session=session
+    )
+    profile_ids = {row.profile_id for row in result}
+    await touch_profile(session, *profile_ids)
+    await session.commit()
+    return [row.id for row in result]
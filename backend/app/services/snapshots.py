@@ -0,0 +1,155 @@
+"""
+Maintenance commands for the materialized profile snapshots.
+
+Run from the backend directory:
+
+    python -m app.services.snapshots rebuild [PROFILE_ID ...]
+    python -m app.services.snapshots check [PROFILE_ID ...]
+    python -m app.services.snapshots parity [PROFILE_ID ...]
+
+``check`` diffs stored snapshots against the live ORM assembly; ``parity``
+does the same for the single-statement json_agg engine.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from typing import Any, List, Optional, Sequence
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .. import models
+from app.db import AsyncSessionLocal
+from app.logger import logger
+from app.services import profile as profile_service
+
+
+async def _profile_ids(
+    session: AsyncSession, profile_ids: Optional[Sequence[int]]
+) -> List[int]:
+    if profile_ids:
+        return list(profile_ids)
+    result = await session.execute(
+        select(models.Profile.id).order_by(models.Profile.id)
+    )
+    return list(result.scalars().all())
+
+
+async def rebuild_snapshots(
+    session: AsyncSession, profile_ids: Optional[Sequence[int]] = None
+) -> int:
+    """Rewrites the snapshot of every (or each given) profile from live data."""
+    rebuilt = 0
+    for profile_id in await _profile_ids(session, profile_ids):
+        if await profile_service.write_profile_snapshot(profile_id, session):
+            rebuilt += 1
+        else:
+            logger.warning("Snapshots: profile id=%s not found", profile_id)
+    await session.commit()
+    return rebuilt
+
+
+def _diff(expected: Any, actual: Any, path: str = "$") -> List[str]:
+    if isinstance(expected, dict) and isinstance(actual, dict):
+        diffs = []
+        for key in expected.keys() | actual.keys():
+            if key not in actual:
+                diffs.append(f"{path}.{key}: missing")
+            elif key not in expected:
+                diffs.append(f"{path}.{key}: unexpected")
+            else:
+                diffs.extend(_diff(expected[key], actual[key], f"{path}.{key}"))
+        return diffs
+    if isinstance(expected, list) and isinstance(actual, list):
+        if len(expected) != len(actual):
+            return [f"{path}: {len(actual)} items, {len(expected)} live"]
+        diffs = []
+        for index, (left, right) in enumerate(zip(expected, actual)):
+            diffs.extend(_diff(left, right, f"{path}[{index}]"))
+        return diffs
+    if expected != actual:
+        return [f"{path}: got {actual!r}, live has {expected!r}"]
+    return []
+
+
+def _by_id(document: dict) -> dict:
+    # child collections have no guaranteed order; compare them by id
+    return {
+        key: (
+            sorted(value, key=lambda item: item["id"])
+            if isinstance(value, list) and value and isinstance(value[0], dict)
+            else value
+        )
+        for key, value in document.items()
+    }
+
+
+async def check_snapshot(profile_id: int, session: AsyncSession) -> List[str]:
+    """Diffs the stored snapshot of a profile against a live assembly."""
+    profile = await profile_service.assemble_profile(profile_id, session)
+    if not profile:
+        return [f"profile id={profile_id} not found"]
+    result = await session.execute(
+        select(models.ProfileSnapshot).where(
+            models.ProfileSnapshot.profile_id == profile_id
+        )
+    )
+    snapshot = result.scalars().first()
+    if snapshot is None:
+        return ["snapshot missing"]
+    diffs = []
+    if snapshot.version != profile.version:
+        diffs.append(f"version: snapshot {snapshot.version}, live {profile.version}")
+    live = profile_service.profile_document(profile).model_dump(mode="json")
+    diffs.extend(_diff(_by_id(live), _by_id(snapshot.document)))
+    return diffs
+
+
+async def check_sql_parity(profile_id: int, session: AsyncSession) -> List[str]:
+    """Diffs the json_agg engine's document against a live assembly."""
+    profile = await profile_service.assemble_profile(profile_id, session)
+    row = await profile_service.fetch_profile_json(profile_id, session)
+    if not profile or row is None:
+        return [] if not profile and row is None else ["profile found by one engine"]
+    diffs = []
+    if row.version != profile.version:
+        diffs.append(f"version: sql {row.version}, live {profile.version}")
+    live = profile_service.profile_document(profile).model_dump(mode="json")
+    diffs.extend(_diff(live, json.loads(row.document)))
+    return diffs
+
+
+async def _run(command: str, profile_ids: Sequence[int]) -> int:
+    async with AsyncSessionLocal() as session:
+        if command == "rebuild":
+            rebuilt = await rebuild_snapshots(session, profile_ids)
+            logger.info("Snapshots: rebuilt %d profile snapshot(s)", rebuilt)
+            return 0
+        check = check_snapshot if command == "check" else check_sql_parity
+        failures = 0
+        for profile_id in await _profile_ids(session, profile_ids):
+            diffs = await check(profile_id, session)
+            if diffs:
+                failures += 1
+                logger.error(
+                    "Snapshots: profile id=%s differs:\n  %s",
+                    profile_id,
+                    "\n  ".join(diffs),
+                )
+            else:
+                logger.info("Snapshots: profile id=%s is consistent", profile_id)
+        return 1 if failures else 0
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("command", choices=["rebuild", "check", "parity"])
+    parser.add_argument("profile_ids", nargs="*", type=int)
+    args = parser.parse_args(argv)
+    return asyncio.run(_run(args.command, args.profile_ids))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,60 +2,119 @@ from typing import List, Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from .. import models
+from .. import models, schemas
 from app.logger import logger
+from app.services.profile import touch_profile
+from app.structs import read_columns, to_struct, to_structs
 
 
 async def list_social_links(
     profile_id: Optional[int],
     page: int = 1,
     per_page: int = 20,
+    after: Optional[int] = None,
     session: AsyncSession = None,
-) -> List[models.SocialLink]:
+):
     logger.info(
-        "Service: list_social_links (profile_id=%s page=%s per_page=%s)",
+        "Service: list_social_links (profile_id=%s page=%s per_page=%s after=%s)",
         profile_id,
         page,
         per_page,
+        after,
     )
     filters = [models.SocialLink.profile_id == profile_id] if profile_id else None
     limit = min(per_page, 100)
-    offset = (page - 1) * limit
-    return await models.SocialLink.list(
-        filters=filters, limit=limit, offset=offset, session=session
+    # a cursor replaces the page offset
+    offset = 0 if after is not None else (page - 1) * limit
+    rows = await models.SocialLink.list(
+        filters=filters,
+        limit=limit,
+        offset=offset,
+        after=after,
+        session=session,
+        columns=read_columns(models.SocialLink, schemas.SocialLinkRead),
     )
+    return to_structs(schemas.SocialLinkRead, rows)
 
 
 async def create_social_link(data: dict, session: AsyncSession) -> models.SocialLink:
     logger.info("Service: create_social_link data=%s", data)
     instance = await models.SocialLink.create(data, session=session)
+    await touch_profile(session, instance.profile_id)
     await session.commit()
-    await session.refresh(instance)
     logger.info("Service: created social link id=%s", getattr(instance, "id", None))
     return instance
 
 
-async def get_social_link(
-    link_id: int, session: AsyncSession
-) -> Optional[models.SocialLink]:
+async def create_social_links(
+    rows: List[dict], session: AsyncSession
+) -> List[models.SocialLink]:
+    logger.info("Service: create_social_links count=%s", len(rows))
+    instances = await models.SocialLink.create_many(rows, session=session)
+    await touch_profile(session, *(instance.profile_id for instance in instances))
+    await session.commit()
+    return instances
+
+
+async def get_social_link(link_id: int, session: AsyncSession):
     logger.info("Service: get_social_link id=%s", link_id)
-    return await models.SocialLink.get_by_id(link_id, session=session)
+    row = await models.SocialLink.get_row_by_id(
+        link_id,
+        *read_columns(models.SocialLink, schemas.SocialLinkRead),
+        session=session,
+        coalesce=True,
+    )
+    return to_struct(schemas.SocialLinkRead, row)
 
 
 async def update_social_link(
     link_id: int, data: dict, session: AsyncSession
 ) -> Optional[models.SocialLink]:
     logger.info("Service: update_social_link id=%s data=%s", link_id, data)
-    instance = await models.SocialLink.update_by_id(link_id, data, session=session)
-    if instance:
-        await session.commit()
-        await session.refresh(instance)
+    row = await models.SocialLink.update_by_id_returning(
+        link_id, data, "profile_id", session=session
+    )
+    if not row:
+        return None
+    instance, previous_profile_id = row
+    await touch_profile(session, previous_profile_id, instance.profile_id)
+    await session.commit()
     return instance
 
 
+async def update_social_links(
+    rows: List[dict], session: AsyncSession
+) -> List[models.SocialLink]:
+    logger.info("Service: update_social_links count=%s", len(rows))
+    result = await models.SocialLink.update_many_returning(
+        rows, "profile_id", session=session
+    )
+    await touch_profile(
+        session,
+        *(instance.profile_id for instance, _ in result),
+        *(previous_profile_id for _, previous_profile_id in result),
+    )
+    await session.commit()
+    return [instance for instance, _ in result]
+
+
 async def delete_social_link(link_id: int, session: AsyncSession) -> bool:
     logger.info("Service: delete_social_link id=%s", link_id)
-    ok = await models.SocialLink.delete_by_id(link_id, session=session)
-    if ok:
-        await session.commit()
-    return ok
+    row = await models.SocialLink.delete_by_id_returning(
+        link_id, "profile_id", session=session
+    )
+    if not row:
+        return False
+    await touch_profile(session, row.profile_id)
+    await session.commit()
+    return True
+
+
+async def delete_social_links(ids: List[int], session: AsyncSession) -> List[int]:
+    logger.info("Service: delete_social_links ids=%s", ids)
+    result = await models.SocialLink.delete_many_returning(
+        ids, "profile_id", session=session
+    )
+    await touch_profile(session, *(row.profile_id for row in result))
+    await session.commit()
+    return [row.id for row in result]
@@ -0,0 +1,65 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+# every group registers itself here so its counters can be reported
+groups: Dict[str, "SingleFlight"] = {}
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls sharing a key into a single in-flight load.
+
+    The first caller (the leader) runs the loader; callers arriving while it is
+    still running await the leader's result instead of issuing their own.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._flights: Dict[Hashable, "asyncio.Future[Any]"] = {}
+        self._waiters: Dict[Hashable, int] = {}
+        self.loads = 0
+        self.coalesced = 0
+        groups[name] = self
+
+    async def do(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        flight = self._flights.get(key)
+        if flight is not None:
+            self.coalesced += 1
+            self._waiters[key] += 1
+            try:
+                # shield so a cancelled follower does not cancel the shared load
+                return await asyncio.shield(flight)
+            except asyncio.CancelledError:
+                if not flight.cancelled():
+                    raise
+            # the leader was cancelled mid-load; take over as the new leader
+            return await self.do(key, loader)
+
+        flight = asyncio.get_running_loop().create_future()
+        self._flights[key] = flight
+        self._waiters[key] = 0
+        self.loads += 1
+        try:
+            result = await loader()
+        except asyncio.CancelledError:
+            flight.cancel()
+            raise
+        except BaseException as exc:
+            if self._waiters[key]:
+                flight.set_exception(exc)
+            else:
+                flight.cancel()
+            raise
+        else:
+            flight.set_result(result)
+            return result
+        finally:
+            del self._flights[key]
+            del self._waiters[key]
+
+    def stats(self) -> dict:
+        return {
+            "in_flight": len(self._flights),
+            "loads": self.loads,
+            "coalesced": self.coalesced,
+        }
@@ -0,0 +1,75 @@
+"""
+Compact read models for the GET paths.
+
+Each pydantic read schema gets a slotted dataclass with the same fields in the
+same order. Services select exactly those columns, build the dataclasses
+positionally from the result rows and routes encode them with orjson, so reads
+skip both ORM instances and pydantic validation. The pydantic schemas stay the
+source of truth for request validation and OpenAPI.
+"""
+
+from dataclasses import make_dataclass
+from functools import lru_cache
+from typing import Any, Iterable, List, Optional, Tuple, Type
+
+import orjson
+from fastapi import Request, Response
+from pydantic import BaseModel
+from sqlalchemy import func, literal_column
+from sqlalchemy.dialects.postgresql import ARRAY
+
+from app.etag import body_etag, etag_matches, not_modified
+
+
+@lru_cache(maxsize=None)
+def read_struct(schema: Type[BaseModel]) -> type:
+    """Slotted dataclass with the fields of ``schema``, in declaration order."""
+    fields = [(name, field.annotation) for name, field in schema.model_fields.items()]
+    return make_dataclass(
+        schema.__name__.removesuffix("Read") + "Row", fields, slots=True
+    )
+
+
+@lru_cache(maxsize=None)
+def read_columns(model, schema: Type[BaseModel]) -> Tuple[Any, ...]:
+    """The columns of ``model`` that ``read_struct(schema)`` is built from."""
+    columns = []
+    for name in schema.model_fields:
+        column = getattr(model, name)
+        if isinstance(column.type, ARRAY):
+            # the read schemas declare lists, never null
+            column = func.coalesce(column, literal_column("'{}'")).label(name)
+        columns.append(column)
+    return tuple(columns)
+
+
+def to_struct(schema: Type[BaseModel], row: Optional[Iterable]) -> Any:
+    return read_struct(schema)(*row) if row is not None else None
+
+
+def to_structs(schema: Type[BaseModel], rows: Iterable[Iterable]) -> List[Any]:
+    struct = read_struct(schema)
+    return [struct(*row) for row in rows]
+
+
+def struct_response(
+    content: Any,
+    response: Optional[Response] = None,
+    request: Optional[Request] = None,
+) -> Response:
+    """
+    Encodes read structs (or lists of them) straight to a JSON response.
+
+    Headers already set on the route's injected ``response`` (ETag, Link) are
+    carried over, as FastAPI ignores them when a route returns a Response.
+    With ``request``, a response without an ETag is tagged with a hash of its
+    body and answered with a 304 when ``If-None-Match`` matches it.
+    """
+    body = orjson.dumps(content)
+    headers = response.headers if response is not None else None
+    if request is not None and response is not None and "etag" not in headers:
+        etag = body_etag(body)
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            return not_modified(etag)
+        headers["ETag"] = etag
+    return Response(content=body, media_type="application/json", headers=headers)
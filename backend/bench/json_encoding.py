@@ -0,0 +1,180 @@
+"""
+Compares the stdlib json encoder with orjson on the two largest GET bodies.
+
+    DATABASE_URL=postgresql+asyncpg://... pipenv run python -m bench.json_encoding
+
+Run it against a scratch database migrated to head: it creates a profile
+with ``--rows`` projects and a few rows in every other section, and deletes
+it again at the end.
+
+The first table times the encoding step alone, after the data is loaded:
+
+- ``pydantic + json``: what FastAPI did before, validating the ORM instances
+  against the response model, dumping them to JSON-compatible Python and
+  rendering with ``JSONResponse`` (stdlib ``json.dumps``);
+- ``pydantic + orjson``: the same, rendered with ``ORJSONResponse``;
+- ``structs + orjson``: the current list path, read structs straight to bytes
+  (for the profile, the cached document dict).
+
+The second table times whole uncompressed requests through the ASGI app.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import List
+
+import httpx
+from fastapi.responses import JSONResponse, ORJSONResponse
+from pydantic import TypeAdapter
+from sqlalchemy import select
+
+from app import models, schemas
+from app.cache import profile_cache
+from app.db import AsyncSessionLocal, engine
+from app.main import app
+from app.services import profile as profile_service
+from app.services import projects as projects_service
+
+SECTIONS = {
+    models.Skill: {"name": "Python", "years": 3},
+    models.Experience: {"company": "Acme", "role": "Engineer", "skills": ["Go"]},
+    models.Education: {"institution": "University", "degree": "BSc"},
+    models.Certification: {"name": "Cloud Practitioner"},
+    models.SocialLink: {"platform": "github", "url": "https://github.com/acme"},
+}
+
+
+def median_us(run, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings) * 1_000_000
+
+
+async def median_request_ms(client, url: str, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        response = await client.get(url)
+        timings.append(time.perf_counter() - started)
+        response.raise_for_status()
+    return statistics.median(timings) * 1000
+
+
+def encoders(dump, structs) -> dict:
+    return {
+        "pydantic + json": lambda: JSONResponse(None).render(dump()),
+        "pydantic + orjson": lambda: ORJSONResponse(None).render(dump()),
+        "structs + orjson": lambda: ORJSONResponse(None).render(structs),
+    }
+
+
+async def main(rows: int, repeat: int) -> None:
+    profile = await models.Profile.create({"name": "JSON encoding benchmark"})
+    try:
+        async with AsyncSessionLocal() as session:
+            await models.Project.create_many(
+                [
+                    {
+                        "profile_id": profile.id,
+                        "title": f"Project {i}",
+                        "description": "A project description. " * 8,
+                        "skills": ["Python", "PostgreSQL", "Docker"],
+                    }
+                    for i in range(rows)
+                ],
+                session=session,
+            )
+            for model, data in SECTIONS.items():
+                await model.create_many(
+                    [{**data, "profile_id": profile.id} for _ in range(10)],
+                    session=session,
+                )
+            await session.commit()
+
+        async with AsyncSessionLocal() as session:
+            instances = (
+                (
+                    await session.execute(
+                        select(models.Project)
+                        .where(models.Project.profile_id == profile.id)
+                        .order_by(models.Project.id)
+                        .limit(100)
+                    )
+                )
+                .scalars()
+                .all()
+            )
+            structs = await projects_service.list_projects(
+                profile.id, None, per_page=100, session=session
+            )
+            profile_instance = await profile_service.assemble_profile(
+                profile.id, session
+            )
+            document = await profile_service.get_profile(profile.id, session)
+
+        projects = TypeAdapter(List[schemas.ProjectRead])
+        cases = {
+            f"{len(structs)} projects": encoders(
+                lambda: projects.dump_python(
+                    projects.validate_python(instances, from_attributes=True),
+                    mode="json",
+                ),
+                structs,
+            ),
+            # the document is encoded once per version and cached as bytes
+            "profile document": encoders(
+                lambda: profile_service.profile_document(profile_instance).model_dump(
+                    mode="json"
+                ),
+                document,
+            ),
+        }
+        print(f"encoding only, median of {repeat} runs")
+        print(f"{'body':<20}{'path':<20}{'us':>10}{'bytes':>9}")
+        for body, paths in cases.items():
+            for label, encode in paths.items():
+                size = len(encode())
+                us = median_us(encode, repeat)
+                print(f"{body:<20}{label:<20}{us:>10.1f}{size:>9}")
+
+        print(f"whole requests, median of {repeat} runs")
+        transport = httpx.ASGITransport(app=app)
+        # identity, so the timings leave out compression
+        async with httpx.AsyncClient(
+            transport=transport,
+            base_url="http://b",
+            headers={"Accept-Encoding": "identity"},
+        ) as c:
+            for url in (
+                f"/api/projects?profile_id={profile.id}&per_page=100",
+                f"/api/profiles/{profile.id}",
+            ):
+                await c.get(url)
+                ms = await median_request_ms(c, url, repeat)
+                print(f"  GET {url:<48}{ms:>8.2f} ms")
+            profile_cache.clear()
+            url = f"/api/profiles/{profile.id}"
+            ms = await median_request_ms(c, url, 1)
+            print(f"  GET {url + ' (cold cache)':<48}{ms:>8.2f} ms")
+    finally:
+        async with AsyncSessionLocal() as session:
+            for model in (models.Project, *SECTIONS):
+                await session.execute(
+                    model.__table__.delete().where(model.profile_id == profile.id)
+                )
+            await models.Profile.delete_by_id(profile.id, session=session)
+            await session.commit()
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.repeat))
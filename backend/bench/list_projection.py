@@ -0,0 +1,121 @@
+"""
+Compares list pages loaded as ORM instances with column projections.
+
+    DATABASE_URL=postgresql+asyncpg://... pipenv run python -m bench.list_projection
+
+Run it against a scratch database migrated to head: it creates a profile
+with ``--rows`` projects and deletes it again at the end. Each path loads one
+page of up to 100 projects, query included, and turns it into what the route
+encodes:
+
+- ``orm + pydantic``: ``select(Project)`` through the session, then
+  ``ProjectRead`` validated from the instances, as the list routes did before;
+- ``rows + structs``: ``list_projects``, which selects the read columns and
+  builds read structs from the Rows.
+
+It reports the median CPU time (process time, so waiting on the database is
+left out) and the peak memory traced while loading the page, both per row.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import tracemalloc
+
+from sqlalchemy import select
+
+from app import models, schemas
+from app.db import AsyncSessionLocal, engine
+from app.services import projects as projects_service
+
+
+async def orm_page(profile_id: int, session) -> list:
+    result = await session.execute(
+        select(models.Project)
+        .where(models.Project.profile_id == profile_id)
+        .order_by(models.Project.id)
+        .limit(100)
+    )
+    return [
+        schemas.ProjectRead.model_validate(instance, from_attributes=True)
+        for instance in result.scalars().all()
+    ]
+
+
+async def projected_page(profile_id: int, session) -> list:
+    return await projects_service.list_projects(
+        profile_id, None, per_page=100, session=session
+    )
+
+
+async def measure(load, profile_id: int, repeat: int):
+    # a fresh session per page, as each request gets one; memory is traced
+    # in separate runs, as tracing slows the CPU path down
+    timings = []
+    for _ in range(repeat):
+        async with AsyncSessionLocal() as session:
+            started = time.process_time()
+            page = await load(profile_id, session)
+            timings.append(time.process_time() - started)
+    peaks = []
+    for _ in range(repeat):
+        async with AsyncSessionLocal() as session:
+            tracemalloc.start()
+            await load(profile_id, session)
+            peaks.append(tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+    rows = len(page)
+    return (
+        rows,
+        statistics.median(timings) * 1_000_000 / rows,
+        statistics.median(peaks) / rows,
+    )
+
+
+async def main(rows: int, repeat: int) -> None:
+    profile = await models.Profile.create({"name": "List projection benchmark"})
+    try:
+        async with AsyncSessionLocal() as session:
+            await models.Project.create_many(
+                [
+                    {
+                        "profile_id": profile.id,
+                        "title": f"Project {i}",
+                        "description": "A project description. " * 8,
+                        "skills": ["Python", "PostgreSQL", "Docker"],
+                    }
+                    for i in range(rows)
+                ],
+                session=session,
+            )
+            await session.commit()
+
+        print(f"one page of projects, median of {repeat} runs")
+        print(f"{'path':<18}{'rows':>6}{'CPU us/row':>12}{'peak B/row':>12}")
+        for label, load in (
+            ("orm + pydantic", orm_page),
+            ("rows + structs", projected_page),
+        ):
+            # warm up the compiled cache and the connection pool
+            await measure(load, profile.id, 3)
+            page_rows, cpu, peak = await measure(load, profile.id, repeat)
+            print(f"{label:<18}{page_rows:>6}{cpu:>12.1f}{peak:>12.0f}")
+    finally:
+        async with AsyncSessionLocal() as session:
+            await session.execute(
+                models.Project.__table__.delete().where(
+                    models.Project.profile_id == profile.id
+                )
+            )
+            await models.Profile.delete_by_id(profile.id, session=session)
+            await session.commit()
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=100)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.repeat))
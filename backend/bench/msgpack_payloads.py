@@ -0,0 +1,121 @@
+"""
+Compares MessagePack bodies with the JSON they are translated from.
+
+    DATABASE_URL=postgresql+asyncpg://... pipenv run python -m bench.msgpack_payloads
+
+Run it against a scratch database migrated to head: it creates a profile
+with ``--rows`` projects and deletes it again at the end. The bodies are
+fetched through the app as JSON, the profile document and one page of
+projects, then for each format it reports:
+
+- the size, uncompressed and after the compression middleware's gzip/br;
+- the median time the server spends producing it from the JSON body (zero
+  for JSON, ``json_to_msgpack`` for MessagePack);
+- the median time a client spends decoding it (``orjson.loads`` or
+  ``msgpack.unpackb``).
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+import msgpack
+import orjson
+
+from app import models
+from app.compression import available_encodings, compress
+from app.db import AsyncSessionLocal, engine
+from app.main import app
+from app.msgpack_content import json_to_msgpack
+
+
+def median_us(run, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings) * 1_000_000
+
+
+async def main(rows: int, repeat: int) -> None:
+    profile = await models.Profile.create({"name": "MessagePack benchmark"})
+    try:
+        async with AsyncSessionLocal() as session:
+            await models.Project.create_many(
+                [
+                    {
+                        "profile_id": profile.id,
+                        "title": f"Project {i}",
+                        "description": "A project description. " * 8,
+                        "skills": ["Python", "PostgreSQL", "Docker"],
+                    }
+                    for i in range(rows)
+                ],
+                session=session,
+            )
+            await session.commit()
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport,
+            base_url="http://b",
+            headers={"Accept-Encoding": "identity"},
+        ) as c:
+            bodies = {}
+            for label, url in (
+                ("profile", f"/api/profiles/{profile.id}"),
+                ("100 projects", f"/api/projects?profile_id={profile.id}&per_page=100"),
+            ):
+                response = await c.get(url)
+                response.raise_for_status()
+                bodies[label] = response.content
+
+        encodings = available_encodings()
+        print(f"median of {repeat} runs")
+        print(
+            f"{'body':<14}{'format':<9}{'bytes':>8}"
+            + "".join(f"{coding:>8}" for coding in encodings)
+            + f"{'encode us':>11}{'decode us':>11}"
+        )
+        for label, body in bodies.items():
+            packed = json_to_msgpack(body)
+            formats = (
+                ("json", body, None, lambda: orjson.loads(body)),
+                (
+                    "msgpack",
+                    packed,
+                    lambda: json_to_msgpack(body),
+                    lambda: msgpack.unpackb(packed, raw=False),
+                ),
+            )
+            for name, payload, encode, decode in formats:
+                sizes = "".join(
+                    f"{len(compress(payload, coding)):>8}" for coding in encodings
+                )
+                encode_us = median_us(encode, repeat) if encode else 0.0
+                decode_us = median_us(decode, repeat)
+                print(
+                    f"{label:<14}{name:<9}{len(payload):>8}{sizes}"
+                    f"{encode_us:>11.1f}{decode_us:>11.1f}"
+                )
+    finally:
+        async with AsyncSessionLocal() as session:
+            await session.execute(
+                models.Project.__table__.delete().where(
+                    models.Project.profile_id == profile.id
+                )
+            )
+            await models.Profile.delete_by_id(profile.id, session=session)
+            await session.commit()
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=500)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.repeat))
@@ -0,0 +1,127 @@
+"""
+Compares the slotted read structs with the pydantic read models.
+
+    DATABASE_URL=postgresql+asyncpg://... pipenv run python -m bench.read_structs
+
+Run it against a scratch database migrated to head: it creates a profile
+with ``--rows`` experiences and deletes it again at the end. Both paths start
+from data already loaded, as the routes get it:
+
+- ``pydantic``: ``ExperienceRead.model_validate`` on ORM instances, then a
+  JSON-mode dump rendered with orjson, as FastAPI serializes a response
+  model under ``ORJSONResponse``;
+- ``struct``: ``read_struct(ExperienceRead)`` built from the projected Rows,
+  then ``orjson.dumps``.
+
+It reports the median construction time per object, the memory retained per
+constructed object (on top of the ORM instance or Row it came from) and the
+median time to encode the whole list.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import tracemalloc
+from datetime import date
+from typing import List
+
+import orjson
+from pydantic import TypeAdapter
+from sqlalchemy import select
+
+from app import models, schemas
+from app.db import AsyncSessionLocal, engine
+from app.structs import read_columns, read_struct
+
+SCHEMA = schemas.ExperienceRead
+
+
+def median_us(run, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings) * 1_000_000
+
+
+def retained_bytes(build) -> int:
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    objects = build()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    del objects
+    return size
+
+
+async def main(rows: int, repeat: int) -> None:
+    profile = await models.Profile.create({"name": "Read struct benchmark"})
+    where = models.Experience.profile_id == profile.id
+    try:
+        async with AsyncSessionLocal() as session:
+            await models.Experience.create_many(
+                [
+                    {
+                        "profile_id": profile.id,
+                        "company": f"Company {i}",
+                        "role": "Engineer",
+                        "start_date": date(2020, 1, 1),
+                        "location": "Remote",
+                        "description": "Built and ran services. " * 6,
+                        "skills": ["Python", "PostgreSQL"],
+                    }
+                    for i in range(rows)
+                ],
+                session=session,
+            )
+            await session.commit()
+
+        async with AsyncSessionLocal() as session:
+            instances = (
+                (await session.execute(select(models.Experience).where(where)))
+                .scalars()
+                .all()
+            )
+            projected = (
+                await session.execute(
+                    select(*read_columns(models.Experience, SCHEMA)).where(where)
+                )
+            ).all()
+
+        struct = read_struct(SCHEMA)
+        adapter = TypeAdapter(List[SCHEMA])
+        paths = {
+            "pydantic": (
+                lambda: [
+                    SCHEMA.model_validate(i, from_attributes=True) for i in instances
+                ],
+                lambda objects: orjson.dumps(adapter.dump_python(objects, mode="json")),
+            ),
+            "struct": (lambda: [struct(*row) for row in projected], orjson.dumps),
+        }
+
+        print(f"{rows} x {SCHEMA.__name__}, median of {repeat} runs")
+        print(f"{'path':<10}{'us/object':>11}{'B/object':>10}{'encode us':>11}")
+        for label, (build, encode) in paths.items():
+            objects = build()
+            per_object = median_us(build, repeat) / rows
+            size = retained_bytes(build) / rows
+            encode_us = median_us(lambda: encode(objects), repeat)
+            print(f"{label:<10}{per_object:>11.2f}{size:>10.0f}{encode_us:>11.1f}")
+    finally:
+        async with AsyncSessionLocal() as session:
+            await session.execute(models.Experience.__table__.delete().where(where))
+            await models.Profile.delete_by_id(profile.id, session=session)
+            await session.commit()
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.repeat))
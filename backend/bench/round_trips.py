@@ -0,0 +1,189 @@
+"""
+Counts database round trips per write.
+
+    DATABASE_URL=postgresql+asyncpg://... pipenv run python -m bench.round_trips
+
+Run it against a scratch database migrated to head: it creates a profile
+with a few rows and deletes the profile again at the end. A round trip is any
+statement sent to the server, including BEGIN and COMMIT.
+
+The first table compares the row-level write paths of CRUDMixin, before and
+after the ``INSERT/UPDATE/DELETE ... RETURNING`` statements. The second counts
+whole API requests, which
+also pay for the profile version bump, the skill rank refresh and, with the
+default ``PROFILE_ENGINE=snapshot``, the snapshot rewrite.
+"""
+
+import asyncio
+from collections import Counter
+from typing import Any, Awaitable, Callable
+
+import httpx
+from sqlalchemy import event
+
+from app import models
+from app.db import AsyncSessionLocal, engine
+from app.main import app
+from app.services.profile import PROFILE_ENGINE
+
+
+class RoundTrips:
+    """Counts the statements and transaction boundaries sent through ``engine``."""
+
+    def __init__(self):
+        self.sent = Counter()
+
+    def __enter__(self):
+        event.listen(engine.sync_engine, "before_cursor_execute", self._statement)
+        event.listen(engine.sync_engine, "begin", self._begin)
+        event.listen(engine.sync_engine, "commit", self._commit)
+        return self
+
+    def __exit__(self, *exc_info):
+        event.remove(engine.sync_engine, "before_cursor_execute", self._statement)
+        event.remove(engine.sync_engine, "begin", self._begin)
+        event.remove(engine.sync_engine, "commit", self._commit)
+
+    def _statement(self, conn, cursor, statement, parameters, context, executemany):
+        self.sent[statement.split(None, 1)[0].upper()] += 1
+
+    def _begin(self, conn):
+        self.sent["BEGIN"] += 1
+
+    def _commit(self, conn):
+        self.sent["COMMIT"] += 1
+
+    @property
+    def total(self) -> int:
+        return sum(self.sent.values())
+
+    def __str__(self) -> str:
+        return ", ".join(f"{count} {kind}" for kind, count in self.sent.items())
+
+
+async def count(label: str, run: Callable[[], Awaitable[Any]]) -> Any:
+    with RoundTrips() as trips:
+        result = await run()
+    print(f"{label:<48} {trips.total:>3}  ({trips})")
+    return result
+
+
+async def orm_update(skill_id: int, data: dict) -> None:
+    # the update path before UPDATE ... RETURNING: CRUDMixin.update_by_id
+    # loaded, flushed and refreshed the row, the service refreshed it again
+    async with AsyncSessionLocal() as session:
+        instance = await session.get(models.Skill, skill_id)
+        for key, value in data.items():
+            setattr(instance, key, value)
+        await session.flush()
+        await session.refresh(instance)
+        await session.commit()
+        await session.refresh(instance)
+
+
+async def orm_create(data: dict) -> int:
+    # add, flush and refresh in CRUDMixin.create, then the service's refresh
+    async with AsyncSessionLocal() as session:
+        instance = models.Skill(**data)
+        session.add(instance)
+        await session.flush()
+        await session.refresh(instance)
+        await session.commit()
+        await session.refresh(instance)
+        return instance.id
+
+
+async def returning_create(data: dict) -> int:
+    async with AsyncSessionLocal() as session:
+        instance = await models.Skill.create(data, session=session)
+        await session.commit()
+        return instance.id
+
+
+async def orm_delete(skill_id: int) -> None:
+    # CRUDMixin.delete_by_id loaded the row before deleting it
+    async with AsyncSessionLocal() as session:
+        instance = await session.get(models.Skill, skill_id)
+        await session.delete(instance)
+        await session.flush()
+        await session.commit()
+
+
+async def returning_delete(skill_id: int) -> None:
+    async with AsyncSessionLocal() as session:
+        await models.Skill.delete_by_id(skill_id, session=session)
+        await session.commit()
+
+
+async def returning_update(skill_id: int, data: dict) -> None:
+    async with AsyncSessionLocal() as session:
+        await models.Skill.update_by_id(skill_id, data, session=session)
+        await session.commit()
+
+
+async def main() -> None:
+    profile = await models.Profile.create({"name": "Round trip benchmark"})
+    skill = None
+    transport = httpx.ASGITransport(app=app)
+    try:
+        async with httpx.AsyncClient(transport=transport, base_url="http://b") as c:
+            skill = (
+                await c.post(
+                    "/api/skills",
+                    json={"name": "Python", "profile_id": profile.id, "years": 1},
+                )
+            ).json()
+
+            print("row writes (CRUDMixin)")
+            data = {"name": "Go", "profile_id": profile.id}
+            await count(
+                "  create: add, flush, refresh, commit, refresh",
+                lambda: orm_create(data),
+            )
+            await count(
+                "  create: INSERT ... RETURNING, commit",
+                lambda: returning_create(data),
+            )
+            await count(
+                "  update: get, flush, refresh, commit, refresh",
+                lambda: orm_update(skill["id"], {"years": 2}),
+            )
+            await count(
+                "  update: UPDATE ... RETURNING, commit",
+                lambda: returning_update(skill["id"], {"years": 3}),
+            )
+            first, second = await models.Skill.list(
+                filters=[models.Skill.name == "Go"], columns=[models.Skill.id]
+            )
+            await count("  delete: get, DELETE, commit", lambda: orm_delete(first.id))
+            await count(
+                "  delete: DELETE ... RETURNING, commit",
+                lambda: returning_delete(second.id),
+            )
+
+            print(f"API requests (PROFILE_ENGINE={PROFILE_ENGINE})")
+            created = await count(
+                "  POST /api/skills", lambda: c.post("/api/skills", json=data)
+            )
+            await count(
+                "  PUT /api/skills/{id}",
+                lambda: c.put(
+                    f"/api/skills/{skill['id']}",
+                    json={"name": "Python", "profile_id": profile.id, "years": 4},
+                ),
+            )
+            await count(
+                "  DELETE /api/skills/{id}",
+                lambda: c.delete(f"/api/skills/{created.json()['id']}"),
+            )
+    finally:
+        async with AsyncSessionLocal() as session:
+            if skill is not None:
+                await models.Skill.delete_by_id(skill["id"], session=session)
+            await models.Profile.delete_by_id(profile.id, session=session)
+            await session.commit()
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
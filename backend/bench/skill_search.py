@@ -0,0 +1,112 @@
+"""
+Compares the trigram-ranked skill search with the ILIKE scan it replaced.
+
+    DATABASE_URL=postgresql+asyncpg://... pipenv run python -m bench.skill_search --rows 1000000
+
+Needs a scratch database migrated to head, including the pg_trgm index. It
+bulk-loads ``--rows`` skills into a new profile, runs each query ``--repeat``
+times through both paths and prints the median time and the number of rows
+found, then deletes the rows again.
+
+The old path is ``name ILIKE '%q%'`` with the CRUDMixin.list default limit of
+100 and no ordering; it can stop at the first 100 matches, so common terms
+favour it while rare terms and typos (which it cannot find) show the scan.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from sqlalchemy import String, bindparam, select, text
+from sqlalchemy.dialects.postgresql import ARRAY
+
+from app import models
+from app.db import AsyncSessionLocal, engine
+from app.services import skills as skills_service
+
+WORDS = (
+    "python",
+    "postgres",
+    "kubernetes",
+    "typescript",
+    "terraform",
+    "rust",
+    "graphql",
+    "kafka",
+)
+
+seed_statement = text("""
+    INSERT INTO skills (profile_id, name)
+    SELECT :profile_id,
+           (:words)[1 + i % cardinality(:words)] || '-' || substr(md5(i::text), 1, 6)
+    FROM generate_series(1, :rows) AS i
+    """).bindparams(bindparam("words", type_=ARRAY(String)))
+
+
+async def ilike_search(session, q: str) -> list:
+    # the search before the trigram index, as Skill.list ran it then
+    stmt = select(models.Skill).where(models.Skill.name.ilike(f"%{q}%")).limit(100)
+    result = await session.execute(stmt)
+    return result.scalars().all()
+
+
+async def trigram_search(session, q: str) -> list:
+    return await skills_service.search_skills(q, limit=20, session=session)
+
+
+async def timed(search, session, q: str, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await search(session, q)
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings) * 1000
+
+
+async def main(rows: int, repeat: int) -> None:
+    profile = await models.Profile.create({"name": "Skill search benchmark"})
+    try:
+        async with AsyncSessionLocal() as session:
+            await session.execute(
+                seed_statement,
+                {"profile_id": profile.id, "words": list(WORDS), "rows": rows},
+            )
+            await session.commit()
+            await session.execute(text("ANALYZE skills"))
+            sample = (
+                await session.execute(
+                    select(models.Skill.name)
+                    .where(models.Skill.profile_id == profile.id)
+                    .limit(1)
+                )
+            ).scalar_one()
+
+            print(f"{rows} skills, median of {repeat} runs")
+            print(f"{'query':<22}{'path':<9}{'rows':>6}{'ms':>10}")
+            for q in ("python", sample, "pyhton", "no-such-skill"):
+                for label, search in (
+                    ("ilike", ilike_search),
+                    ("trigram", trigram_search),
+                ):
+                    found = len(await search(session, q))
+                    ms = await timed(search, session, q, repeat)
+                    print(f"{q:<22}{label:<9}{found:>6}{ms:>10.2f}")
+    finally:
+        async with AsyncSessionLocal() as session:
+            await session.execute(
+                models.Skill.__table__.delete().where(
+                    models.Skill.profile_id == profile.id
+                )
+            )
+            await models.Profile.delete_by_id(profile.id, session=session)
+            await session.commit()
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.repeat))
@@ -0,0 +1,113 @@
+"""
+Measures compile and prepare overhead of the generic CRUD statements.
+
+    DATABASE_URL=postgresql+asyncpg://... pipenv run python -m bench.statement_cache
+
+Run it against a scratch database migrated to head: it creates a profile
+with a few skills and deletes it again at the end. Each workload runs
+``--repeat`` times on engines with SQLAlchemy's compiled cache and asyncpg's
+prepared-statement cache switched off and on, and reports the median time
+per call and how many statements per call had to be compiled (a cache miss,
+or a statement that cannot be cached at all).
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from sqlalchemy import event
+from sqlalchemy.engine.default import CacheStats
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app import models
+from app.db import DATABASE_URL, DB_QUERY_CACHE_SIZE, DB_STATEMENT_CACHE_SIZE
+from app.services import profile as profile_service
+
+CONFIGS = (
+    ("no caches", 0, 0),
+    ("compiled cache", DB_QUERY_CACHE_SIZE, 0),
+    ("both caches", DB_QUERY_CACHE_SIZE, DB_STATEMENT_CACHE_SIZE),
+)
+
+
+def workloads(profile_id: int, skill_ids: list) -> dict:
+    return {
+        "list ?profile_id=": lambda s: models.Skill.list(
+            filters=[models.Skill.profile_id == profile_id],
+            limit=20,
+            session=s,
+            columns=[models.Skill.id, models.Skill.name],
+        ),
+        "get_row_by_id": lambda s: models.Skill.get_row_by_id(
+            skill_ids[0], models.Skill.id, models.Skill.name, session=s
+        ),
+        "update_by_id": lambda s: models.Skill.update_by_id(
+            skill_ids[0], {"years": 2.0}, session=s
+        ),
+        "update_many_returning x10": lambda s: models.Skill.update_many_returning(
+            [{"id": id, "years": 3.0} for id in skill_ids[:10]], session=s
+        ),
+        "write_profile_snapshot": lambda s: profile_service.write_profile_snapshot(
+            profile_id, s
+        ),
+    }
+
+
+async def run(engine, workload, repeat: int):
+    compiled = 0
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        nonlocal compiled
+        if context.cache_hit is not CacheStats.CACHE_HIT:
+            compiled += 1
+
+    timings = []
+    event.listen(engine.sync_engine, "before_cursor_execute", count)
+    try:
+        for _ in range(repeat):
+            async with AsyncSession(engine) as session:
+                started = time.perf_counter()
+                await workload(session)
+                timings.append(time.perf_counter() - started)
+                await session.rollback()
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", count)
+    return statistics.median(timings) * 1000, compiled / repeat
+
+
+async def main(repeat: int) -> None:
+    profile = await models.Profile.create({"name": "Statement cache benchmark"})
+    skills = await models.Skill.create_many(
+        [{"profile_id": profile.id, "name": f"skill {i}"} for i in range(20)]
+    )
+    skill_ids = [skill.id for skill in skills]
+    try:
+        print(f"median of {repeat} calls; compiled = statements compiled per call")
+        print(f"{'workload':<28}{'config':<16}{'ms':>8}{'compiled':>10}")
+        for name, workload in workloads(profile.id, skill_ids).items():
+            for label, query_cache_size, statement_cache_size in CONFIGS:
+                engine = create_async_engine(
+                    DATABASE_URL,
+                    query_cache_size=query_cache_size,
+                    connect_args={
+                        "prepared_statement_cache_size": statement_cache_size
+                    },
+                )
+                try:
+                    # warm up the pool, the caches and asyncpg's type codecs
+                    await run(engine, workload, 2)
+                    ms, compiled = await run(engine, workload, repeat)
+                finally:
+                    await engine.dispose()
+                print(f"{name:<28}{label:<16}{ms:>8.3f}{compiled:>10.1f}")
+    finally:
+        await models.Skill.delete_many_returning(skill_ids)
+        await models.Profile.delete_by_id(profile.id)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(main(args.repeat))
@@ -0,0 +1,78 @@
+"""
+Fixtures for the Postgres-backed tests.
+
+The tests run against ``TEST_DATABASE_URL``, which is migrated to head and
+has every table truncated before each test that uses it: never point it at
+a database whose data you want to keep. Without it, those tests are skipped.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+# set before the app is imported, so neither .env nor a replica is used
+os.environ["DATABASE_URL"] = (
+    TEST_DATABASE_URL or "postgresql+asyncpg://localhost/unconfigured"
+)
+os.environ["DATABASE_READ_URL"] = ""
+
+import httpx
+from sqlalchemy import event, text
+
+from app import models
+from app.cache import profile_cache
+from app.db import Base, engine
+from app.main import app
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture(scope="session")
+def migrated():
+    if not TEST_DATABASE_URL:
+        pytest.skip("TEST_DATABASE_URL is not set")
+    # alembic runs its own event loop, so it gets a process of its own
+    subprocess.run(
+        [sys.executable, "-m", "alembic", "upgrade", "head"],
+        cwd=BACKEND_DIR,
+        check=True,
+    )
+
+
+@pytest.fixture
+async def db(migrated):
+    quote = engine.dialect.identifier_preparer.format_table
+    tables = ", ".join(quote(table) for table in Base.metadata.sorted_tables)
+    async with engine.begin() as conn:
+        await conn.execute(text(f"TRUNCATE {tables} RESTART IDENTITY CASCADE"))
+    profile_cache.clear()
+
+
+@pytest.fixture
+async def client(db):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
+
+
+@pytest.fixture
+async def profile_id(db):
+    profile = await models.Profile.create({"name": "Ada Lovelace"})
+    return profile.id
+
+
+@pytest.fixture
+def statements():
+    """``(sql, parameters)`` of every statement sent while the test runs."""
+    captured = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        captured.append((statement, parameters))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", capture)
+    yield captured
+    event.remove(engine.sync_engine, "before_cursor_execute", capture)
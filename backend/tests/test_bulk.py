@@ -0,0 +1,58 @@
+async def _create(client, path, items):
+    response = await client.post(f"{path}/bulk", json=items)
+    assert response.status_code == 200, response.text
+    return [item["id"] for item in response.json()["created"]]
+
+
+async def test_bulk_update_references(client, profile_id):
+    # Reference.relation is mapped to the "relationship" column
+    ids = await _create(
+        client,
+        "/api/references",
+        [
+            {"profile_id": profile_id, "name": "Grace", "relation": "mentor"},
+            {"profile_id": profile_id, "name": "Alan", "relation": "colleague"},
+        ],
+    )
+    response = await client.patch(
+        "/api/references/bulk",
+        json=[
+            {"id": ids[0], "relation": "manager"},
+            {"id": ids[1], "relation": "peer", "testimonial": "Sharp."},
+            {"id": 9999, "relation": "nobody"},
+        ],
+    )
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert [(item["id"], item["relation"]) for item in body["updated"]] == [
+        (ids[0], "manager"),
+        (ids[1], "peer"),
+    ]
+    assert [
+        (error["index"], error["errors"][0]["type"]) for error in body["errors"]
+    ] == [(2, "not_found")]
+    response = await client.get("/api/references", params={"profile_id": profile_id})
+    assert [item["relation"] for item in response.json()] == ["manager", "peer"]
+
+
+async def test_bulk_update_array_column(client, profile_id):
+    ids = await _create(
+        client,
+        "/api/projects",
+        [
+            {"profile_id": profile_id, "title": "Engine", "skills": ["C"]},
+            {"profile_id": profile_id, "title": "Notes", "skills": []},
+        ],
+    )
+    response = await client.patch(
+        "/api/projects/bulk",
+        json=[
+            {"id": ids[0], "skills": ["C", "Rust"]},
+            {"id": ids[1], "skills": ["Python"]},
+        ],
+    )
+    assert response.status_code == 200, response.text
+    assert [item["skills"] for item in response.json()["updated"]] == [
+        ["C", "Rust"],
+        ["Python"],
+    ]
@@ -0,0 +1,35 @@
+from app.cache import ProfileCache
+
+
+def test_load_racing_an_invalidation_is_dropped():
+    cache = ProfileCache(max_size=4)
+    # a lookup reads version 1, then a write commits and invalidates
+    generation = cache.generation(1)
+    cache.invalidate(1)
+    cache.remember_version(1, 1, generation=generation)
+    assert not cache.set(1, 1, "stale", generation=generation)
+    assert cache.version(1) is None
+    assert cache.get(1, 1) is None
+
+    generation = cache.generation(1)
+    cache.remember_version(1, 2, generation=generation)
+    assert cache.set(1, 2, "fresh", generation=generation)
+    assert cache.version(1) == 2
+    assert cache.get(1, 2) == "fresh"
+
+
+def test_evicted_generations_still_reject_stale_loads():
+    cache = ProfileCache(max_size=1)
+    generation = cache.generation(1)
+    cache.invalidate(1)
+    # pushes the generation of key 1 out of the bounded map
+    cache.invalidate(2)
+    assert not cache.set(1, 1, "stale", generation=generation)
+    assert cache.set(1, 2, "fresh", generation=cache.generation(1))
+
+
+def test_clear_drops_loads_in_flight():
+    cache = ProfileCache(max_size=4)
+    generation = cache.generation(1)
+    cache.clear()
+    assert not cache.set(1, 1, "stale", generation=generation)
@@ -0,0 +1,39 @@
+import asyncio
+
+import pytest
+
+from app import models
+from app.db import AsyncSessionLocal
+
+
+async def _move(project_id, profile_id, session, many):
+    if many:
+        (row,) = await models.Project.update_many_returning(
+            [{"id": project_id, "profile_id": profile_id}],
+            "profile_id",
+            session=session,
+        )
+    else:
+        row = await models.Project.update_by_id_returning(
+            project_id, {"profile_id": profile_id}, "profile_id", session=session
+        )
+    return row[1]
+
+
+@pytest.mark.parametrize("many", [False, True])
+async def test_racing_moves_report_the_committed_previous_value(db, many):
+    a, b, c = [
+        (await models.Profile.create({"name": name})).id for name in ("A", "B", "C")
+    ]
+    project = await models.Project.create({"title": "Engine", "profile_id": a})
+
+    async with AsyncSessionLocal() as first, AsyncSessionLocal() as second:
+        assert await _move(project.id, b, first, many) == a
+        # the second move waits on the first one's row lock
+        second_move = asyncio.create_task(_move(project.id, c, second, many))
+        await asyncio.sleep(0.2)
+        assert not second_move.done()
+        await first.commit()
+        # and then sees B, so profile B is touched as well
+        assert await second_move == b
+        await second.commit()
@@ -0,0 +1,49 @@
+import asyncio
+
+import pytest
+from sqlalchemy import exc
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.db import InstrumentedPool, engine
+
+
+@pytest.fixture
+async def small_engine(migrated):
+    # the app's database, through a pool of one connection
+    small = create_async_engine(
+        engine.url,
+        poolclass=InstrumentedPool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.5,
+    )
+    yield small
+    await small.dispose()
+
+
+async def test_pool_stats_time_only_the_wait(small_engine):
+    pool = small_engine.pool
+    assert pool.stats()["overflow"] == 0
+
+    # opening the first connection is not a wait
+    conn = await small_engine.connect()
+    stats = pool.stats()
+    assert (stats["connects"], stats["checkouts"], stats["wait_max_ms"]) == (1, 0, 0)
+
+    with pytest.raises(exc.TimeoutError):
+        await small_engine.connect()
+    stats = pool.stats()
+    assert (stats["timeouts"], stats["checkouts"]) == (1, 0)
+
+    async def release_later():
+        await asyncio.sleep(0.1)
+        await conn.close()
+
+    release = asyncio.create_task(release_later())
+    async with small_engine.connect():
+        pass
+    await release
+    stats = pool.stats()
+    assert (stats["connects"], stats["checkouts"], stats["timeouts"]) == (1, 1, 1)
+    assert 50 < stats["wait_max_ms"] < 500
+    assert stats["wait_avg_ms"] == stats["wait_max_ms"]
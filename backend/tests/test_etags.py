@@ -0,0 +1,124 @@
+import pytest
+
+from app import models
+from app.compression import available_encodings
+from app.etag import profile_etag
+from app.services import profile as profile_service
+
+# br is only offered when the brotli package is installed
+CODINGS = available_encodings()
+
+
+async def _add_projects(client, profile_id, count=10):
+    # enough to take the profile document past COMPRESSION_MIN_SIZE
+    items = [
+        {"profile_id": profile_id, "title": f"Project {i}", "description": "x" * 200}
+        for i in range(count)
+    ]
+    response = await client.post("/api/projects/bulk", json=items)
+    assert response.status_code == 200, response.text
+
+
+def _vary(response):
+    return [name.strip().lower() for name in response.headers["vary"].split(",")]
+
+
+@pytest.mark.parametrize(
+    "path", ["/api/profiles/{id}", "/api/projects?profile_id={id}&per_page=50"]
+)
+async def test_each_coding_has_its_own_etag(client, profile_id, path):
+    await _add_projects(client, profile_id)
+    url = path.format(id=profile_id)
+    responses = {
+        coding: await client.get(url, headers={"Accept-Encoding": coding})
+        for coding in ("identity", *CODINGS)
+    }
+    etag = responses["identity"].headers["etag"]
+    assert "content-encoding" not in responses["identity"].headers
+    for coding in CODINGS:
+        response = responses[coding]
+        assert response.headers["content-encoding"] == coding
+        assert response.headers["etag"] == etag[:-1] + f'-{coding}"'
+        assert response.content == responses["identity"].content
+    for response in responses.values():
+        assert _vary(response).count("accept-encoding") == 1
+
+
+async def test_if_none_match_per_coding(client, profile_id):
+    await _add_projects(client, profile_id)
+    url = f"/api/profiles/{profile_id}"
+    gzip_etag = (await client.get(url, headers={"Accept-Encoding": "gzip"})).headers[
+        "etag"
+    ]
+
+    response = await client.get(
+        url, headers={"Accept-Encoding": "gzip", "If-None-Match": gzip_etag}
+    )
+    assert response.status_code == 304
+    assert response.headers["etag"] == gzip_etag
+
+    # the gzip tag does not validate the other representations
+    for coding in ("identity", *CODINGS):
+        if coding == "gzip":
+            continue
+        response = await client.get(
+            url, headers={"Accept-Encoding": coding, "If-None-Match": gzip_etag}
+        )
+        assert response.status_code == 200
+        assert response.headers["etag"] != gzip_etag
+
+
+async def test_msgpack_representations(client, profile_id):
+    await _add_projects(client, profile_id)
+    url = f"/api/profiles/{profile_id}"
+    json_response = await client.get(url, headers={"Accept-Encoding": "identity"})
+    etag = json_response.headers["etag"]
+    assert _vary(json_response).count("accept") == 1
+
+    tags = set()
+    for coding in ("identity", *CODINGS):
+        response = await client.get(
+            url,
+            headers={"Accept": "application/msgpack", "Accept-Encoding": coding},
+        )
+        assert response.headers["content-type"] == "application/msgpack"
+        assert _vary(response).count("accept") == 1
+        assert _vary(response).count("accept-encoding") == 1
+        tags.add(response.headers["etag"])
+        again = await client.get(
+            url,
+            headers={
+                "Accept": "application/msgpack",
+                "Accept-Encoding": coding,
+                "If-None-Match": response.headers["etag"],
+            },
+        )
+        assert again.status_code == 304
+    assert tags == {
+        etag[:-1] + '-msgpack"',
+        *(etag[:-1] + f'-msgpack-{coding}"' for coding in CODINGS),
+    }
+
+
+@pytest.mark.parametrize("query", ["", "?include=projects&fields=name"])
+async def test_etag_names_the_version_served(client, profile_id, monkeypatch, query):
+    await _add_projects(client, profile_id)
+    profile = await models.Profile.get_by_id(profile_id)
+    sections = ["id", "name", "projects"] if query else []
+
+    async def lagging_version(profile_id, session):
+        # as read from a replica that has not seen the last write yet
+        return profile.version - 1
+
+    monkeypatch.setattr(profile_service, "get_profile_version", lagging_version)
+    url = f"/api/profiles/{profile_id}{query}"
+    response = await client.get(url, headers={"Accept-Encoding": "identity"})
+    assert response.status_code == 200
+    etag = profile_etag(profile_id, profile.version, *sections)
+    assert response.headers["etag"] == etag
+
+    again = await client.get(
+        url, headers={"Accept-Encoding": "identity", "If-None-Match": etag}
+    )
+    assert again.status_code == 304
+    assert again.headers["etag"] == etag
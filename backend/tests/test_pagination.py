@@ -0,0 +1,43 @@
+import base64
+
+import pytest
+from fastapi import HTTPException
+
+from app.pagination import decode_cursor, encode_cursor
+
+
+def _cursor(text: str) -> str:
+    return base64.urlsafe_b64encode(text.encode()).decode().rstrip("=")
+
+
+def test_cursor_round_trip():
+    assert decode_cursor(encode_cursor(42)) == 42
+    assert decode_cursor(encode_cursor(2**31 - 1)) == 2**31 - 1
+    assert decode_cursor(None) is None
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not base64!",
+        _cursor("id:"),
+        _cursor("id:²"),
+        _cursor("name:4"),
+        _cursor("id:0"),
+        _cursor("id:2147483648"),
+        _cursor("id:99999999999999999999"),
+    ],
+)
+def test_invalid_cursor_is_rejected(cursor):
+    with pytest.raises(HTTPException) as error:
+        decode_cursor(cursor)
+    assert error.value.status_code == 400
+
+
+@pytest.mark.parametrize("value", ["²", "99999999999999999999"])
+async def test_list_with_invalid_cursor(client, profile_id, value):
+    response = await client.get(
+        "/api/projects",
+        params={"profile_id": profile_id, "cursor": _cursor(f"id:{value}")},
+    )
+    assert response.status_code == 400
@@ -0,0 +1,99 @@
+"""
+The profile engines must return the same document.
+
+The ORM assembly (``profile_document``) and the snapshot engine both encode
+through pydantic and are compared byte for byte. The SQL engine returns the
+text Postgres builds, which differs in two documented ways only: its
+separators are padded (``"id" : 1, "name" : ...``) and whole floats are
+rendered without a fraction (``1`` where pydantic writes ``1.0``). Its output
+is compared after ``normalized``, which parses the JSON (dropping the
+whitespace) and turns every number into a float, keeping key order.
+"""
+
+from datetime import date
+
+import orjson
+import pytest
+
+from app import models
+from app.cache import profile_cache
+from app.db import AsyncSessionLocal
+from app.services import profile as profile_service
+
+
+def normalized(body):
+    def normalize(value):
+        if isinstance(value, dict):
+            return [(key, normalize(item)) for key, item in value.items()]
+        if isinstance(value, list):
+            return [normalize(item) for item in value]
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return float(value)
+        return value
+
+    return normalize(orjson.loads(body))
+
+
+@pytest.fixture
+async def full_profile(db):
+    async with AsyncSessionLocal() as session:
+        # skills stays NULL on the profile and on the project
+        profile = await models.Profile.create(
+            {"name": "Ada Lovelace", "title": "Analyst"}, session=session
+        )
+        rows = {
+            models.Project: [{"title": "Engine", "skills": None}],
+            models.Experience: [
+                {
+                    "company": "Babbage & Co",
+                    "role": "Programmer",
+                    "start_date": date(1842, 1, 1),
+                    "end_date": date(1843, 9, 1),
+                    "skills": ["Python"],
+                }
+            ],
+            models.Education: [
+                {"institution": "Home", "start_date": date(1830, 2, 28)}
+            ],
+            models.Certification: [{"name": "Notes", "issue_date": date(1843, 1, 1)}],
+            models.Award: [{"title": "First program", "date": date(1843, 10, 1)}],
+            models.Reference: [
+                {"name": "Charles", "relation": "mentor", "testimonial": "Sharp."}
+            ],
+            models.Skill: [
+                {"name": "Python", "years": 1.0},
+                {"name": "Rust", "years": 2.5},
+                {"name": "Go", "years": None},
+            ],
+        }
+        for model, items in rows.items():
+            await model.create_many(
+                [{**item, "profile_id": profile.id} for item in items],
+                session=session,
+            )
+        assert await profile_service.write_profile_snapshot(profile.id, session)
+        await session.commit()
+    profile_cache.clear()
+    return profile.id
+
+
+async def test_engines_return_the_same_document(full_profile, monkeypatch):
+    async with AsyncSessionLocal() as session:
+        profile = await profile_service.assemble_profile(full_profile, session)
+        orm_body = profile_service.profile_document(profile).model_dump_json().encode()
+        row = await profile_service.fetch_profile_json(full_profile, session)
+        stored = await session.get(models.ProfileSnapshot, full_profile)
+
+        monkeypatch.setattr(profile_service, "PROFILE_ENGINE", "snapshot")
+        snapshot_body = await profile_service.get_profile_json(full_profile, session)
+
+    document = orjson.loads(orm_body)
+    assert document["skills"] == [] and document["projects"][0]["skills"] == []
+    assert [skill["years"] for skill in document["skill_items"]] == [1.0, 2.5, None]
+    assert document["references"][0]["relation"] == "mentor"
+
+    assert row.version == stored.version == profile.version
+    assert snapshot_body == orm_body
+    # jsonb keeps no key order, so the stored document is compared as a dict
+    assert stored.document == document
+    assert normalized(row.document) == normalized(orm_body)
@@ -0,0 +1,135 @@
+"""
+The list filters and profile loads must be served by the ``profile_id``
+indexes. Sequential scans are disabled, so the planner only picks one when no
+index applies, regardless of how little data the test tables hold; a full
+scan of another index (say the primary key, filtering on ``profile_id``) is
+caught by requiring an index condition on every index scan.
+"""
+
+import json
+
+import pytest
+from sqlalchemy import String, text
+
+from app.db import AsyncSessionLocal, Base, engine
+from app.pagination import encode_cursor
+from app.services import profile as profile_service
+
+LIST_PATHS = [
+    "/api/awards",
+    "/api/certifications",
+    "/api/contacts",
+    "/api/educations",
+    "/api/experiences",
+    "/api/portfolio-items",
+    "/api/projects",
+    "/api/publications",
+    "/api/references",
+    "/api/skills",
+    "/api/skills/top",
+    "/api/social-links",
+]
+
+
+OTHER_PROFILES = 50
+ROWS_PER_TABLE = 1000
+
+
+@pytest.fixture(autouse=True)
+async def other_profiles(db):
+    """
+    Rows of many other profiles in every child table, analyzed, so the plans
+    are made for a realistic spread of ``profile_id``. Statistics survive
+    TRUNCATE (and ANALYZE of an empty table), so without this the planner
+    would work from whatever an earlier run left behind.
+    """
+    quote = engine.dialect.identifier_preparer.format_table
+    async with engine.begin() as conn:
+        await conn.execute(
+            text(
+                "INSERT INTO profile (name) SELECT 'other ' || i "
+                f"FROM generate_series(1, {OTHER_PROFILES}) AS i"
+            )
+        )
+        for table in Base.metadata.sorted_tables:
+            if "profile_id" not in table.c or table.c.profile_id.primary_key:
+                continue
+            names = [
+                column.name
+                for column in table.columns
+                if isinstance(column.type, String)
+                and not column.nullable
+                and column.server_default is None
+            ]
+            columns = ", ".join(["profile_id", *names])
+            values = ", ".join(
+                [f"1 + i % {OTHER_PROFILES}", *["'x' || i"] * len(names)]
+            )
+            await conn.execute(
+                text(
+                    f"INSERT INTO {quote(table)} ({columns}) SELECT {values} "
+                    f"FROM generate_series(1, {ROWS_PER_TABLE}) AS i"
+                )
+            )
+        await conn.execute(text("ANALYZE"))
+
+
+SCANS = ("Seq Scan", "Index Scan", "Index Only Scan", "Bitmap Index Scan")
+
+
+def _full_scans(plan: dict):
+    if plan["Node Type"] in SCANS and "Index Cond" not in plan:
+        yield f"{plan['Node Type']} on {plan['Relation Name']}"
+    for child in plan.get("Plans", ()):
+        yield from _full_scans(child)
+
+
+async def assert_index_scans(statements):
+    selects = [
+        (sql, parameters)
+        for sql, parameters in statements
+        if sql.lstrip().upper().startswith(("SELECT", "INSERT"))
+    ]
+    assert selects
+    async with engine.connect() as conn:
+        await conn.exec_driver_sql("SET enable_seqscan = off")
+        for sql, parameters in selects:
+            result = await conn.exec_driver_sql(
+                f"EXPLAIN (FORMAT JSON) {sql}", parameters
+            )
+            (plan,) = result.scalar_one()
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            assert not list(_full_scans(plan["Plan"])), f"{sql}\n{plan}"
+
+
+@pytest.mark.parametrize("path", LIST_PATHS)
+async def test_profile_list_uses_index(client, profile_id, statements, path):
+    response = await client.get(path, params={"profile_id": profile_id})
+    assert response.status_code == 200
+    await assert_index_scans(statements)
+
+
+@pytest.mark.parametrize("path", ["/api/projects", "/api/skills"])
+async def test_profile_list_page_after_cursor_uses_index(
+    client, profile_id, statements, path
+):
+    params = {"profile_id": profile_id, "cursor": encode_cursor(10)}
+    response = await client.get(path, params=params)
+    assert response.status_code == 200
+    await assert_index_scans(statements)
+
+
+async def test_profile_loads_use_indexes(profile_id, statements):
+    async with AsyncSessionLocal() as session:
+        assert await profile_service.assemble_profile(profile_id, session)
+        assert await profile_service.fetch_profile_json(profile_id, session)
+        assert await profile_service.write_profile_snapshot(profile_id, session)
+        await session.rollback()
+    await assert_index_scans(statements)
+
+
+async def test_profile_get_uses_index(client, profile_id, statements):
+    response = await client.get(f"/api/profiles/{profile_id}")
+    assert response.status_code == 200
+    await assert_index_scans(statements)
@@ -0,0 +1,89 @@
+import asyncio
+
+from sqlalchemy import select
+
+from app import models
+from app.db import AsyncSessionLocal
+from app.services import skills as skills_service
+
+
+async def _scores(profile_id):
+    async with AsyncSessionLocal() as session:
+        result = await session.execute(
+            select(models.Skill.name, models.Skill.rank_score).where(
+                models.Skill.profile_id == profile_id
+            )
+        )
+        return dict(result.all())
+
+
+async def test_ranks_follow_skill_and_project_writes(client, profile_id):
+    for name, proficiency, years in (("Python", 5, 4), ("Go", 3, 1), ("Rust", 1, 0)):
+        response = await client.post(
+            "/api/skills",
+            json={
+                "profile_id": profile_id,
+                "name": name,
+                "proficiency": proficiency,
+                "years": years,
+            },
+        )
+        assert response.status_code == 200, response.text
+    assert await _scores(profile_id) == {"Python": 14.0, "Go": 7.0, "Rust": 2.0}
+
+    response = await client.post(
+        "/api/projects",
+        json={"profile_id": profile_id, "title": "Engine", "skills": ["rust", "Go"]},
+    )
+    project_id = response.json()["id"]
+    assert await _scores(profile_id) == {"Python": 14.0, "Go": 8.5, "Rust": 3.5}
+
+    # dropping a skill from a project rescores it as well as the added one
+    response = await client.put(
+        f"/api/projects/{project_id}",
+        json={"profile_id": profile_id, "title": "Engine", "skills": ["Python"]},
+    )
+    assert response.status_code == 200, response.text
+    assert await _scores(profile_id) == {"Python": 15.5, "Go": 7.0, "Rust": 2.0}
+
+    response = await client.get("/api/skills/top", params={"profile_id": profile_id})
+    assert [skill["name"] for skill in response.json()] == ["Python", "Go", "Rust"]
+
+    await client.delete(f"/api/projects/{project_id}")
+    assert await _scores(profile_id) == {"Python": 14.0, "Go": 7.0, "Rust": 2.0}
+
+
+async def test_concurrent_skill_updates_do_not_deadlock(db, profile_id, monkeypatch):
+    first, second = await models.Skill.create_many(
+        [
+            {"profile_id": profile_id, "name": "Python", "years": 1},
+            {"profile_id": profile_id, "name": "python", "years": 1},
+        ]
+    )
+    refresh = skills_service.refresh_skill_ranks
+    both_updated = asyncio.Barrier(2)
+
+    async def refresh_after_both_updates(*args, **kwargs):
+        # each update holds its own row's lock when the rescoring starts
+        await both_updated.wait()
+        await refresh(*args, **kwargs)
+
+    monkeypatch.setattr(
+        skills_service, "refresh_skill_ranks", refresh_after_both_updates
+    )
+
+    async def update(skill_id, years):
+        async with AsyncSessionLocal() as session:
+            await skills_service.update_skill(skill_id, {"years": years}, session)
+
+    # the higher id goes first, against the id order
+    await asyncio.wait_for(
+        asyncio.gather(update(second.id, 3), update(first.id, 2)), timeout=10
+    )
+    async with AsyncSessionLocal() as session:
+        result = await session.execute(
+            select(models.Skill.id, models.Skill.rank_score).where(
+                models.Skill.profile_id == profile_id
+            )
+        )
+        assert dict(result.all()) == {first.id: 2.0, second.id: 3.0}